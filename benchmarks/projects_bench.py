@@ -0,0 +1,365 @@
+"""
+Projects 데이터 계층 성능 측정
+
+사용 예 (저장소 루트에서):
+  python benchmarks/projects_bench.py memory -n 100000
+  python benchmarks/projects_bench.py codec -n 10000 -n 100000
+  python benchmarks/projects_bench.py validate -n 100000
+  python benchmarks/projects_bench.py search -n 100000   (화면 없는 환경: QT_QPA_PLATFORM=offscreen)
+  python benchmarks/projects_bench.py filter -n 100000
+  python benchmarks/projects_bench.py table -n 50000
+  python benchmarks/projects_bench.py timeline -n 50000
+"""
+
+import argparse
+import gc
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from tools.projects.components.prj_models import DataModel, JsonCodec, Project, orjson
+from tools.projects.components.prj_schema import CompiledSchema
+
+SCHEMA_PATH = ROOT / "resources" / "data" / "projects.schema.json"
+
+OWNERS = ["김지훈", "박유진", "최가온", "정세진", "이서연", "한도윤", "오민재", "윤하은"]
+
+
+def make_synthetic(n_projects: int, n_wrappers: Optional[int] = None, seed: int = 0) -> Dict[str, Any]:
+    """n_projects 개 프로젝트를 가진 합성 projects JSON 객체 생성"""
+    rnd = random.Random(seed)
+    n_wrappers = n_wrappers if n_wrappers is not None else max(1, n_projects // 50)
+    base = date(2020, 1, 1)
+    wrappers = [{"id": f"w{i}", "name": f"랩퍼 {i}", "type": "wrapper",
+                 "status": rnd.choice(("in_progress", "completed"))} for i in range(n_wrappers)]
+    projects = []
+    for i in range(n_projects):
+        start = base + timedelta(days=rnd.randrange(0, 5 * 365))
+        end = start + timedelta(days=rnd.randrange(7, 365))
+        projects.append({
+            "id": f"p{i}",
+            "name": f"프로젝트 {i}",
+            "type": "project",
+            "status": rnd.choice(("in_progress", "completed", "completed")),
+            "wrapper_id": f"w{rnd.randrange(n_wrappers)}" if rnd.random() < 0.8 else None,
+            "owner": rnd.choice(OWNERS),
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "notes": "" if rnd.random() < 0.7 else f"메모 {i}",
+        })
+    return {"wrappers": wrappers, "projects": projects}
+
+
+# 비교 기준: __slots__ 도입 전 dataclass 표현
+@dataclass
+class _LegacyProject:
+    id: str
+    name: str
+    type: str
+    status: str
+    wrapper_id: Optional[str]
+    owner: str
+    start_date: str
+    end_date: str
+    notes: str = ""
+
+
+def _retained_bytes(text: str, cls) -> int:
+    """JSON 텍스트에서 레코드를 만든 뒤 (중간 dict 해제 후) 남는 메모리"""
+    gc.collect()
+    tracemalloc.start()
+    records = [cls(**p) for p in json.loads(text)["projects"]]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current
+
+
+def bench_memory(n: int):
+    text = json.dumps(make_synthetic(n), ensure_ascii=False)
+    legacy = _retained_bytes(text, _LegacyProject)
+    slotted = _retained_bytes(text, Project)
+    print(f"[memory] {n:,} projects")
+    print(f"  dataclass (__dict__) : {legacy / n:8.1f} B/record  ({legacy / 2**20:7.1f} MiB)")
+    print(f"  __slots__ + intern   : {slotted / n:8.1f} B/record  ({slotted / 2**20:7.1f} MiB)")
+    print(f"  절감                  : {(1 - slotted / legacy) * 100:5.1f} %")
+
+
+def _best_of(fn: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_codec(n: int):
+    """로드(디코드+레코드 생성)/저장(인코드) 처리량 비교"""
+    obj = make_synthetic(n)
+    legacy_text = json.dumps(obj, ensure_ascii=False, indent=2)
+    model = DataModel.from_json(obj)
+
+    def legacy_load():
+        data = json.loads(legacy_text)
+        return ([Project(**p) for p in data["projects"]], data["wrappers"])
+
+    loads = [("json.loads + Project(**p) (기존)", legacy_load, legacy_text)]
+    saves = [("json indent=2 (기존)",
+              lambda: json.dumps(model.to_json(), ensure_ascii=False, indent=2))]
+    codecs = [("json 스트리밍", JsonCodec(engine="json"))]
+    if orjson is not None:
+        codecs.append(("orjson", JsonCodec(engine="orjson")))
+    for label, codec in codecs:
+        text = codec.encode_model(model)
+        loads.append((label, lambda c=codec, s=text: c.decode_model(s), text))
+        saves.append((f"{label} compact", lambda c=codec: c.encode_model(model)))
+
+    print(f"[codec] {n:,} projects")
+    print("  로드")
+    for label, fn, text in loads:
+        sec = _best_of(fn)
+        print(f"    {label:<32} {sec * 1000:8.1f} ms  {n / sec:12,.0f} rec/s  ({len(text.encode('utf-8')) / 2**20:6.1f} MiB)")
+    print("  저장")
+    for label, fn in saves:
+        sec = _best_of(fn)
+        print(f"    {label:<32} {sec * 1000:8.1f} ms  {n / sec:12,.0f} rec/s")
+
+
+# 비교 기준: 값마다 스키마 dict 를 다시 해석하는 단순 검증기
+def _naive_validate(schema: Dict[str, Any], value: Any, path: str, out: List[str]):
+    types = {"object": dict, "array": list, "string": str, "null": type(None)}
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if not any(isinstance(value, types[n]) for n in names):
+            out.append(path)
+    if "const" in schema and value != schema["const"]:
+        out.append(path)
+    if "enum" in schema and value not in schema["enum"]:
+        out.append(path)
+    if "pattern" in schema and isinstance(value, str) and not re.search(schema["pattern"], value):
+        out.append(path)
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if key not in value:
+                out.append(f"{path}.{key}")
+        for key, sub in schema.get("properties", {}).items():
+            if key in value:
+                _naive_validate(sub, value[key], f"{path}.{key}", out)
+    if isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            _naive_validate(schema["items"], item, f"{path}[{i}]", out)
+
+
+def bench_validate(n: int, schema_path: Path = SCHEMA_PATH):
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    obj = make_synthetic(n)
+    obj["projects"][0]["start_date"] = "2025/01/01"  # 위반 1건 포함
+
+    t0 = time.perf_counter()
+    compiled = CompiledSchema(schema)
+    compile_sec = time.perf_counter() - t0
+
+    naive_out: List[str] = []
+    naive = _best_of(lambda: (naive_out.clear(), _naive_validate(schema, obj, "", naive_out)), repeat=1)
+    fast = _best_of(lambda: compiled.validate(obj))
+    print(f"[validate] {n:,} projects (위반 {len(naive_out)}건 / {len(compiled.validate(obj))}건)")
+    print(f"  스키마 컴파일 (1회)   : {compile_sec * 1000:8.2f} ms")
+    print(f"  단순 해석 검증        : {naive * 1000:8.1f} ms")
+    print(f"  컴파일된 검증         : {fast * 1000:8.1f} ms  ({naive / fast:4.1f}x)")
+
+
+def bench_search(n: int, queries=("김지", "프로젝트 12", "메모 99", "p4242", "박", "없는검색어")):
+    """색인 생성 / 검색 / 트리 필터 적용(검색어 입력 → 트리 표시) 시간"""
+    from PyQt5.QtWidgets import QApplication
+    from tools.projects.components.prj_repository import ProjectRepository
+    from tools.projects.components.prj_search import SearchIndex
+    from tools.projects.components.prj_treemodel import ProjectsTreeModel, TreeFilter
+    from tools.projects.components.prj_treeview import ProjectsTreeViewWidget
+
+    app = QApplication.instance() or QApplication([])
+    repo = ProjectRepository(DataModel.from_json(make_synthetic(n)))
+    t0 = time.perf_counter()
+    index = SearchIndex.build(repo.wrappers(), repo.projects())
+    build_sec = time.perf_counter() - t0
+
+    model = ProjectsTreeModel(repo)
+    panel = ProjectsTreeViewWidget()
+    panel.setModel(model)
+    print(f"[search] {n:,} projects, 색인 생성 {build_sec * 1000:.0f} ms (작업 스레드)")
+    for q in queries:
+        t0 = time.perf_counter()
+        matches = index.search(q)
+        t1 = time.perf_counter()
+        model.set_filter(TreeFilter(repo, matches))
+        panel.expandDefault(include_collapsed=True)
+        app.processEvents()
+        t2 = time.perf_counter()
+        print(f"  {q!r:<14} {len(matches):>7,}건  검색 {(t1 - t0) * 1000:6.1f} ms  "
+              f"트리 반영 {(t2 - t1) * 1000:6.1f} ms  합계 {(t2 - t0) * 1000:6.1f} ms")
+    model.set_filter(None)
+
+
+def bench_filter(n: int):
+    """조건 필터(담당자/상태/wrapper/기간) 전환 → 트리 표시 시간 (모델/repository 재구성 없음)"""
+    from PyQt5.QtWidgets import QApplication
+    from tools.projects.components.prj_filter import NO_WRAPPER, FilterCriteria, match_projects
+    from tools.projects.components.prj_repository import ProjectRepository
+    from tools.projects.components.prj_treemodel import ProjectsTreeModel, TreeFilter
+    from tools.projects.components.prj_treeview import ProjectsTreeViewWidget
+
+    app = QApplication.instance() or QApplication([])
+    repo = ProjectRepository(DataModel.from_json(make_synthetic(n)))
+    model = ProjectsTreeModel(repo)
+    panel = ProjectsTreeViewWidget()
+    panel.setModel(model)
+    day = date(2022, 6, 1).toordinal()
+    cases = [
+        ("담당자", FilterCriteria(owners=frozenset([OWNERS[0]]))),
+        ("담당자+진행 중", FilterCriteria(owners=frozenset([OWNERS[0]]), statuses=frozenset(["in_progress"]))),
+        ("wrapper w1", FilterCriteria(wrapper_ids=frozenset(["w1"]))),
+        ("wrapper 없음", FilterCriteria(wrapper_ids=frozenset([NO_WRAPPER]))),
+        ("기간 1개월", FilterCriteria(date_from=day, date_to=day + 30)),
+        ("담당자+기간", FilterCriteria(owners=frozenset([OWNERS[1]]), date_from=day, date_to=day + 30)),
+    ]
+    print(f"[filter] {n:,} projects")
+    for label, criteria in cases:
+        t0 = time.perf_counter()
+        scope = match_projects(repo, criteria)
+        t1 = time.perf_counter()
+        model.set_filter(TreeFilter(repo, scope=scope))
+        panel.expandDefault(include_collapsed=True)
+        app.processEvents()
+        t2 = time.perf_counter()
+        print(f"  {label:<14} {len(scope):>7,}건  조건 {(t1 - t0) * 1000:6.1f} ms  "
+              f"트리 반영 {(t2 - t1) * 1000:6.1f} ms  합계 {(t2 - t0) * 1000:6.1f} ms")
+    model.set_filter(None)
+
+
+def bench_table(n: int):
+    """하위 목록 테이블 표시 시간: 셀마다 QTableWidgetItem 생성 vs RecordTableModel"""
+    from PyQt5.QtWidgets import QApplication, QTableView, QTableWidget, QTableWidgetItem
+    from tools.projects.components.prj_repository import ProjectRepository
+    from tools.projects.components.prj_tablemodel import RecordTableModel, CHILDREN_COLUMNS, setup_table_view, fit_columns
+
+    app = QApplication.instance() or QApplication([])
+    data = make_synthetic(n, n_wrappers=1)
+    for p in data["projects"]:
+        p["wrapper_id"], p["status"] = None, "in_progress"
+    repo = ProjectRepository(DataModel.from_json(data))
+    print(f"[table] 상태 루트 하위 {n:,}건")
+
+    def legacy():
+        items = repo.wrappers_by_status("in_progress") + repo.loose_projects("in_progress")
+        t = QTableWidget()
+        t.setRowCount(len(items))
+        t.setColumnCount(3)
+        for r, rec in enumerate(items):
+            for c, (_h, get) in enumerate(CHILDREN_COLUMNS):
+                t.setItem(r, c, QTableWidgetItem(str(get(rec))))
+        t.resizeColumnsToContents()
+        t.show()
+        app.processEvents()
+        t.deleteLater()
+
+    view = QTableView()
+    model = RecordTableModel(CHILDREN_COLUMNS)
+    setup_table_view(view, model)
+    view.show()
+
+    def virtual():
+        model.set_records(repo.wrappers_by_status("in_progress") + repo.loose_projects("in_progress"))
+        fit_columns(view)
+        app.processEvents()
+
+    for label, fn in (("QTableWidget", legacy), ("RecordTableModel", virtual)):
+        t0 = time.perf_counter()
+        fn()
+        print(f"  {label:<18} {(time.perf_counter() - t0) * 1000:8.1f} ms")
+
+
+def bench_timeline(n: int, frames: int = 60):
+    """타임라인: 막대 배치/증분 갱신 시간, 확대 단계별 스크롤 1프레임(동기 repaint) 시간"""
+    from PyQt5.QtWidgets import QApplication
+    from tools.projects.components.prj_repository import ProjectRepository
+    from tools.projects.components.prj_timeline import ProjectsTimelineWidget
+
+    app = QApplication.instance() or QApplication([])
+    repo = ProjectRepository(DataModel.from_json(make_synthetic(n)))
+    widget = ProjectsTimelineWidget()
+    widget.resize(1200, 800)
+    t0 = time.perf_counter()
+    widget.setRepository(repo)
+    print(f"[timeline] 막대 {widget.scene.bar_count():,}개  최초 배치 {(time.perf_counter() - t0) * 1000:7.1f} ms")
+    widget.show()
+    app.processEvents()
+
+    t0 = time.perf_counter()
+    widget.scene.relayout()
+    print(f"  재배치(행 변경)      {(time.perf_counter() - t0) * 1000:7.1f} ms")
+    p = repo.projects()[n // 2]
+    t0 = time.perf_counter()
+    repo.update_project(p.id, end_date=(date.fromordinal(p.end_ordinal) + timedelta(days=30)).isoformat())
+    print(f"  날짜 수정(막대 1개)  {(time.perf_counter() - t0) * 1000:7.1f} ms")
+
+    view = widget.ui.graphicsView
+    bar = view.verticalScrollBar()
+    for label, px_per_day in (("월 단위 (8px/일)", 8.0), ("연 단위 (0.5px/일)", 0.5), ("전체 기간", None)):
+        if px_per_day is None:
+            widget.fitAll()
+        else:
+            widget._set_px_per_day(px_per_day)
+        widget.showToday()
+        bar.setValue(0)
+        app.processEvents()
+        t0 = time.perf_counter()
+        for i in range(frames):
+            bar.setValue(bar.value() + 40)
+            view.viewport().repaint()
+        scroll_ms = (time.perf_counter() - t0) * 1000 / frames
+        t0 = time.perf_counter()
+        for i in range(frames):
+            widget.zoom(1.1 if i % 2 else 1 / 1.1)
+            view.viewport().repaint()
+        zoom_ms = (time.perf_counter() - t0) * 1000 / frames
+        print(f"  {label:<18} 스크롤 {scroll_ms:6.2f} ms/프레임  확대/축소 {zoom_ms:6.2f} ms/프레임")
+    widget.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Projects 데이터 계층 성능 측정")
+    ap.add_argument("bench", choices=["memory", "codec", "validate", "search", "filter", "table",
+                                       "timeline"])
+    ap.add_argument("-n", type=int, action="append", help="프로젝트 수 (반복 지정 가능)")
+    args = ap.parse_args(argv)
+    for n in args.n or [100_000]:
+        if args.bench == "memory":
+            bench_memory(n)
+        elif args.bench == "codec":
+            bench_codec(n)
+        elif args.bench == "validate":
+            bench_validate(n)
+        elif args.bench == "search":
+            bench_search(n)
+        elif args.bench == "filter":
+            bench_filter(n)
+        elif args.bench == "table":
+            bench_table(n)
+        elif args.bench == "timeline":
+            bench_timeline(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,14 @@
 import sys
 import os
 import subprocess
+import multiprocessing
 import locale
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt, QFile, QTextStream
-from PyQt5.QtGui import QFontDatabase, QFont
-import qdarkstyle
+
+# PyQt5/qdarkstyle 는 함수 안에서 import: 엑셀 병렬 읽기 작업 프로세스(spawn)는 이 파일을 다시 import 하므로
+# 최상위에서 불러오면 작업 프로세스마다 Qt 를 불러와 시작이 느려짐
 
 def apply_qdark_theme(app):
+    import qdarkstyle
     app.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
 
 def apply_gtronick_theme(app):
@@ -41,6 +42,7 @@ def setup_custom_theme(app):
 
 
 def setup_custom_font(app):
+    from PyQt5.QtGui import QFontDatabase, QFont
     try:
         # 폰트 파일 경로
         font_path = os.path.join(os.environ.get("UKSDT_RESOURCE_PATH",""), "fonts", "LGEITextTTF-Regular.ttf")
@@ -78,6 +80,8 @@ def setup_custom_font(app):
 
 def main():
     """UKSDT 통합 툴 앱 실행"""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
    
     # 고해상도 디스플레이 지원 (QApplication 생성 전에 설정)
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
@@ -109,4 +113,6 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
+    # 실행 파일(PyInstaller)로 배포 시 엑셀 병렬 읽기 작업 프로세스 진입점
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
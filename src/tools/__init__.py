@@ -1,6 +1,13 @@
 # Tools package
 # 각 툴별로 디렉토리 구조화되어 관리
+#
+# 도구 위젯은 처음 사용할 때 import (PEP 562) → tools.projects CLI 가 Qt/pandas 없이 동작
 
-from .control_dr_reviewer import ControlDRReviewerWidget
+__all__ = ['ControlDRReviewerWidget']
 
-__all__ = ['ControlDRReviewerWidget']
\ No newline at end of file
+
+def __getattr__(name):
+    if name == 'ControlDRReviewerWidget':
+        from .control_dr_reviewer import ControlDRReviewerWidget
+        return ControlDRReviewerWidget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,13 @@
 # Control DR Reviewer Tool
 # 프로젝트 리뷰 및 정합성 검증 도구
+#
+# 위젯은 처음 사용할 때 import (PEP 562) → 엑셀 읽기 작업 프로세스(spawn)가 PyQt5 를 불러오지 않음
 
-from .control_dr_reviewer import ControlDRReviewerWidget
+__all__ = ['ControlDRReviewerWidget']
 
-__all__ = ['ControlDRReviewerWidget']
\ No newline at end of file
+
+def __getattr__(name):
+    if name == 'ControlDRReviewerWidget':
+        from .control_dr_reviewer import ControlDRReviewerWidget
+        return ControlDRReviewerWidget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
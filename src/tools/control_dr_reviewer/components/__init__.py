@@ -1,6 +1,25 @@
 # Control DR Reviewer Tool Components
 # 체크 아이템 및 기타 컴포넌트들
+#
+# Qt 위젯/작업은 처음 사용할 때 import (PEP 562) → 엑셀 읽기 작업 프로세스(spawn)는 pandas 만 불러옴
 
-from .check_item import CheckItemWidget
+from .consistency import check_consistency
+from .rules import RuleError, evaluate_rules, load_checklist, load_rules
+from .verification import STAGES, VerificationCancelled, run_verification
+from .workbook_cache import WorkbookCache, default_cache
+from .workbook_loader import SheetTask, load_sheets, sheet_tasks
 
-__all__ = ['CheckItemWidget']
\ No newline at end of file
+_LAZY = {
+    'CheckItemWidget': '.check_item',
+    'VerificationJob': '.verification_job',
+}
+
+__all__ = ['CheckItemWidget', 'check_consistency', 'RuleError', 'evaluate_rules', 'load_checklist', 'load_rules', 'STAGES', 'VerificationCancelled', 'run_verification', 'VerificationJob', 'WorkbookCache', 'default_cache', 'SheetTask', 'load_sheets', 'sheet_tasks']
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module, __name__), name)
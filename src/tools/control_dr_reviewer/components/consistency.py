@@ -0,0 +1,224 @@
+"""
+BOM List ↔ SW인정시험 결과서 정합성 엔진 (Qt 비의존)
+
+- 품번/SW 버전 열은 머리글 이름으로 찾음 (PART_COLUMNS / VERSION_COLUMNS, 공백·대소문자·기호 무시)
+- 품번/버전 정규화 후 pandas merge(outer, indicator)로 한 번에 비교 → 행 단위 Python 반복 없음
+    · 누락: BOM 에만 있는 품번 / 추가: SW인정시험 결과서에만 있는 품번
+    · 버전 불일치: 양쪽에 있지만 같은 (품번, 버전) 조합이 하나도 없는 품번
+    · 중복: 한 파일 안에서 같은 품번이 여러 행 / 품번 없음: 다른 값은 있는데 품번이 빈 행
+- 행 번호는 엑셀 행 번호 (머리글 = 1행)
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+PART_COLUMNS = ("품번", "부품번호", "자재번호", "partno", "partnumber", "pn", "itemno", "itemnumber", "material")
+VERSION_COLUMNS = ("swversion", "swver", "sw버전", "소프트웨어버전", "버전", "version", "ver")
+
+ISSUE_MISSING = "누락"
+ISSUE_EXTRA = "추가"
+ISSUE_VERSION = "버전 불일치"
+ISSUE_DUPLICATE_BOM = "중복(BOM)"
+ISSUE_DUPLICATE_SW = "중복(SW)"
+ISSUE_BLANK_BOM = "품번 없음(BOM)"
+ISSUE_BLANK_SW = "품번 없음(SW)"
+
+ISSUE_COLUMNS = ["구분", "품번", "BOM 행", "SW인정시험 행", "BOM 버전", "SW 버전"]
+
+_HEADER_JUNK = re.compile(r"[\s_\-/.()\[\]]+")
+_DASHES = "[‐-―−－]"
+# 전후방 탐색 없이 작성 (pyarrow 문자열 열에서 RE2 로 벡터 처리되도록)
+_VERSION_PREFIX = r"^(?:S/?W)?[_\-]?(?:VERSION|VER|REV|V)?[._\-:]?([0-9])"
+_MAJOR_ZEROS = r"^0+([0-9])"
+_TRAILING_ZEROS = r"([0-9])(?:\.0+)+$"
+FIRST_DATA_ROW = 2   # DataFrame 0번 행 = 엑셀 2행
+
+
+# ---------- 열 찾기 ----------
+def _header_key(name) -> str:
+    return _HEADER_JUNK.sub("", str(name)).lower()
+
+
+def find_column(df: pd.DataFrame, candidates) -> Optional[str]:
+    """candidates 순서대로 머리글이 같은 첫 열 이름, 없으면 None"""
+    keys = {}
+    for column in df.columns:
+        keys.setdefault(_header_key(column), column)
+    for candidate in candidates:
+        column = keys.get(_header_key(candidate))
+        if column is not None:
+            return column
+    return None
+
+
+# ---------- 정규화 ----------
+def cell_text(s: pd.Series) -> pd.Series:
+    """셀 값 → 문자열 (숫자로 읽힌 12345.0 은 "12345", 빈 셀은 <NA>)"""
+    text = s.astype("string")
+    if isinstance(s.dtype, pd.StringDtype) or pd.api.types.is_bool_dtype(s):
+        return text
+    if pd.api.types.is_numeric_dtype(s):
+        numeric = s
+    else:   # 문자열 "007" 은 그대로 두고 숫자 셀만
+        numeric = pd.to_numeric(s.where(~s.map(lambda v: isinstance(v, str))), errors="coerce")
+    integral = numeric.notna() & (numeric % 1 == 0) & (numeric.abs() < 1e15)
+    if integral.any():
+        text = text.mask(integral, numeric[integral].astype("int64").astype("string"))
+    return text
+
+
+def normalize_part(s: pd.Series) -> pd.Series:
+    """대소문자/공백/대시 종류를 통일한 품번 (빈 값은 <NA>)"""
+    text = cell_text(s).str.upper().str.replace(r"\s+", "", regex=True).str.replace(_DASHES, "-", regex=True)
+    return text.mask(text == "")
+
+
+def normalize_version(s: pd.Series) -> pd.Series:
+    """"V01.02", "Ver 1.02", "SW 1.02" → "1.02", "1.0" → "1" (빈 값은 "")
+
+    접두어와 주 버전의 0 채움, 끝의 0 인 부 버전만 제거. 부 버전 자릿수는 유지 ("1.02" ≠ "1.2", "1.20" ≠ "1.2")
+    """
+    text = cell_text(s).str.upper().str.replace(r"\s+", "", regex=True)
+    text = text.str.replace(_VERSION_PREFIX, r"\1", regex=True).str.replace(_MAJOR_ZEROS, r"\1", regex=True)
+    text = text.str.replace(_TRAILING_ZEROS, r"\1", regex=True)
+    return text.fillna("")
+
+
+# ---------- 검증 ----------
+def _keyed(df: pd.DataFrame, part_col: str, version_col: Optional[str]) -> pd.DataFrame:
+    """정규화한 품번/버전 + 엑셀 행 번호. 키 열은 object (Arrow 문자열 열의 isin 은 값마다 Python 변환이라 느림)"""
+    part = normalize_part(df[part_col]).to_numpy(dtype=object, na_value=None)
+    version = normalize_version(df[version_col]).to_numpy(dtype=object) if version_col else ""
+    return pd.DataFrame({
+        "part": pd.Series(part, dtype=object),
+        "version": pd.Series(version, dtype=object) if version_col else "",
+        "row": np.arange(len(df)) + FIRST_DATA_ROW,
+        "filled": df.notna().any(axis=1).to_numpy(),
+    })
+
+
+def _join_by(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """키별 값 목록 "a, b" (index = 키, 빈 값/중복 값 제외, 나온 순서 유지)"""
+    pairs = pd.DataFrame({"key": keys.to_numpy(), "value": values.to_numpy()})
+    pairs = pairs[pairs["value"] != ""].drop_duplicates()
+    single = ~pairs["key"].duplicated(keep=False)
+    joined = pd.Series(pairs.loc[single, "value"].to_numpy(), index=pairs.loc[single, "key"].to_numpy(), dtype=object)
+    multi = pairs[~single]
+    if len(multi):   # 값이 여러 개인 키만 (중복 품번 등) 묶음
+        groups: Dict[str, List[str]] = {}
+        for key, value in zip(multi["key"].tolist(), multi["value"].tolist()):
+            groups.setdefault(key, []).append(value)
+        joined = pd.concat([joined, pd.Series({k: ", ".join(v) for k, v in groups.items()}, dtype=object)])
+    return joined
+
+
+def _per_part(keyed: pd.DataFrame, parts: pd.Series) -> pd.DataFrame:
+    """parts 에 속한 품번별 행 번호/버전 목록 (index = 품번)"""
+    subset = keyed[keyed["part"].isin(parts)]
+    return pd.DataFrame({"rows": _join_by(subset["part"], subset["row"].astype(str)),
+                         "versions": _join_by(subset["part"], subset["version"])})
+
+
+def _issues(kind: str, parts: pd.Series, bom: Optional[pd.DataFrame], sw: Optional[pd.DataFrame]) -> pd.DataFrame:
+    frame = pd.DataFrame({"구분": kind, "품번": parts.to_numpy()}, columns=ISSUE_COLUMNS)
+    for side, rows_col, versions_col in ((bom, "BOM 행", "BOM 버전"), (sw, "SW인정시험 행", "SW 버전")):
+        if side is not None:
+            grouped = _per_part(side, parts)
+            frame[rows_col] = frame["품번"].map(grouped["rows"])
+            frame[versions_col] = frame["품번"].map(grouped["versions"])
+    return frame
+
+
+def _blank_rows(kind: str, keyed: pd.DataFrame, rows_col: str) -> pd.DataFrame:
+    rows = keyed.loc[keyed["part"].isna() & keyed["filled"], "row"]
+    return pd.DataFrame({"구분": kind, rows_col: rows.astype(str).to_numpy()}, columns=ISSUE_COLUMNS)
+
+
+def _unavailable(reason: str, columns: Dict[str, Dict[str, Optional[str]]]) -> Dict[str, Any]:
+    return {
+        "bom_sw_match": "확인 불가",
+        "data_integrity": "확인 불가",
+        "matched_items": 0,
+        "missing_items": 0,
+        "extra_items": 0,
+        "version_mismatches": 0,
+        "duplicate_items": 0,
+        "blank_part_rows": 0,
+        "version_checked": False,
+        "key_columns": columns,
+        "issues": pd.DataFrame(columns=ISSUE_COLUMNS),
+        "error": reason,
+    }
+
+
+def check_consistency(bom_df: pd.DataFrame, sw_test_df: pd.DataFrame) -> Dict[str, Any]:
+    """results["consistency_check"] dict
+
+    issues: 발견된 문제 DataFrame (ISSUE_COLUMNS, 구분 순서대로)
+    품번 열을 찾지 못하면 비교 없이 확인 불가 결과 (error 에 사유, 빈 issues)
+    """
+    columns = {}
+    missing_columns = []
+    for label, name, df in (("bom", "BOM List", bom_df), ("sw_test", "SW인정시험 결과서", sw_test_df)):
+        columns[label] = {"part": find_column(df, PART_COLUMNS), "version": find_column(df, VERSION_COLUMNS)}
+        if columns[label]["part"] is None:
+            missing_columns.append(f"{name}에서 품번 열을 찾을 수 없습니다. (열: {', '.join(map(str, df.columns))})")
+    if missing_columns:
+        return _unavailable(" / ".join(missing_columns), columns)
+    version_checked = columns["bom"]["version"] is not None and columns["sw_test"]["version"] is not None
+
+    bom = _keyed(bom_df, columns["bom"]["part"], columns["bom"]["version"] if version_checked else None)
+    sw = _keyed(sw_test_df, columns["sw_test"]["part"], columns["sw_test"]["version"] if version_checked else None)
+    bom_valid = bom.dropna(subset=["part"])
+    sw_valid = sw.dropna(subset=["part"])
+
+    # 품번 기준 outer merge → left_only = 누락, right_only = 추가, both = 버전 비교 대상
+    merged = pd.merge(bom_valid[["part"]].drop_duplicates(), sw_valid[["part"]].drop_duplicates(),
+                      on="part", how="outer", indicator=True, sort=False)
+    missing = merged.loc[merged["_merge"] == "left_only", "part"]
+    extra = merged.loc[merged["_merge"] == "right_only", "part"]
+    common = merged.loc[merged["_merge"] == "both", "part"]
+
+    mismatched = common.iloc[:0]
+    if version_checked:
+        pairs = pd.merge(bom_valid[["part", "version"]].drop_duplicates(),
+                         sw_valid[["part", "version"]].drop_duplicates(),
+                         on=["part", "version"], how="inner")
+        mismatched = common[~common.isin(pairs["part"])]
+
+    bom_dup = bom_valid.loc[bom_valid["part"].duplicated(), "part"].drop_duplicates()
+    sw_dup = sw_valid.loc[sw_valid["part"].duplicated(), "part"].drop_duplicates()
+
+    frames: List[pd.DataFrame] = [
+        _issues(ISSUE_MISSING, missing, bom, None),
+        _issues(ISSUE_EXTRA, extra, None, sw),
+        _issues(ISSUE_VERSION, mismatched, bom, sw),
+        _issues(ISSUE_DUPLICATE_BOM, bom_dup, bom, None),
+        _issues(ISSUE_DUPLICATE_SW, sw_dup, None, sw),
+        _blank_rows(ISSUE_BLANK_BOM, bom, "BOM 행"),
+        _blank_rows(ISSUE_BLANK_SW, sw, "SW인정시험 행"),
+    ]
+    issues = pd.concat([f for f in frames if len(f)] or frames[:1], ignore_index=True)
+    counts = issues["구분"].value_counts()
+
+    def count(*kinds) -> int:
+        return int(sum(counts.get(k, 0) for k in kinds))
+
+    match_ok = count(ISSUE_MISSING, ISSUE_EXTRA, ISSUE_VERSION) == 0
+    integrity_ok = count(ISSUE_DUPLICATE_BOM, ISSUE_DUPLICATE_SW, ISSUE_BLANK_BOM, ISSUE_BLANK_SW) == 0
+    return {
+        "bom_sw_match": "양호" if match_ok else "불일치",
+        "data_integrity": "정상" if integrity_ok else "확인 필요",
+        "matched_items": len(common) - len(mismatched),
+        "missing_items": count(ISSUE_MISSING),
+        "extra_items": count(ISSUE_EXTRA),
+        "version_mismatches": count(ISSUE_VERSION),
+        "duplicate_items": count(ISSUE_DUPLICATE_BOM, ISSUE_DUPLICATE_SW),
+        "blank_part_rows": count(ISSUE_BLANK_BOM, ISSUE_BLANK_SW),
+        "version_checked": version_checked,
+        "key_columns": columns,
+        "issues": issues,
+    }
@@ -0,0 +1,349 @@
+"""
+Control DR 규칙 파일($UKSDT_RESOURCE_PATH/data/control_dr_rules.json) 컴파일/평가 (Qt 비의존)
+
+규칙 파일
+  - checklist: 점검 항목(수동 체크리스트) 문구 목록
+  - rules: 자동 검사 규칙 목록. 공통 키 id, name, sheet("bom" | "sw_test"), type,
+    severity("error" | "warning", 기본 error), optional(열이 없으면 건너뜀), enabled(기본 true)
+      · columns   : columns 의 열이 모두 있어야 함
+      · not_blank : column 값이 비어 있지 않아야 함
+      · range     : column 이 숫자이고 min ≤ 값 ≤ max (빈 칸 허용)
+      · pattern   : column 전체가 정규식 pattern 과 일치 (빈 칸 허용)
+      · values    : column 이 values 중 하나 (대소문자 무시, 빈 칸 허용)
+      · reference : column 값이 ref_sheet 의 ref_column 에 있어야 함 (normalize: "part" | "version" | "text")
+  - 열 지정: 머리글 문자열, 후보 목록(["Qty", "수량"]) 또는 "$part" / "$version" (consistency 의 품번/버전 후보)
+
+규칙 파일은 compile_rules() 로 한 번만 검사 함수(열 단위 pandas/NumPy 판정)로 컴파일하고,
+load_rules() 는 파일이 바뀌지 않았으면 컴파일된 규칙을 그대로 재사용합니다.
+평가는 행 반복 없이 열 전체에 대한 위반 마스크로 계산하며 규칙마다 소요 시간을 기록합니다.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .consistency import (FIRST_DATA_ROW, PART_COLUMNS, VERSION_COLUMNS, cell_text, find_column,
+                          normalize_part, normalize_version)
+
+RULES_PATH = Path(os.path.join(os.environ.get("UKSDT_RESOURCE_PATH",""), "data", "control_dr_rules.json"))
+RULES_VERSION = 1
+
+SHEETS = {"bom": "BOM List", "sw_test": "SW인정시험 결과서"}
+SEVERITIES = ("error", "warning")
+MAX_ROW_REFS = 20   # 규칙 결과에 표시할 위반 행 번호 수
+
+DEFAULT_CHECKLIST = [
+    "요구사항 추적성 확인",
+    "설계 문서 완성도",
+    "코드 품질 검증",
+    "테스트 케이스 완성도",
+    "보안 검증 완료"
+]
+
+RULE_COLUMNS = ["규칙", "이름", "대상", "심각도", "결과", "위반 행 수", "위반 행", "소요(ms)"]
+
+_COLUMN_ALIASES = {"$part": PART_COLUMNS, "$version": VERSION_COLUMNS}
+
+
+def _normalize_text(s: pd.Series) -> pd.Series:
+    text = cell_text(s).str.strip().str.upper()
+    return text.mask(text == "")
+
+
+_NORMALIZERS = {"part": normalize_part, "version": normalize_version, "text": _normalize_text}
+
+_cache: Dict[Path, Tuple[int, "RuleSet"]] = {}
+_cache_lock = threading.Lock()
+
+
+class RuleError(ValueError):
+    """규칙 파일 형식 오류 (규칙 id 포함)"""
+
+
+class _MissingColumn(Exception):
+    pass
+
+
+# ---------- 평가 문맥 ----------
+class _Frames:
+    """평가 1회 동안 시트별 열 찾기/문자열 변환/빈 행 마스크를 한 번만 계산"""
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]):
+        self.frames = frames
+        self._memo: Dict[tuple, Any] = {}
+
+    def _cached(self, key: tuple, compute: Callable[[], Any]):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def df(self, sheet: str) -> pd.DataFrame:
+        if sheet not in self.frames:
+            raise _MissingColumn(f"{SHEETS.get(sheet, sheet)} 없음")
+        return self.frames[sheet]
+
+    def column(self, sheet: str, candidates: Tuple[str, ...]) -> str:
+        name = find_column(self.df(sheet), candidates)
+        if name is None:
+            raise _MissingColumn(f"{SHEETS.get(sheet, sheet)}에 '{candidates[0]}' 열 없음")
+        return name
+
+    def text(self, sheet: str, column: str) -> pd.Series:
+        """공백 제거한 문자열 (빈 칸은 <NA>)"""
+        def compute():
+            text = cell_text(self.df(sheet)[column]).str.strip()
+            return text.mask(text == "")
+        return self._cached(("text", sheet, column), compute)
+
+    def normalized(self, sheet: str, column: str, how: str) -> pd.Series:
+        """isin 비교용 object 열 (Arrow 문자열 열의 isin 은 값마다 Python 변환이라 느림)"""
+        def compute():
+            values = _NORMALIZERS[how](self.df(sheet)[column])
+            return pd.Series(values.to_numpy(dtype=object, na_value=None), dtype=object)
+        return self._cached(("norm", sheet, column, how), compute)
+
+    def filled(self, sheet: str) -> np.ndarray:
+        """값이 하나라도 있는 행"""
+        return self._cached(("filled", sheet), lambda: self.df(sheet).notna().any(axis=1).to_numpy())
+
+
+# (문맥) → 위반 행 마스크 (None 이면 행 단위가 아닌 규칙, 통과)
+Predicate = Callable[[_Frames], Optional[np.ndarray]]
+
+
+@dataclass
+class CompiledRule:
+    id: str
+    name: str
+    sheet: str
+    kind: str
+    severity: str
+    optional: bool
+    predicate: Predicate = field(repr=False)
+
+
+@dataclass
+class RuleSet:
+    checklist: List[str]
+    rules: List[CompiledRule]
+    path: Optional[Path] = None
+
+
+# ---------- 컴파일 ----------
+def _candidates(spec, rule_id: str) -> Tuple[str, ...]:
+    if isinstance(spec, str):
+        return _COLUMN_ALIASES.get(spec, (spec,))
+    if isinstance(spec, list) and spec and all(isinstance(s, str) for s in spec):
+        return tuple(spec)
+    raise RuleError(f"규칙 '{rule_id}': 열 지정은 문자열 또는 문자열 목록이어야 합니다. ({spec!r})")
+
+
+def _require(rule: Dict[str, Any], key: str):
+    if key not in rule:
+        raise RuleError(f"규칙 '{rule.get('id', '?')}': '{key}' 항목이 필요합니다.")
+    return rule[key]
+
+
+def _sheet(rule: Dict[str, Any], key: str = "sheet") -> str:
+    sheet = _require(rule, key)
+    if sheet not in SHEETS:
+        raise RuleError(f"규칙 '{rule['id']}': {key} 는 {', '.join(SHEETS)} 중 하나여야 합니다. ({sheet!r})")
+    return sheet
+
+
+def _compile_columns(rule, sheet) -> Predicate:
+    columns = [_candidates(c, rule["id"]) for c in _require(rule, "columns")]
+
+    def pred(ctx: _Frames):
+        for candidates in columns:
+            ctx.column(sheet, candidates)
+        return None
+    return pred
+
+
+def _compile_not_blank(rule, sheet) -> Predicate:
+    candidates = _candidates(_require(rule, "column"), rule["id"])
+
+    def pred(ctx: _Frames):
+        text = ctx.text(sheet, ctx.column(sheet, candidates))
+        return text.isna().to_numpy() & ctx.filled(sheet)
+    return pred
+
+
+def _compile_range(rule, sheet) -> Predicate:
+    candidates = _candidates(_require(rule, "column"), rule["id"])
+    try:
+        low = float(rule["min"]) if "min" in rule else -np.inf
+        high = float(rule["max"]) if "max" in rule else np.inf
+    except (TypeError, ValueError):
+        raise RuleError(f"규칙 '{rule['id']}': min/max 는 숫자여야 합니다.")
+
+    def pred(ctx: _Frames):
+        column = ctx.column(sheet, candidates)
+        values = pd.to_numeric(ctx.df(sheet)[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        not_number = np.isnan(values) & ctx.text(sheet, column).notna().to_numpy()
+        with np.errstate(invalid="ignore"):
+            return not_number | (values < low) | (values > high)
+    return pred
+
+
+def _compile_pattern(rule, sheet) -> Predicate:
+    candidates = _candidates(_require(rule, "column"), rule["id"])
+    pattern = _require(rule, "pattern")
+    try:
+        re.compile(pattern)
+    except (re.error, TypeError) as e:
+        raise RuleError(f"규칙 '{rule['id']}': 정규식 오류 - {e}")
+
+    def pred(ctx: _Frames):
+        text = ctx.text(sheet, ctx.column(sheet, candidates))
+        return (text.notna() & ~text.str.fullmatch(pattern).fillna(True).astype(bool)).to_numpy()
+    return pred
+
+
+def _compile_values(rule, sheet) -> Predicate:
+    candidates = _candidates(_require(rule, "column"), rule["id"])
+    allowed = pd.Series([str(v).strip().upper() for v in _require(rule, "values")], dtype=object)
+
+    def pred(ctx: _Frames):
+        values = ctx.normalized(sheet, ctx.column(sheet, candidates), "text")
+        return (values.notna() & ~values.isin(allowed)).to_numpy()
+    return pred
+
+
+def _compile_reference(rule, sheet) -> Predicate:
+    candidates = _candidates(_require(rule, "column"), rule["id"])
+    ref_sheet = _sheet(rule, "ref_sheet")
+    ref_candidates = _candidates(rule.get("ref_column", _require(rule, "column")), rule["id"])
+    how = rule.get("normalize", "text")
+    if how not in _NORMALIZERS:
+        raise RuleError(f"규칙 '{rule['id']}': normalize 는 {', '.join(_NORMALIZERS)} 중 하나여야 합니다.")
+
+    def pred(ctx: _Frames):
+        values = ctx.normalized(sheet, ctx.column(sheet, candidates), how)
+        ref = ctx.normalized(ref_sheet, ctx.column(ref_sheet, ref_candidates), how)
+        valid = values.notna() & (values != "")
+        return (valid & ~values.isin(ref.dropna().unique())).to_numpy()
+    return pred
+
+
+_COMPILERS = {
+    "columns": _compile_columns,
+    "not_blank": _compile_not_blank,
+    "range": _compile_range,
+    "pattern": _compile_pattern,
+    "values": _compile_values,
+    "reference": _compile_reference,
+}
+
+
+def compile_rules(data: Dict[str, Any], path: Optional[Path] = None) -> RuleSet:
+    """규칙 파일 dict → RuleSet. 형식 오류는 RuleError"""
+    if data.get("version", RULES_VERSION) != RULES_VERSION:
+        raise RuleError(f"지원하지 않는 규칙 파일 버전입니다: {data.get('version')}")
+    checklist = data.get("checklist", DEFAULT_CHECKLIST)
+    if not isinstance(checklist, list) or not all(isinstance(t, str) for t in checklist):
+        raise RuleError("checklist 는 문자열 목록이어야 합니다.")
+
+    rules: List[CompiledRule] = []
+    seen = set()
+    for index, rule in enumerate(data.get("rules", [])):
+        if not isinstance(rule, dict):
+            raise RuleError(f"rules[{index}] 는 객체여야 합니다.")
+        rule = {**rule, "id": rule.get("id") or f"rules[{index}]"}
+        rule_id = rule["id"]
+        if rule_id in seen:
+            raise RuleError(f"규칙 id 가 중복되었습니다: {rule_id}")
+        seen.add(rule_id)
+        if not rule.get("enabled", True):
+            continue
+        kind = _require(rule, "type")
+        if kind not in _COMPILERS:
+            raise RuleError(f"규칙 '{rule_id}': 알 수 없는 type '{kind}' ({', '.join(_COMPILERS)})")
+        severity = rule.get("severity", "error")
+        if severity not in SEVERITIES:
+            raise RuleError(f"규칙 '{rule_id}': severity 는 {', '.join(SEVERITIES)} 중 하나여야 합니다.")
+        sheet = _sheet(rule)
+        rules.append(CompiledRule(rule_id, rule.get("name", rule_id), sheet, kind, severity,
+                                  bool(rule.get("optional", False)), _COMPILERS[kind](rule, sheet)))
+    return RuleSet(list(checklist), rules, path)
+
+
+def load_rules(path: Path = RULES_PATH) -> RuleSet:
+    """규칙 파일 읽기 + 컴파일 (파일이 바뀌지 않았으면 이전 컴파일 결과 재사용)"""
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as e:
+        raise RuleError(f"규칙 파일을 읽을 수 없습니다 ({path.name}): {e}")
+    rule_set = compile_rules(data, path)
+    with _cache_lock:
+        _cache[path] = (mtime, rule_set)
+    return rule_set
+
+
+def load_checklist(path: Path = RULES_PATH) -> List[str]:
+    """점검 항목 문구 (규칙 파일이 없거나 잘못되었으면 기본 항목)"""
+    try:
+        return load_rules(path).checklist
+    except (OSError, RuleError) as e:
+        print(f"[DEBUG] 규칙 파일 점검 항목 읽기 실패, 기본 항목 사용: {e}")
+        return list(DEFAULT_CHECKLIST)
+
+
+# ---------- 평가 ----------
+def _row_refs(mask: np.ndarray) -> str:
+    rows = np.flatnonzero(mask)[:MAX_ROW_REFS] + FIRST_DATA_ROW
+    text = ", ".join(map(str, rows.tolist()))
+    extra = int(mask.sum()) - len(rows)
+    return f"{text} 외 {extra}행" if extra > 0 else text
+
+
+def evaluate_rules(rule_set: RuleSet, frames: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+    """results["rule_check"] dict
+
+    rules: 규칙별 결과 DataFrame (RULE_COLUMNS). 결과는 PASS / FAIL / ERROR(대상 열 없음) / SKIP(optional 규칙의 열 없음)
+    failed_errors: FAIL/ERROR 인 error 규칙 수, violations: 위반 행 수 합계
+    issues: 이슈 수 (위반 행마다 1건, 행 단위가 아닌 규칙의 FAIL/ERROR 는 1건)
+    """
+    ctx = _Frames(frames)
+    rows = []
+    total_start = time.perf_counter()
+    for rule in rule_set.rules:
+        start = time.perf_counter()
+        count, refs = 0, ""
+        try:
+            mask = rule.predicate(ctx)
+            if mask is not None:
+                count = int(mask.sum())
+                refs = _row_refs(mask) if count else ""
+            status = "FAIL" if count else "PASS"
+        except _MissingColumn as e:
+            status, refs = ("SKIP" if rule.optional else "ERROR"), str(e)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        rows.append([rule.id, rule.name, SHEETS[rule.sheet], rule.severity, status, count, refs, round(elapsed_ms, 2)])
+
+    table = pd.DataFrame(rows, columns=RULE_COLUMNS)
+    failed = table["결과"].isin(["FAIL", "ERROR"])
+    return {
+        "rules": table,
+        "rule_count": len(table),
+        "failed_rules": int(failed.sum()),
+        "failed_errors": int((failed & (table["심각도"] == "error")).sum()),
+        "violations": int(table["위반 행 수"].sum()),
+        "issues": int(table["위반 행 수"].clip(lower=1)[failed].sum()),
+        "elapsed_ms": round((time.perf_counter() - total_start) * 1000, 2),
+    }
@@ -0,0 +1,127 @@
+"""
+BOM List ↔ SW인정시험 결과서 정합성 검증 (Qt 비의존)
+
+단계(STAGES) 순서로 진행하며 각 단계 시작 시 progress(단계 번호, 메시지) 호출,
+단계 사이에서 is_cancelled() 가 참이면 VerificationCancelled 발생.
+두 엑셀 파일은 workbook_loader 로 동시에 읽음 (먼저 끝난 파일이 1단계 완료).
+바뀌지 않은 파일은 workbook_cache 에서 바로 읽음 (검증 재실행 시 엑셀 파싱 생략).
+규칙 파일(rules, $UKSDT_RESOURCE_PATH/data/control_dr_rules.json) 검사를 먼저 수행한 뒤 정합성 검증(consistency).
+품번 열이 없어 정합성 검증을 할 수 없어도 규칙 결과로 어떤 필수 열이 없는지 표시.
+읽기 중 취소는 대기를 바로 멈추고, 이미 파싱 중인 작업 프로세스는 끝난 뒤 결과를 버림
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from .consistency import check_consistency
+from .rules import evaluate_rules, load_rules
+from .workbook_cache import default_cache
+from .workbook_loader import SheetTask, load_sheets
+
+STAGES = (
+    ("read", "BOM List/SW인정시험 결과서 파일 읽기"),
+    ("read_rest", "나머지 파일 읽기"),
+    ("rules", "규칙 검사"),
+    ("consistency", "정합성 검증"),
+    ("summary", "결과 요약"),
+)
+
+ProgressCallback = Callable[[int, str], None]
+
+
+class VerificationCancelled(Exception):
+    """사용자 취소"""
+
+
+def run_verification(bom_path: str, sw_test_path: str,
+                     progress: Optional[ProgressCallback] = None,
+                     is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """검증 결과 dict (bom_analysis/sw_test_analysis/consistency_check/rule_check/summary)
+
+    파일 읽기 등 오류는 summary.overall_status = "FAIL" 로 반환 (취소만 예외)
+    """
+    results = {
+        "bom_analysis": {},
+        "sw_test_analysis": {},
+        "consistency_check": {},
+        "rule_check": {},
+        "summary": {}
+    }
+
+    def check_cancelled():
+        if is_cancelled is not None and is_cancelled():
+            raise VerificationCancelled()
+
+    def stage(index: int, detail: str = ""):
+        check_cancelled()
+        if progress is not None:
+            progress(index, detail or f"{STAGES[index][1]} 중...")
+
+    try:
+        print(f"[DEBUG] 검증 시작 - BOM/SW인정시험 결과서 파일 읽기 중...")
+        stage(0)
+        labels = {"bom": "BOM List", "sw_test": "SW인정시험 결과서"}
+        frames_done = []
+
+        def on_loaded(task, df):
+            print(f"[DEBUG] {labels[task.key]} 파일 읽기 완료 - {len(df)}행")
+            if len(frames_done) == 0:
+                rest = "SW인정시험 결과서" if task.key == "bom" else "BOM List"
+                stage(1, f"{labels[task.key]} {len(df)}행 읽음 → {rest} 파일 읽기 중...")
+            frames_done.append(task.key)
+
+        frames = load_sheets([SheetTask("bom", bom_path), SheetTask("sw_test", sw_test_path)],
+                             on_loaded=on_loaded, checkpoint=check_cancelled, cache=default_cache())
+        bom_df, sw_test_df = frames["bom"], frames["sw_test"]
+
+        # BOM List 파일 분석
+        results["bom_analysis"] = {
+            "total_items": len(bom_df),
+            "columns": list(bom_df.columns),
+            "status": "성공"
+        }
+        # SW인정시험 결과서 분석
+        results["sw_test_analysis"] = {
+            "total_tests": len(sw_test_df),
+            "columns": list(sw_test_df.columns),
+            "status": "성공"
+        }
+
+        # 규칙 파일 검사 (파일이 바뀌지 않았으면 컴파일된 규칙 재사용)
+        rule_set = load_rules()
+        stage(2, f"규칙 {len(rule_set.rules)}개 검사 중...")
+        rule_check = evaluate_rules(rule_set, {"bom": bom_df, "sw_test": sw_test_df})
+        results["rule_check"] = rule_check
+        print(f"[DEBUG] 규칙 검사 완료 - {rule_check['rule_count']}개 중 {rule_check['failed_rules']}개 실패 "
+              f"({rule_check['elapsed_ms']:.1f}ms)")
+
+        # 정합성 검증 (품번/버전 기준 누락·추가·버전 불일치·중복)
+        print(f"[DEBUG] 정합성 검증 수행 중...")
+        stage(3, f"BOM List {len(bom_df)}개 항목, SW인정시험 결과서 {len(sw_test_df)}개 테스트 → 정합성 검증 중...")
+        consistency = check_consistency(bom_df, sw_test_df)
+        results["consistency_check"] = consistency
+        if "error" in consistency:
+            print(f"[WARN] 정합성 검증 불가 - {consistency['error']}")
+
+        # 요약 (warning 규칙 위반은 이슈 수에만 포함, 전체 상태는 error 규칙 기준)
+        stage(4)
+        issues_found = len(consistency["issues"]) + rule_check["issues"]
+        consistency_ok = "error" not in consistency and len(consistency["issues"]) == 0
+        overall_status = "PASS" if consistency_ok and rule_check["failed_errors"] == 0 else "FAIL"
+        results["summary"] = {
+            "overall_status": overall_status,
+            "verification_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "issues_found": issues_found
+        }
+        print(f"[DEBUG] 검증 완료 - 결과: {overall_status} (이슈 {issues_found}건)")
+
+    except VerificationCancelled:
+        raise
+    except Exception as e:
+        results["summary"] = {
+            "overall_status": "FAIL",
+            "error": str(e),
+            "verification_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    return results
@@ -0,0 +1,81 @@
+"""
+정합성 검증 작업 (GUI)
+
+- run_verification() 은 작업 스레드에서 실행 → 엑셀 읽기 중에도 화면이 멈추지 않음
+- 단계별 진행은 progress(단계 번호, 메시지), 결과는 작업 스레드 종료 후 finished(dict) 로 GUI 스레드에 전달
+- cancel(): 파일 읽기 대기 중이면 바로, 그 외에는 다음 단계 경계에서 중단 → cancelled 신호 (결과 없음)
+"""
+
+import threading
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QThread, QCoreApplication, pyqtSignal
+
+from .verification import STAGES, VerificationCancelled, run_verification
+
+
+class _VerifyThread(QThread):
+    """결과는 속성에 보관 → 스레드가 완전히 끝난 뒤(finished) VerificationJob 이 전달"""
+    progress = pyqtSignal(int, str)
+
+    def __init__(self, bom_path: str, sw_test_path: str, cancel_event: threading.Event):
+        super().__init__()
+        self.bom_path = bom_path
+        self.sw_test_path = sw_test_path
+        self._cancel_event = cancel_event
+        self.results = None
+        self.error: Optional[str] = None
+
+    def run(self):
+        try:
+            self.results = run_verification(self.bom_path, self.sw_test_path,
+                                            progress=self.progress.emit,
+                                            is_cancelled=self._cancel_event.is_set)
+        except VerificationCancelled:
+            pass
+        except Exception as e:
+            self.error = str(e)
+
+
+class VerificationJob(QObject):
+    """progress(단계 번호, 메시지) → finished(결과) | cancelled() | failed(메시지) 중 하나로 종료"""
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    STAGE_COUNT = len(STAGES)
+
+    def __init__(self, bom_path: str, sw_test_path: str, parent=None):
+        super().__init__(parent)
+        self._cancel_event = threading.Event()
+        self._thread = _VerifyThread(bom_path, sw_test_path, self._cancel_event)
+        self._thread.progress.connect(self.progress)
+        self._thread.finished.connect(self._on_thread_finished)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def start(self):
+        self._thread.start()
+
+    def _on_thread_finished(self):
+        # 스레드가 끝난 뒤에만 알림 → 받는 쪽에서 바로 deleteLater() 해도 실행 중인 QThread 를 파괴하지 않음
+        if self._thread.error is not None:
+            self.failed.emit(self._thread.error)
+        elif self._thread.results is None:
+            self.cancelled.emit()
+        else:
+            self.finished.emit(self._thread.results)
+
+    def isRunning(self) -> bool:
+        return self._thread.isRunning()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def shutdown(self):
+        if self._thread.isRunning():
+            self.cancel()
+            self._thread.wait()
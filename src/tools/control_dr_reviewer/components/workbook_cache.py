@@ -0,0 +1,246 @@
+"""
+파싱된 엑셀 시트 디스크 캐시 (Qt 비의존)
+
+- 키: 파일 경로 + 시트, 항목에 크기/mtime/내용 해시(blake2b) 기록
+    · 크기/mtime 이 같으면 해시 계산 없이 적중
+    · 다르면 내용 해시를 다시 계산해 같으면 적중(파일만 다시 저장된 경우), 다르면 항목 삭제
+- 저장 형식: pyarrow 가 있으면 Feather(Arrow IPC, 열 단위), 없거나 변환할 수 없는 열이면 pickle
+- 크기 제한(CACHE_MAX_BYTES, 환경변수 UKSDT_WORKBOOK_CACHE_MB)을 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)
+- 적중 시 사용 시각(used)은 메모리에서만 갱신 → 다음 put/clear 의 색인 저장 또는 flush()(default_cache 는 종료 시 1회)에 기록
+- 위치: 환경변수 UKSDT_CACHE_PATH, 없으면 %LOCALAPPDATA%(또는 ~/.cache)/UKSDT 아래 workbooks
+캐시 오류(손상/권한 등)는 항상 캐시 미적중으로 처리하고 엑셀을 다시 읽습니다.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = feather = None
+
+CACHE_MAX_BYTES = int(float(os.environ.get("UKSDT_WORKBOOK_CACHE_MB", "512")) * 1024 * 1024)
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+_HASH_CHUNK = 1024 * 1024
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def cache_dir() -> Path:
+    base = os.environ.get("UKSDT_CACHE_PATH")
+    if base:
+        return Path(base) / "workbooks"
+    root = os.environ.get("LOCALAPPDATA")
+    return (Path(root) if root else Path.home() / ".cache") / "UKSDT" / "workbooks"
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def to_arrow_table(df: pd.DataFrame):
+    """DataFrame → pyarrow Table. pyarrow 가 없거나 변환할 수 없으면(문자열이 아닌 열 이름, 숫자/문자 혼합 열 등) None"""
+    if pa is None or not all(isinstance(c, str) for c in df.columns):
+        return None
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def _entry_key(path: Union[str, Path], sheet) -> str:
+    return f"{os.path.normcase(os.path.abspath(path))}|{type(sheet).__name__}:{sheet}"
+
+
+class WorkbookCache:
+    """get(path, sheet) → DataFrame | None, put(path, sheet, df). 스레드 안전"""
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = Path(directory) if directory is not None else cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False   # 저장하지 않은 used/mtime 갱신 있음
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    # ---------- 색인 ----------
+    def _index_path(self) -> Path:
+        return self.directory / INDEX_NAME
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            entries = {}
+            try:
+                data = json.loads(self._index_path().read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION:
+                    entries = data.get("entries", {})
+            except (OSError, ValueError):
+                pass
+            self._entries = entries
+            self._purge_orphans()
+        return self._entries
+
+    def _save(self):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._index_path().with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": INDEX_VERSION, "entries": self._entries}, ensure_ascii=False),
+                           encoding="utf-8")
+            os.replace(tmp, self._index_path())
+            self._dirty = False
+        except OSError as e:
+            print(f"[DEBUG] 엑셀 캐시 색인 저장 실패: {e}")
+
+    def _purge_orphans(self):
+        """색인에 없는 데이터 파일 삭제 (색인 저장 전에 종료된 경우 등)"""
+        referenced = {e["file"] for e in self._entries.values()}
+        try:
+            files = list(self.directory.iterdir())
+        except OSError:
+            return
+        for f in files:
+            if f.name != INDEX_NAME and f.name not in referenced:
+                self._unlink(f.name)
+
+    def _unlink(self, name: str):
+        try:
+            (self.directory / name).unlink()
+        except OSError:
+            pass
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unlink(entry["file"])
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(e["bytes"] for e in self._load().values())
+
+    # ---------- 조회/저장 ----------
+    def get(self, path: Union[str, Path], sheet=0) -> Optional[pd.DataFrame]:
+        if not self.enabled:
+            return None
+        key = _entry_key(path, sheet)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                return None
+            try:
+                st = os.stat(path)
+                if (st.st_size, st.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+                    if st.st_size != entry["size"] or file_hash(path) != entry["hash"]:
+                        self._drop(key)
+                        self._save()
+                        return None
+                    entry["mtime_ns"] = st.st_mtime_ns   # 내용은 같고 다시 저장만 된 파일
+                    self._dirty = True
+                df = self._read(entry)
+            except Exception as e:
+                print(f"[DEBUG] 엑셀 캐시 읽기 실패 ({os.path.basename(str(path))}): {e}")
+                self._drop(key)
+                self._save()
+                return None
+            entry["used"] = time.time()   # 적중 경로에서는 디스크에 쓰지 않음
+            self._dirty = True
+            return df
+
+    def put(self, path: Union[str, Path], sheet, df: pd.DataFrame):
+        if not self.enabled:
+            return
+        key = _entry_key(path, sheet)
+        with self._lock:
+            entries = self._load()
+            try:
+                st = os.stat(path)
+                digest = file_hash(path)
+                if os.stat(path).st_mtime_ns != st.st_mtime_ns:
+                    return   # 해시 계산 중 파일이 바뀜
+                self.directory.mkdir(parents=True, exist_ok=True)
+                stem = hashlib.blake2b(key.encode("utf-8"), digest_size=10).hexdigest()
+                self._drop(key)
+                fmt, name = self._write(stem, df)
+            except Exception as e:
+                print(f"[DEBUG] 엑셀 캐시 저장 실패 ({os.path.basename(str(path))}): {e}")
+                return
+            entries[key] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "hash": digest,
+                "format": fmt,
+                "file": name,
+                "bytes": (self.directory / name).stat().st_size,
+                "used": time.time(),
+            }
+            self._evict()
+            self._save()
+
+    def flush(self):
+        """메모리에만 반영된 사용 시각을 색인에 기록"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._load()):
+                self._drop(key)
+            self._save()
+
+    def _evict(self):
+        """크기 제한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        total = sum(e["bytes"] for e in self._entries.values())
+        for key, entry in sorted(self._entries.items(), key=lambda kv: kv[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entry["bytes"]
+            self._drop(key)
+
+    # ---------- 형식 ----------
+    def _write(self, stem: str, df: pd.DataFrame):
+        table = to_arrow_table(df)
+        if table is not None:
+            name = stem + ".feather"
+            feather.write_feather(table, self.directory / name, compression="uncompressed")
+            return "feather", name
+        name = stem + ".pkl"
+        with open(self.directory / name, "wb") as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return "pickle", name
+
+    def _read(self, entry: dict) -> pd.DataFrame:
+        path = self.directory / entry["file"]
+        if entry["format"] == "feather":
+            if feather is None:
+                raise ValueError("pyarrow 없음")
+            return feather.read_table(path, memory_map=False).to_pandas()
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def default_cache() -> WorkbookCache:
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = WorkbookCache()
+            atexit.register(_default_cache.flush)
+        return _default_cache
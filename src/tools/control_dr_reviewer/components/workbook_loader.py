@@ -0,0 +1,170 @@
+"""
+엑셀 시트 병렬 읽기 (Qt 비의존)
+
+- 시트 1개 = 작업 1개(SheetTask), 프로세스 풀에서 동시에 파싱
+  → openpyxl 파싱(CPU)이 GIL 에 묶이지 않아 전체 시간 ≈ 가장 오래 걸리는 시트 하나
+- 결과 전달: pyarrow 가 있으면 Arrow IPC 버퍼, 없거나 변환할 수 없는 열이면 DataFrame pickle
+- 풀은 처음 사용할 때 만들어 재사용 (프로세스 시작/pandas import 비용은 한 번만, warm_up() 으로 미리 시작 가능)
+- CPU 가 하나뿐이거나 작은 파일뿐이면, 또는 풀을 쓸 수 없으면(BrokenProcessPool 등) 현재 스레드에서 순서대로 읽음
+- cache(WorkbookCache)를 주면 바뀌지 않은 파일의 시트는 엑셀을 읽지 않고 캐시에서 바로 반환, 새로 읽은 시트는 캐시에 저장
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from .workbook_cache import WorkbookCache, pa, to_arrow_table
+
+MAX_WORKERS = 4
+PARALLEL_MIN_BYTES = 256 * 1024   # 파일 크기 합계가 이보다 작으면 풀을 쓰지 않음
+POLL_SECONDS = 0.1                # 취소 확인 간격
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SheetTask:
+    key: str                       # 결과 dict 키
+    path: str
+    sheet: Union[int, str] = 0     # 시트 번호 또는 이름
+
+
+def sheet_tasks(key: str, path: str) -> List[SheetTask]:
+    """통합 문서의 모든 시트를 작업으로 (키: "key:시트이름")"""
+    with pd.ExcelFile(path) as book:
+        return [SheetTask(f"{key}:{name}", path, name) for name in book.sheet_names]
+
+
+# ---------- 작업 프로세스 ----------
+def _encode(df: pd.DataFrame):
+    table = to_arrow_table(df)
+    if table is not None:
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return "arrow", sink.getvalue()
+    return "pickle", df
+
+
+def _decode(payload) -> pd.DataFrame:
+    kind, data = payload
+    if kind == "arrow":
+        return pa.ipc.open_stream(data).read_all().to_pandas()
+    return data
+
+
+def _parse_sheet(path: str, sheet):
+    return _encode(pd.read_excel(path, sheet_name=sheet))
+
+
+def _ping():
+    return os.getpid()
+
+
+# ---------- 풀 ----------
+def _workers() -> int:
+    return min(MAX_WORKERS, os.cpu_count() or 1)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # fork 는 Qt 스레드가 있는 프로세스에서 안전하지 않으므로 모든 플랫폼에서 spawn
+            _pool = ProcessPoolExecutor(max_workers=_workers(), mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def warm_up():
+    """작업 프로세스를 미리 시작 (파일 선택 시 호출 → 첫 검증에서 프로세스 시작 대기 없음)"""
+    if _workers() < 2:
+        return
+    try:
+        pool = _get_pool()
+        for _ in range(_workers()):
+            pool.submit(_ping)
+    except (BrokenProcessPool, OSError, RuntimeError):
+        shutdown_pool()
+
+
+def _use_pool(tasks: Sequence[SheetTask]) -> bool:
+    if len(tasks) < 2 or _workers() < 2:
+        return False
+    try:
+        total = sum(os.path.getsize(p) for p in {t.path for t in tasks})
+    except OSError:
+        return False   # 없는 파일: 읽기 오류는 현재 스레드에서 그대로 발생시킴
+    return total >= PARALLEL_MIN_BYTES
+
+
+# ---------- 읽기 ----------
+def load_sheets(tasks: Sequence[SheetTask],
+                on_loaded: Optional[Callable[[SheetTask, pd.DataFrame], None]] = None,
+                checkpoint: Optional[Callable[[], None]] = None,
+                cache: Optional[WorkbookCache] = None) -> Dict[str, pd.DataFrame]:
+    """{task.key: DataFrame}. 시트마다 읽기가 끝난 순서로 on_loaded 호출 (캐시 적중 시트가 먼저)
+
+    checkpoint(): 대기 중 주기적으로 호출. 예외를 던지면(취소 등) 남은 작업을 취소하고 그대로 전달
+    시트 읽기 오류는 pd.read_excel 과 같은 예외로 전달
+    """
+    results: Dict[str, pd.DataFrame] = {}
+
+    def loaded(task: SheetTask, df: pd.DataFrame, cached: bool = False):
+        results[task.key] = df
+        if cache is not None and not cached:
+            cache.put(task.path, task.sheet, df)
+        if on_loaded is not None:
+            on_loaded(task, df)
+
+    remaining = []
+    for task in tasks:
+        df = cache.get(task.path, task.sheet) if cache is not None else None
+        if df is None:
+            remaining.append(task)
+        else:
+            loaded(task, df, cached=True)
+    tasks = list(remaining)
+
+    if _use_pool(tasks):
+        try:
+            pool = _get_pool()
+            futures = {pool.submit(_parse_sheet, t.path, t.sheet): t for t in tasks}
+        except (BrokenProcessPool, OSError, RuntimeError):
+            shutdown_pool()
+        else:
+            pending = set(futures)
+            try:
+                while pending:
+                    if checkpoint is not None:
+                        checkpoint()
+                    done, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task = futures[future]
+                        loaded(task, _decode(future.result()))
+                        remaining.remove(task)
+            except BrokenProcessPool:
+                shutdown_pool()   # 작업 프로세스 비정상 종료: 남은 시트는 아래에서 직접 읽음
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    for task in remaining:
+        if checkpoint is not None:
+            checkpoint()
+        loaded(task, pd.read_excel(task.path, sheet_name=task.sheet))
+    return results
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import (QWidget, QFileDialog, QMessageBox, QRadioButton, 
                              QButtonGroup, QVBoxLayout)
-from PyQt5.QtCore import QDate, pyqtSignal, QThread
+from PyQt5.QtCore import QDate, pyqtSignal
 from PyQt5.QtGui import QFont
 import os
 import pandas as pd
@@ -8,9 +8,16 @@ from datetime import datetime
 
 from .control_dr_reviewer_ui import Ui_ControlDrReviewer
 from .components.check_item import CheckItemWidget
+from .components.rules import load_checklist
+from .components.verification import STAGES
+from .components.verification_job import VerificationJob
+from .components.workbook_loader import warm_up
 
 class ControlDRReviewerWidget(QWidget):
     """Control DR Reviewer 도구 위젯"""
+
+    MAX_ISSUE_LINES = 50  # 결과 화면에 표시할 정합성 이슈 수 (전체는 Excel)
+    RULE_STATUS_ICONS = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️", "SKIP": "🚫"}
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -22,6 +29,7 @@ class ControlDRReviewerWidget(QWidget):
         self.sw_test_file_path = ""
         self.verification_results = {}
         self.check_items = []  # CheckItemWidget 리스트
+        self.verification_job = None  # 진행 중인 검증 작업 (한 번에 하나)
         
         self.setup_ui()
         self.setup_connections()
@@ -31,6 +39,11 @@ class ControlDRReviewerWidget(QWidget):
         """UI 추가 설정"""
         # 현재 날짜로 초기화
         self.ui.review_date_input.setDate(QDate.currentDate())
+
+        # 검증 진행 표시는 검증 중에만
+        self.ui.verify_progress.setMaximum(len(STAGES))
+        self.ui.verify_progress.hide()
+        self.ui.verify_cancel_btn.hide()
         
         # 모든 버튼 기본적으로 활성화 (조건 확인은 클릭 시 수행)
         
@@ -42,19 +55,14 @@ class ControlDRReviewerWidget(QWidget):
         
         # 검증 및 결과 버튼
         self.ui.verify_btn.clicked.connect(self.run_verification)
+        self.ui.verify_cancel_btn.clicked.connect(self.cancel_verification)
         self.ui.generate_report_btn.clicked.connect(self.generate_report)
         self.ui.download_excel_btn.clicked.connect(self.download_excel)
         
     def setup_check_items(self):
         """체크리스트 항목 설정 - CheckItemWidget 컴포넌트 사용"""
-        # 기본 점검 항목들
-        check_item_texts = [
-            "요구사항 추적성 확인",
-            "설계 문서 완성도", 
-            "코드 품질 검증",
-            "테스트 케이스 완성도",
-            "보안 검증 완료"
-        ]
+        # 점검 항목들 (resources/data/control_dr_rules.json 의 checklist)
+        check_item_texts = load_checklist()
         
         # 체크리스트 레이아웃 가져오기
         checklist_layout = self.ui.checklist_content_layout
@@ -96,6 +104,8 @@ class ControlDRReviewerWidget(QWidget):
         
         if file_path:
             self.bom_file_path = file_path
+            # 엑셀 병렬 읽기 작업 프로세스를 미리 시작 (검증 클릭 시 대기 없음)
+            warm_up()
             self.ui.bom_file_path.setText(file_path)
             self.ui.bom_status_label.setText(f"파일 선택됨: {os.path.basename(file_path)}")
             self.ui.bom_status_label.setStyleSheet("color: #27ae60;")
@@ -112,6 +122,8 @@ class ControlDRReviewerWidget(QWidget):
         
         if file_path:
             self.sw_test_file_path = file_path
+            # 엑셀 병렬 읽기 작업 프로세스를 미리 시작 (검증 클릭 시 대기 없음)
+            warm_up()
             self.ui.sw_test_file_path.setText(file_path)
             self.ui.sw_test_status_label.setText(f"파일 선택됨: {os.path.basename(file_path)}")
             self.ui.sw_test_status_label.setStyleSheet("color: #27ae60;")
@@ -178,7 +190,9 @@ class ControlDRReviewerWidget(QWidget):
         return missing_conditions
             
     def run_verification(self):
-        """정합성 검증 실행"""
+        """정합성 검증 실행 (작업 스레드, 결과는 on_verification_finished 로 전달)"""
+        if self.verification_job is not None:
+            return
         try:
             # 검증 조건 확인
             missing_conditions = self.check_verification_conditions()
@@ -194,73 +208,64 @@ class ControlDRReviewerWidget(QWidget):
             # 검증 진행 상태를 execution_result에 실시간 표시
             self.ui.execution_result.setText("검증을 진행 중입니다...")
             
-            # 실제 검증 로직 (간단한 예시)
-            self.verification_results = self.perform_verification()
-            
-            # 결과 표시
-            self.display_verification_results()
-            
-            print(f"[DEBUG] 정합성 검증 완료 - BOM: {os.path.basename(self.bom_file_path) if self.bom_file_path else 'N/A'}, SW테스트: {os.path.basename(self.sw_test_file_path) if self.sw_test_file_path else 'N/A'}")
-            QMessageBox.information(self, "완료", "정합성 검증이 완료되었습니다.")
+            job = VerificationJob(self.bom_file_path, self.sw_test_file_path, self)
+            job.progress.connect(self.on_verification_progress)
+            job.finished.connect(self.on_verification_finished)
+            job.cancelled.connect(self.on_verification_cancelled)
+            job.failed.connect(self.on_verification_failed)
+            self.verification_job = job
+            self.set_verification_running(True)
+            job.start()
             
         except Exception as e:
             QMessageBox.critical(self, "오류", f"검증 중 오류가 발생했습니다:\n{str(e)}")
-            
-    def perform_verification(self):
-        """실제 검증 로직 수행"""
-        results = {
-            "bom_analysis": {},
-            "sw_test_analysis": {},
-            "consistency_check": {},
-            "summary": {}
-        }
+
+    def cancel_verification(self):
+        """진행 중인 검증 취소"""
+        if self.verification_job is not None:
+            self.verification_job.cancel()
+            self.ui.verify_cancel_btn.setEnabled(False)
+            self.ui.execution_result.append("취소 중...")
+
+    def set_verification_running(self, running):
+        """검증 중: 검증 버튼 비활성화, 진행 표시/취소 버튼 표시"""
+        self.ui.verify_btn.setEnabled(not running)
+        self.ui.verify_progress.setValue(0)
+        self.ui.verify_progress.setVisible(running)
+        self.ui.verify_cancel_btn.setEnabled(running)
+        self.ui.verify_cancel_btn.setVisible(running)
+
+    def _end_verification(self):
+        self.verification_job.deleteLater()
+        self.verification_job = None
+        self.set_verification_running(False)
+
+    def on_verification_progress(self, stage, message):
+        """단계 시작 통지 → 진행 막대/실행 결과에 표시"""
+        self.ui.verify_progress.setValue(stage)
+        self.ui.execution_result.append(f"[{stage + 1}/{len(STAGES)}] {message}")
+
+    def on_verification_finished(self, results):
+        self._end_verification()
+        self.verification_results = results
         
-        try:
-            print(f"[DEBUG] 검증 시작 - BOM 파일 읽기 중...")
-            # BOM List 파일 분석
-            bom_df = pd.read_excel(self.bom_file_path, sheet_name=0)
-            results["bom_analysis"] = {
-                "total_items": len(bom_df),
-                "columns": list(bom_df.columns),
-                "status": "성공"
-            }
-            print(f"[DEBUG] BOM 파일 분석 완료 - {len(bom_df)}개 항목")
-            
-            print(f"[DEBUG] SW인정시험 결과서 파일 읽기 중...")
-            # SW인정시험 결과서 분석
-            sw_test_df = pd.read_excel(self.sw_test_file_path, sheet_name=0)
-            results["sw_test_analysis"] = {
-                "total_tests": len(sw_test_df),
-                "columns": list(sw_test_df.columns),
-                "status": "성공"
-            }
-            print(f"[DEBUG] SW인정시험 결과서 분석 완료 - {len(sw_test_df)}개 테스트")
-            
-            # 정합성 검증 (예시) - 실제로는 더 복잡한 로직이 필요
-            print(f"[DEBUG] 정합성 검증 수행 중...")
-            results["consistency_check"] = {
-                "bom_sw_match": "양호",
-                "data_integrity": "정상",
-                "missing_items": 0
-            }
-            
-            # 요약
-            results["summary"] = {
-                "overall_status": "PASS",
-                "verification_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "issues_found": 0
-            }
-            print(f"[DEBUG] 검증 완료 - 결과: PASS")
-            
-        except Exception as e:
-            results["summary"] = {
-                "overall_status": "FAIL",
-                "error": str(e),
-                "verification_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-        return results
+        # 결과 표시
+        self.display_verification_results()
         
+        print(f"[DEBUG] 정합성 검증 완료 - BOM: {os.path.basename(self.bom_file_path) if self.bom_file_path else 'N/A'}, SW테스트: {os.path.basename(self.sw_test_file_path) if self.sw_test_file_path else 'N/A'}")
+        QMessageBox.information(self, "완료", "정합성 검증이 완료되었습니다.")
+
+    def on_verification_cancelled(self):
+        self._end_verification()
+        self.ui.execution_result.append("검증이 취소되었습니다.")
+        self.ui.result_preview.setText("검증이 취소되었습니다. 이전 검증 결과는 유지됩니다." if self.verification_results
+                                       else "검증이 취소되었습니다.")
+
+    def on_verification_failed(self, message):
+        self._end_verification()
+        self.ui.execution_result.append("검증 실패")
+        QMessageBox.critical(self, "오류", f"검증 중 오류가 발생했습니다:\n{message}")
+            
     def display_verification_results(self):
         """검증 결과를 UI에 표시"""
         if not self.verification_results:
@@ -285,19 +290,69 @@ class ControlDRReviewerWidget(QWidget):
         result_text += f"✅ 정합성 검증:\n"
         result_text += f"  - BOM-SW 매칭: {consistency.get('bom_sw_match', 'N/A')}\n"
         result_text += f"  - 데이터 무결성: {consistency.get('data_integrity', 'N/A')}\n"
-        result_text += f"  - 누락 항목: {consistency.get('missing_items', 'N/A')}개\n\n"
-        
+        if consistency.get("error"):
+            result_text += f"  - 확인 불가: {consistency['error']} (규칙 검사 결과 참고)\n"
+        else:
+            result_text += f"  - 누락 항목 (BOM에만 있음): {consistency.get('missing_items', 'N/A')}개\n"
+            if "extra_items" in consistency:
+                result_text += f"  - 추가 항목 (SW인정시험 결과서에만 있음): {consistency['extra_items']}개\n"
+                version_mismatches = consistency['version_mismatches'] if consistency.get('version_checked') else "버전 열 없음"
+                result_text += f"  - 버전 불일치: {version_mismatches}{'개' if consistency.get('version_checked') else ''}\n"
+                result_text += f"  - 중복 품번: {consistency['duplicate_items']}개\n"
+                result_text += f"  - 품번 없는 행: {consistency['blank_part_rows']}개\n"
+        result_text += "\n"
+
+        issues = consistency.get("issues")
+        if issues is not None and len(issues):
+            result_text += f"⚠️ 발견된 이슈 (상위 {min(len(issues), self.MAX_ISSUE_LINES)}건, 전체는 Excel 내보내기 참고):\n"
+            for issue in issues.head(self.MAX_ISSUE_LINES).to_dict("records"):
+                result_text += f"  - [{issue['구분']}] {self.format_issue(issue)}\n"
+            result_text += "\n"
+        
+        # 규칙 파일 검사 결과
+        rule_check = self.verification_results.get("rule_check", {})
+        rules = rule_check.get("rules")
+        if rules is not None and len(rules):
+            result_text += f"📐 규칙 검사 ({rule_check['rule_count']}개, {rule_check['elapsed_ms']:.0f}ms):\n"
+            for rule in rules.to_dict("records"):
+                status = rule["결과"]
+                result_text += f"  - {self.RULE_STATUS_ICONS.get(status, '⚪')} {rule['이름']}: {status}"
+                if rule["위반 행 수"]:
+                    result_text += f" ({rule['위반 행 수']}행: {rule['위반 행']})"
+                elif rule["위반 행"]:
+                    result_text += f" ({rule['위반 행']})"
+                result_text += "\n"
+            result_text += "\n"
+
         # 요약
         summary = self.verification_results.get("summary", {})
         result_text += f"📊 최종 결과:\n"
         result_text += f"  - 전체 상태: {summary.get('overall_status', 'N/A')}\n"
         result_text += f"  - 검증 시간: {summary.get('verification_time', 'N/A')}\n"
         result_text += f"  - 발견된 이슈: {summary.get('issues_found', 'N/A')}개\n"
+        if summary.get("error"):
+            result_text += f"  - 오류: {summary['error']}\n"
         
         # execution_result에도 동일한 결과 표시 (정합성 점검 섹션 내)
         self.ui.execution_result.setText(result_text)
         self.ui.result_preview.setText(result_text)
         
+    @staticmethod
+    def format_issue(issue):
+        """이슈 한 줄 (품번, 행 번호, 버전). issue: 정합성 이슈 행 dict (열 이름 → 값)"""
+        def value(column):
+            v = issue.get(column)
+            return None if pd.isna(v) else v
+
+        part, bom_rows, sw_rows = value("품번"), value("BOM 행"), value("SW인정시험 행")
+        bom_version, sw_version = value("BOM 버전"), value("SW 버전")
+        parts = [part] if part else []
+        if bom_rows:
+            parts.append(f"BOM {bom_rows}행" + (f" (버전 {bom_version})" if bom_version else ""))
+        if sw_rows:
+            parts.append(f"SW인정시험 {sw_rows}행" + (f" (버전 {sw_version})" if sw_version else ""))
+        return " / ".join(parts)
+
     def generate_report(self):
         """리포트 생성"""
         try:
@@ -393,6 +448,7 @@ class ControlDRReviewerWidget(QWidget):
             report += f"  - BOM List: {os.path.basename(self.bom_file_path) if self.bom_file_path else 'N/A'}\n"
             report += f"  - SW인정시험 결과서: {os.path.basename(self.sw_test_file_path) if self.sw_test_file_path else 'N/A'}\n"
             report += f"  - 검증 결과: {summary.get('overall_status', 'N/A')}\n"
+            report += f"  - 발견된 이슈: {summary.get('issues_found', 'N/A')}개\n"
             report += f"  - 검증 시간: {summary.get('verification_time', 'N/A')}\n\n"
         
         # 최종 의견
@@ -464,4 +520,14 @@ class ControlDRReviewerWidget(QWidget):
                 verification_data.append(["발견된 이슈", summary.get("issues_found", "N/A")])
                 
                 verification_df = pd.DataFrame(verification_data, columns=["항목", "결과"])
-                verification_df.to_excel(writer, sheet_name='정합성 검증', index=False)
\ No newline at end of file
+                verification_df.to_excel(writer, sheet_name='정합성 검증', index=False)
+
+                # 정합성 이슈 상세 시트 (행 번호는 원본 엑셀 행 번호)
+                issues = self.verification_results.get("consistency_check", {}).get("issues")
+                if issues is not None and len(issues):
+                    issues.to_excel(writer, sheet_name='정합성 이슈', index=False)
+
+                # 규칙 검사 결과 시트
+                rules = self.verification_results.get("rule_check", {}).get("rules")
+                if rules is not None and len(rules):
+                    rules.to_excel(writer, sheet_name='규칙 검사', index=False)
\ No newline at end of file
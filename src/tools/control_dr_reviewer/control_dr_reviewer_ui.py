@@ -250,6 +250,32 @@ class Ui_ControlDrReviewer(object):
         self.verify_btn.setFont(font)
         self.verify_btn.setObjectName("verify_btn")
         self.file_consistency_layout.addWidget(self.verify_btn)
+        self.verify_progress_layout = QtWidgets.QHBoxLayout()
+        self.verify_progress_layout.setObjectName("verify_progress_layout")
+        self.verify_progress = QtWidgets.QProgressBar(self.file_consistency_group)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(False)
+        font.setWeight(50)
+        self.verify_progress.setFont(font)
+        self.verify_progress.setMaximum(4)
+        self.verify_progress.setProperty("value", 0)
+        self.verify_progress.setObjectName("verify_progress")
+        self.verify_progress_layout.addWidget(self.verify_progress)
+        self.verify_cancel_btn = QtWidgets.QPushButton(self.file_consistency_group)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.verify_cancel_btn.sizePolicy().hasHeightForWidth())
+        self.verify_cancel_btn.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.verify_cancel_btn.setFont(font)
+        self.verify_cancel_btn.setObjectName("verify_cancel_btn")
+        self.verify_progress_layout.addWidget(self.verify_cancel_btn)
+        self.file_consistency_layout.addLayout(self.verify_progress_layout)
         self.execution_result = QtWidgets.QTextEdit(self.file_consistency_group)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(8)
@@ -414,6 +440,8 @@ class Ui_ControlDrReviewer(object):
 "                                                    padding-bottom: 3px;\n"
 "                                                "))
         self.verify_btn.setText(_translate("ControlDrReviewer", "정합성 검증"))
+        self.verify_progress.setFormat(_translate("ControlDrReviewer", "%v/%m 단계"))
+        self.verify_cancel_btn.setText(_translate("ControlDrReviewer", "취소"))
         self.execution_result.setPlaceholderText(_translate("ControlDrReviewer", "검증 실행 결과가 여기에 표시됩니다..."))
         self.final_comment_group.setTitle(_translate("ControlDrReviewer", "Review Comment"))
         self.final_comment_input.setPlaceholderText(_translate("ControlDrReviewer", "최종 리뷰 결과 및 권장사항을 입력하세요..."))
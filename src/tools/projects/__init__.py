@@ -1,6 +1,16 @@
 # Project Tool
 # Projects Management
+#
+# ProjectsWidget(Qt)은 처음 사용할 때 import (PEP 562)
+# → CLI(python -m tools.projects)/engine 은 PyQt5 없이 동작
 
-from .projects import ProjectsWidget
+from .engine import EngineError, ProjectsEngine
 
-__all__ = ['ProjectsWidget']
\ No newline at end of file
+__all__ = ['ProjectsWidget', 'ProjectsEngine', 'EngineError']
+
+
+def __getattr__(name):
+    if name == 'ProjectsWidget':
+        from .projects import ProjectsWidget
+        return ProjectsWidget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
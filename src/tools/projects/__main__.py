@@ -0,0 +1,192 @@
+"""
+Projects CLI (Qt 없이 실행)
+
+    python -m tools.projects report [--format text|csv|json] [--overdue]
+    python -m tools.projects validate
+    python -m tools.projects export OUT.json|OUT.csv
+    python -m tools.projects import IN.json|IN.csv|IN.xlsx [--skip-existing] [--no-new-wrappers] [--dry-run]
+    python -m tools.projects complete [--project ID ...] [--owner NAME] [--ended-before YYYY-MM-DD]
+                                      [--cascade] [--wrapper ID ...] [--dry-run]
+
+공통 옵션: --data 데이터 파일 (기본: $UKSDT_RESOURCE_PATH/data/projects.sample.json),
+          --backend journal|json|sqlite (기본: $UKSDT_PROJECTS_STORAGE)
+종료 코드: 0 정상, 1 검증 위반/작업 불가, 2 인자 오류
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+from .components.prj_import import ImportFormatError
+from .engine import DATA_PATH, EngineError, ProjectsEngine
+
+REPORT_COLUMNS = ("id", "name", "status", "total", "completed", "progress", "start", "end", "owners")
+
+
+def _parse_date(text: str) -> date:
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식 오류 (YYYY-MM-DD): {text}")
+
+
+# ---------- 명령 ----------
+def cmd_report(engine: ProjectsEngine, args) -> int:
+    rows = engine.wrapper_report()
+    overdue = engine.overdue_projects() if args.overdue else []
+    if args.format == "json":
+        out = {"summary": engine.summary(), "wrappers": rows}
+        if args.overdue:
+            out["overdue"] = [p.to_dict() for p in overdue]
+        json.dump(out, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    if args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+        return 0
+
+    s = engine.summary()
+    print(f"Wrapper {s['wrappers']}개, Project {s['projects']}개 "
+          f"(진행 중 {s['in_progress']} / 완료 {s['completed']})")
+    print()
+    for r in rows:
+        period = f"{r['start']} ~ {r['end']}" if r["start"] else "-"
+        print(f"{r['name']:<30} {r['completed']:>5}/{r['total']:<5} {r['progress']:>3}%  {period}  담당자 {r['owners']}명")
+    if args.overdue:
+        print(f"\n종료일 지난 진행 중 프로젝트 {len(overdue)}건")
+        for p in overdue:
+            print(f"  {p.id}  {p.name}  {p.owner or '(미지정)'}  ~{p.end_date}")
+    return 0
+
+
+def cmd_validate(engine: ProjectsEngine, args) -> int:
+    violations = engine.validate()
+    for v in violations:
+        print(f"{v.path}: {v.message}")
+    print(f"위반 {len(violations)}건")
+    return 1 if violations else 0
+
+
+def cmd_export(engine: ProjectsEngine, args) -> int:
+    out = Path(args.output)
+    if out.suffix.lower() == ".csv":
+        engine.export_csv(out)
+    else:
+        engine.export_json(out)
+    print(f"내보내기 완료: {out}")
+    return 0
+
+
+def cmd_import(engine: ProjectsEngine, args) -> int:
+    path = Path(args.input)
+    if path.suffix.lower() == ".json":
+        added, updated = engine.import_json(path)
+        print(f"추가 {added}건, 수정 {updated}건")
+        return _finish(engine, args)
+
+    def progress(fraction):
+        print(f"\r가져오는 중... {fraction:4.0%}", end="", file=sys.stderr, flush=True)
+
+    result = engine.import_file(path, update_existing=not args.skip_existing,
+                                create_wrappers=not args.no_new_wrappers,
+                                progress=progress if sys.stderr.isatty() else None,
+                                save=not args.dry_run)
+    if sys.stderr.isatty():
+        print(file=sys.stderr)
+    print(result.summary())
+    if result.skipped_ids:
+        print(f"건너뛴 ID: {', '.join(result.skipped_ids)}")
+    if args.dry_run:
+        print("(dry-run: 저장하지 않음)")
+    return 0
+
+
+def cmd_complete(engine: ProjectsEngine, args) -> int:
+    ids = set(args.project or ())
+    if args.owner is not None or args.ended_before is not None:
+        for p in engine.repo.projects_by_status("in_progress"):
+            if args.owner is not None and p.owner != args.owner:
+                continue
+            if args.ended_before is not None and (p.end_ordinal is None
+                                                  or p.end_ordinal >= args.ended_before.toordinal()):
+                continue
+            ids.add(p.id)
+    projects = engine.projects_of(sorted(ids))
+    # 이번 완료로 모든 하위 프로젝트가 완료되는 wrapper 는 --wrapper 로 지정해도 완료 가능
+    ready = [w.id for w in engine.wrappers_completed_by(projects)]
+    for wid in args.wrapper or ():
+        error = engine.wrapper_completion_error(wid)
+        if error and wid not in ready:
+            print(f"[{wid}] {error}", file=sys.stderr)
+            return 1
+    wrapper_ids = list(args.wrapper or ()) + (ready if args.cascade else [])
+    done, wrappers = engine.complete_projects([p.id for p in projects], wrapper_ids)
+    print(f"프로젝트 {len(done)}개, Wrapper {len(wrappers)}개 완료 처리")
+    return _finish(engine, args)
+
+
+def _finish(engine: ProjectsEngine, args) -> int:
+    if args.dry_run:
+        print("(dry-run: 저장하지 않음)")
+        return 0
+    engine.save()
+    return 0
+
+
+# ---------- 인자 ----------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m tools.projects", description="Projects 데이터 CLI")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="데이터 파일 경로")
+    parser.add_argument("--backend", choices=("journal", "json", "sqlite"), help="저장소 백엔드")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("report", help="wrapper 별 진행 현황")
+    p.add_argument("--format", choices=("text", "csv", "json"), default="text")
+    p.add_argument("--overdue", action="store_true", help="종료일이 지난 진행 중 프로젝트 포함")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("validate", help="스키마/참조/날짜 검증")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("export", help="JSON(전체) 또는 CSV(프로젝트 목록) 내보내기")
+    p.add_argument("output")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("import", help="projects JSON 병합 또는 ALM/Excel CSV·XLSX 가져오기 (같은 ID 는 수정)")
+    p.add_argument("input")
+    p.add_argument("--skip-existing", action="store_true", help="이미 있는 ID 는 수정하지 않음 (CSV/XLSX)")
+    p.add_argument("--no-new-wrappers", action="store_true", help="없는 wrapper 이름은 만들지 않음 (CSV/XLSX)")
+    p.add_argument("--dry-run", action="store_true")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("complete", help="프로젝트 일괄 완료")
+    p.add_argument("--project", action="append", metavar="ID")
+    p.add_argument("--owner", help="담당자의 진행 중 프로젝트 전체")
+    p.add_argument("--ended-before", type=_parse_date, metavar="YYYY-MM-DD",
+                   help="종료일이 이 날짜 이전인 진행 중 프로젝트 전체")
+    p.add_argument("--wrapper", action="append", metavar="ID", help="완료 처리할 wrapper")
+    p.add_argument("--cascade", action="store_true", help="모든 하위 프로젝트가 완료되는 wrapper 도 완료")
+    p.add_argument("--dry-run", action="store_true")
+    p.set_defaults(func=cmd_complete)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    engine = ProjectsEngine.open(args.data, args.backend)
+    try:
+        return args.func(engine, args)
+    except (EngineError, ImportFormatError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
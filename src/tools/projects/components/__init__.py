@@ -1,9 +1,25 @@
 # Control DR Reviewer Tool Components
 # 체크 아이템 및 기타 컴포넌트들
+#
+# Qt 위젯/모델은 처음 사용할 때 import (PEP 562) → 모델/저장소만 쓰는 engine/CLI 는 PyQt5 불필요
 
-from .prj_detailview import ProjectsDetailViewWidget
-from .prj_treeview import ProjectsTreeViewWidget
 from .prj_models import *
-from .prj_treebuilder import *
+from .prj_repository import ProjectRepository
 
-__all__ = ['ProjectsDetailViewWidget', 'ProjectsTreeViewWidget', 'Wrapper', 'Project', 'DataModel', 'build_tree_model', 'ROLE_TYPE', 'ROLE_ID']
\ No newline at end of file
+_LAZY = {
+    'ProjectsDetailViewWidget': '.prj_detailview',
+    'ProjectsTreeViewWidget': '.prj_treeview',
+    'ROLE_TYPE': '.prj_treebuilder',
+    'ROLE_ID': '.prj_treebuilder',
+    'ProjectsTreeModel': '.prj_treemodel',
+}
+
+__all__ = ['ProjectsDetailViewWidget', 'ProjectsTreeViewWidget', 'Wrapper', 'Project', 'DataModel', 'JsonCodec', 'ProjectRepository', 'ProjectsTreeModel', 'ROLE_TYPE', 'ROLE_ID']
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module, __name__), name)
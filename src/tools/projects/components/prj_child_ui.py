@@ -17,26 +17,13 @@ class Ui_ChildrenView(object):
         self.verticalLayout = QtWidgets.QVBoxLayout(ChildrenView)
         self.verticalLayout.setContentsMargins(0, 0, 0, 0)
         self.verticalLayout.setObjectName("verticalLayout")
-        self.tableChildren = QtWidgets.QTableWidget(ChildrenView)
+        self.tableChildren = QtWidgets.QTableView(ChildrenView)
+        self.tableChildren.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.tableChildren.setObjectName("tableChildren")
-        self.tableChildren.setColumnCount(3)
-        self.tableChildren.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableChildren.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableChildren.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableChildren.setHorizontalHeaderItem(2, item)
         self.verticalLayout.addWidget(self.tableChildren)
 
         self.retranslateUi(ChildrenView)
         QtCore.QMetaObject.connectSlotsByName(ChildrenView)
 
     def retranslateUi(self, ChildrenView):
-        _translate = QtCore.QCoreApplication.translate
-        item = self.tableChildren.horizontalHeaderItem(0)
-        item.setText(_translate("ChildrenView", "ID"))
-        item = self.tableChildren.horizontalHeaderItem(1)
-        item.setText(_translate("ChildrenView", "이름"))
-        item = self.tableChildren.horizontalHeaderItem(2)
-        item.setText(_translate("ChildrenView", "상태"))
+        pass
@@ -0,0 +1,71 @@
+"""
+Projects 트리 조건 필터 (담당자 / 상태 / wrapper / 기간)
+
+조건은 ProjectRepository 의 id 인덱스(담당자별/상태별/wrapper별)로 후보를 좁힌 뒤
+기간 조건만 후보 안에서 날짜 ordinal 로 비교합니다. 결과는 표시할 프로젝트 id 집합이며
+ProjectsTreeModel.set_filter(TreeFilter(..., scope=ids)) 로 트리에 반영합니다.
+→ 조건을 바꿔도 repository/인덱스 재구성이나 JSON 재로드 없음
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Set
+
+from .prj_repository import STATUSES, ProjectRepository
+
+NO_WRAPPER = ""  # wrapper_ids 조건에서 'wrapper 없음'을 뜻하는 값
+
+
+@dataclass(frozen=True)
+class FilterCriteria:
+    owners: FrozenSet[str] = frozenset()        # 비어 있으면 조건 없음
+    statuses: FrozenSet[str] = frozenset()
+    wrapper_ids: FrozenSet[str] = frozenset()   # NO_WRAPPER 포함 가능
+    date_from: Optional[int] = None             # date ordinal (기간이 겹치는 프로젝트)
+    date_to: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        return not (self.owners or self.statuses or self.wrapper_ids
+                    or self.date_from is not None or self.date_to is not None)
+
+
+def match_projects(repo: ProjectRepository, criteria: FilterCriteria) -> Set[str]:
+    """조건을 모두 만족하는 프로젝트 id 집합"""
+    candidates: Optional[Set[str]] = None
+
+    def narrow(ids: Set[str]):
+        nonlocal candidates
+        candidates = ids if candidates is None else candidates & ids
+
+    if criteria.owners:
+        narrow({pid for o in criteria.owners for pid in repo.project_ids_by_owner(o)})
+    if criteria.statuses:
+        narrow({pid for s in criteria.statuses for pid in repo.project_ids_by_status(s)})
+    if criteria.wrapper_ids:
+        ids = set()
+        for wid in criteria.wrapper_ids:
+            if wid == NO_WRAPPER:
+                for s in STATUSES:
+                    ids.update(repo.loose_project_ids(s))
+            else:
+                ids.update(repo.child_ids(wid))
+        narrow(ids)
+
+    if criteria.date_from is None and criteria.date_to is None:
+        if candidates is None:
+            return {p.id for p in repo.projects()}
+        return candidates
+
+    # 기간 겹침: start <= date_to and end >= date_from (날짜 형식 오류 프로젝트는 제외)
+    lo = criteria.date_from if criteria.date_from is not None else float("-inf")
+    hi = criteria.date_to if criteria.date_to is not None else float("inf")
+    if candidates is None:
+        records = repo.projects()
+    else:
+        get = repo.get_project
+        records = [get(pid) for pid in candidates]
+    result = set()
+    for p in records:
+        start, end = p.start_ordinal, p.end_ordinal
+        if start is not None and end is not None and start <= hi and end >= lo:
+            result.add(p.id)
+    return result
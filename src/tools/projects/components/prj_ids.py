@@ -0,0 +1,69 @@
+"""
+Projects 레코드 ID 할당
+
+형식: 접두사 + 시간(ms, 10자) + 순번(6자), Crockford base32  (예: p01JABCDEFGH0K3XQZ)
+  - 문자열 정렬 순서 = 생성 순서 (같은 ms 안에서는 순번 증가, 시계가 뒤로 가도 감소하지 않음)
+  - 순번 시작값은 실행마다 무작위 → 여러 사용자가 같은 파일에 동시에 추가해도 충돌 가능성 낮음
+  - 할당 시 이미 사용 중인 ID 인지 taken(id) 로 확인 (repository id 인덱스, O(1))
+  - 대량 추가(가져오기)는 block(n) 으로 한 번에 할당
+기존 데이터의 ID(w001, p12345678 등)는 형식과 무관하게 그대로 사용합니다.
+"""
+
+import random
+import time
+from typing import Callable, List
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"   # Crockford base32 (I, L, O, U 제외)
+TIME_CHARS = 10     # 50bit: 서기 37000 년까지
+SEQ_CHARS = 6       # 30bit: 같은 ms 안에서 약 10억 개
+_SEQ_MAX = 32 ** SEQ_CHARS
+
+
+def _encode(value: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        value, r = divmod(value, 32)
+        chars.append(_ALPHABET[r])
+    return "".join(reversed(chars))
+
+
+class IdAllocator:
+    """시간순 정렬 가능한 단조 증가 ID 할당기"""
+
+    def __init__(self, taken: Callable[[str], bool], clock: Callable[[], float] = time.time):
+        self._taken = taken
+        self._clock = clock
+        self._last_ms = 0
+        self._seq = 0
+
+    def _next(self) -> int:
+        """다음 (ms, 순번) 을 하나의 정수로 (ms << 30 | 순번)"""
+        now = int(self._clock() * 1000)
+        if now > self._last_ms:
+            self._last_ms = now
+            # 순번 하위 절반에서 무작위 시작 → 같은 ms 에 다른 프로세스와 겹치지 않도록
+            self._seq = random.randrange(_SEQ_MAX // 2)
+        else:
+            self._seq += 1
+            if self._seq >= _SEQ_MAX:
+                self._last_ms += 1
+                self._seq = 0
+        return self._last_ms * _SEQ_MAX + self._seq
+
+    def _format(self, prefix: str, value: int) -> str:
+        return prefix + _encode(value, TIME_CHARS + SEQ_CHARS)
+
+    def new_id(self, prefix: str) -> str:
+        while True:
+            new_id = self._format(prefix, self._next())
+            if not self._taken(new_id):
+                return new_id
+
+    def block(self, prefix: str, n: int) -> List[str]:
+        """ID n 개를 연속 할당 (가져오기 등 대량 추가용). 블록 안에서는 중복 없음"""
+        ids = []
+        while len(ids) < n:
+            new_id = self._format(prefix, self._next())
+            if not self._taken(new_id):
+                ids.append(new_id)
+        return ids
@@ -0,0 +1,273 @@
+"""
+ALM/Excel 내보내기(CSV/XLSX) → Project 일괄 가져오기 (Qt 비의존)
+
+- 읽기: 파일 전체를 메모리에 올리지 않고 한 행씩 읽음
+    · CSV : csv.reader (UTF-8/UTF-8 BOM, 실패 시 CP949), 구분자 자동 감지(, ; 탭)
+    · XLSX: openpyxl read_only 모드 (첫 번째 시트), 셀 값만 읽음
+- 열 매핑: 머리글 이름(영문/한글/Polarion 별칭, 대소문자·공백·밑줄 무시) → Project 필드
+- 행 변환(read_chunks)은 repository 와 무관 → 작업 스레드에서 수행 가능
+- 적용(ProjectImporter.apply)은 IMPORT_CHUNK_ROWS 행 단위로 repository.batch() 한 번
+    · ID 열 값이 기존 프로젝트면 수정(update_existing=False 면 건너뜀), 없으면 새 ID 를 묶음으로 할당
+    · wrapper 열은 wrapper ID 또는 이름, 없는 이름이면 wrapper 를 새로 만듦(create_wrappers)
+날짜/상태 형식 오류는 그대로 가져오고 검증 패널(스키마 검증)에서 표시합니다.
+"""
+
+import csv
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .prj_models import Project, Wrapper
+from .prj_repository import ProjectRepository
+
+IMPORT_CHUNK_ROWS = 2000   # repository.batch()/저장 1회당 행 수
+_SNIFF_BYTES = 64 * 1024
+
+# Project 필드 → 머리글 별칭 (소문자, 공백/밑줄/하이픈 제거 후 비교)
+COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "id": ("id", "projectid", "프로젝트id", "key"),
+    "name": ("name", "title", "summary", "이름", "제목", "프로젝트명", "프로젝트"),
+    "status": ("status", "state", "상태"),
+    "wrapper": ("wrapper", "wrapperid", "wrappername", "parent", "상위", "상위항목", "랩퍼", "그룹"),
+    "owner": ("owner", "assignee", "assignees", "담당자", "담당"),
+    "start_date": ("start", "startdate", "plannedstart", "시작", "시작일"),
+    "end_date": ("end", "enddate", "due", "duedate", "plannedend", "종료", "종료일", "마감일"),
+    "notes": ("notes", "note", "description", "desc", "메모", "비고", "설명"),
+}
+_COMPLETED = frozenset(("completed", "complete", "done", "closed", "resolved", "verified",
+                        "완료", "종료"))
+_DATE = re.compile(r"^(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+
+
+class ImportFormatError(ValueError):
+    """가져올 수 없는 파일 (형식/필수 열 없음)"""
+
+
+def _header_key(text) -> str:
+    return re.sub(r"[\s_\-]", "", str(text or "")).casefold()
+
+
+def map_columns(header: Sequence) -> Dict[str, int]:
+    """머리글 → {필드: 열 번호}. 같은 필드의 열이 여러 개면 첫 번째 열 사용"""
+    lookup = {alias: name for name, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    columns: Dict[str, int] = {}
+    for i, text in enumerate(header):
+        name = lookup.get(_header_key(text))
+        if name is not None and name not in columns:
+            columns[name] = i
+    if "name" not in columns:
+        raise ImportFormatError("프로젝트 이름 열(Name/Title/프로젝트명)을 찾을 수 없습니다.")
+    return columns
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)   # Excel 숫자 ID (123.0 → "123")
+    return str(value).strip()
+
+
+def _date_text(value) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    text = _text(value)
+    m = _DATE.match(text)
+    if m:
+        return f"{int(m.group(1)):04d}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
+    return text
+
+
+def _status(value) -> str:
+    return "completed" if _text(value).casefold() in _COMPLETED else "in_progress"
+
+
+# ---------- 행 읽기 ----------
+class _RowSource:
+    """머리글 + 행 반복자 + 진행률(0~1)"""
+
+    def __init__(self, header: Sequence, rows: Iterator[Sequence],
+                 progress: Callable[[], float], close: Callable[[], None]):
+        self.header = header
+        self.rows = rows
+        self.progress = progress
+        self.close = close
+
+
+def _open_csv(path: Path) -> _RowSource:
+    raw = open(path, "rb")
+    sample = raw.read(_SNIFF_BYTES)
+    raw.seek(0)
+    try:
+        sample.decode("utf-8")
+        encoding = "utf-8-sig"
+    except UnicodeDecodeError as e:
+        # 표본 끝에서 잘린 멀티바이트 문자는 UTF-8 로 판단
+        encoding = "utf-8-sig" if e.start >= len(sample) - 3 else "cp949"
+    text = sample.decode(encoding, errors="ignore")
+    try:
+        dialect = csv.Sniffer().sniff(text.split("\n", 1)[0], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    size = max(os.fstat(raw.fileno()).st_size, 1)
+    reader = csv.reader(io.TextIOWrapper(raw, encoding=encoding, newline=""), dialect)
+    header = next(reader, None)
+    if header is None:
+        raw.close()
+        raise ImportFormatError("빈 파일입니다.")
+    return _RowSource(header, reader, lambda: raw.tell() / size, raw.close)
+
+
+def _open_xlsx(path: Path) -> _RowSource:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX 파일을 읽으려면 openpyxl 이 필요합니다 (pip install openpyxl).")
+    wb = load_workbook(path, read_only=True, data_only=True)
+    ws = wb.worksheets[0]
+    total = max(ws.max_row or 0, 1)   # 시트 크기 정보가 없으면 진행률은 0 으로 표시
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        wb.close()
+        raise ImportFormatError("빈 시트입니다.")
+    count = [1]
+
+    def counted():
+        for row in rows:
+            count[0] += 1
+            yield row
+
+    return _RowSource(header, counted(), lambda: min(count[0] / total, 1.0), wb.close)
+
+
+def open_rows(path: Path) -> _RowSource:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv" or suffix == ".txt":
+        return _open_csv(Path(path))
+    if suffix in (".xlsx", ".xlsm"):
+        return _open_xlsx(Path(path))
+    raise ImportFormatError(f"지원하지 않는 파일 형식: {suffix} (CSV/XLSX 만 가능)")
+
+
+def read_chunks(path: Path, chunk_rows: int = IMPORT_CHUNK_ROWS) -> Iterator[Tuple[List[Dict[str, str]], float]]:
+    """(행 dict 목록, 진행률) 을 chunk_rows 행씩 반환. 이름이 빈 행은 건너뜀
+
+    행 dict 키: COLUMN_ALIASES 의 필드 중 파일에 있는 열
+    """
+    source = open_rows(path)
+    try:
+        columns = map_columns(source.header)
+        name_col = columns["name"]
+        chunk: List[Dict[str, str]] = []
+        for row in source.rows:
+            if name_col >= len(row) or not _text(row[name_col]):
+                continue
+            rec = {}
+            for name, i in columns.items():
+                value = row[i] if i < len(row) else None
+                if name in ("start_date", "end_date"):
+                    rec[name] = _date_text(value)
+                elif name == "status":
+                    rec[name] = _status(value)
+                else:
+                    rec[name] = _text(value)
+            chunk.append(rec)
+            if len(chunk) >= chunk_rows:
+                yield chunk, source.progress()
+                chunk = []
+        yield chunk, 1.0
+    finally:
+        source.close()
+
+
+# ---------- 적용 ----------
+@dataclass
+class ImportResult:
+    added: int = 0
+    updated: int = 0
+    skipped: int = 0
+    wrappers_added: int = 0
+    skipped_ids: List[str] = field(default_factory=list)   # wrapper 와 겹치는 ID 등 (최대 20개)
+
+    def summary(self) -> str:
+        text = f"추가 {self.added}건, 수정 {self.updated}건"
+        if self.wrappers_added:
+            text += f", 새 Wrapper {self.wrappers_added}개"
+        if self.skipped:
+            text += f", 건너뜀 {self.skipped}건"
+        return text
+
+
+class ProjectImporter:
+    """read_chunks() 결과를 repository 에 적용 (GUI 스레드/CLI 에서 호출)"""
+
+    def __init__(self, repo: ProjectRepository, update_existing: bool = True, create_wrappers: bool = True):
+        self.repo = repo
+        self.update_existing = update_existing
+        self.create_wrappers = create_wrappers
+        self.result = ImportResult()
+        self._wrapper_by_name: Optional[Dict[str, str]] = None
+
+    def _resolve_wrapper(self, value: str) -> Optional[str]:
+        if not value:
+            return None
+        if self.repo.get_wrapper(value) is not None:
+            return value
+        if self._wrapper_by_name is None:
+            self._wrapper_by_name = {}
+            for w in self.repo.wrappers():
+                self._wrapper_by_name.setdefault(w.name, w.id)
+        wrapper_id = self._wrapper_by_name.get(value)
+        if wrapper_id is None and self.create_wrappers:
+            wrapper = Wrapper(id=self.repo.new_id("wrapper"), name=value, type="wrapper", status="in_progress")
+            self.repo.add_wrapper(wrapper)
+            wrapper_id = self._wrapper_by_name[value] = wrapper.id
+            self.result.wrappers_added += 1
+        return wrapper_id
+
+    def _skip(self, record_id: str):
+        self.result.skipped += 1
+        if len(self.result.skipped_ids) < 20:
+            self.result.skipped_ids.append(record_id)
+
+    def apply(self, rows: List[Dict[str, str]]) -> ImportResult:
+        """행 묶음 적용 (변경 통지 1회). 누적 결과 반환"""
+        repo = self.repo
+        result = self.result
+        new_ids = iter(repo.new_ids("project", sum(1 for r in rows if not r.get("id"))))
+        with repo.batch():
+            for r in rows:
+                fields = {k: v for k, v in r.items() if k not in ("id", "wrapper")}
+                if "wrapper" in r:
+                    fields["wrapper_id"] = self._resolve_wrapper(r["wrapper"])
+                record_id = r.get("id")
+                if record_id and repo.get_project(record_id) is not None:
+                    if self.update_existing:
+                        repo.update_project(record_id, **fields)
+                        result.updated += 1
+                    else:
+                        self._skip(record_id)
+                    continue
+                if record_id and repo.has_id(record_id):
+                    self._skip(record_id)   # wrapper 와 같은 ID
+                    continue
+                repo.add_project(Project(
+                    id=record_id or next(new_ids),
+                    name=fields["name"],
+                    type="project",
+                    status=fields.get("status", "in_progress"),
+                    wrapper_id=fields.get("wrapper_id"),
+                    owner=fields.get("owner", ""),
+                    start_date=fields.get("start_date", ""),
+                    end_date=fields.get("end_date", ""),
+                    notes=fields.get("notes", ""),
+                ))
+                result.added += 1
+        return result
@@ -0,0 +1,89 @@
+"""
+CSV/XLSX 가져오기 작업 (GUI)
+
+- 파일 읽기/행 변환(prj_import.read_chunks)은 작업 스레드, repository 적용은 GUI 스레드
+- 작업 스레드는 GUI 가 처리하지 않은 묶음이 MAX_QUEUED_CHUNKS 개면 기다림
+  → 파일이 커도 메모리에는 몇 묶음만 존재
+- cancel() 은 다음 묶음 경계에서 중단 (이미 적용된 묶음은 유지)
+"""
+
+import threading
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, QThread, QCoreApplication, pyqtSignal
+
+from .prj_import import read_chunks
+
+MAX_QUEUED_CHUNKS = 2
+
+
+class _ReadThread(QThread):
+    chunkReady = pyqtSignal(object, float)   # (행 dict 목록, 진행률 0~1)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path: Path, slots: threading.Semaphore, cancelled: threading.Event):
+        super().__init__()
+        self.path = path
+        self._slots = slots
+        self._cancelled = cancelled
+
+    def run(self):
+        try:
+            for rows, fraction in read_chunks(self.path):
+                self._slots.acquire()
+                if self._cancelled.is_set():
+                    return
+                self.chunkReady.emit(rows, fraction)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class ImportJob(QObject):
+    """chunkReady 로 받은 묶음을 적용한 뒤 반드시 chunkDone() 호출
+
+    finished(bool): 모든 묶음 전달 완료(True) 또는 취소/실패(False)
+    """
+    chunkReady = pyqtSignal(object, float)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal(bool)
+
+    def __init__(self, path: Path, parent=None):
+        super().__init__(parent)
+        self._slots = threading.Semaphore(MAX_QUEUED_CHUNKS)
+        self._cancelled = threading.Event()
+        self._failed = False
+        self._thread = _ReadThread(Path(path), self._slots, self._cancelled)
+        self._thread.chunkReady.connect(self._forward)
+        self._thread.failed.connect(self._on_failed)
+        self._thread.finished.connect(self._on_thread_finished)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def start(self):
+        self._thread.start()
+
+    def chunkDone(self):
+        self._slots.release()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._slots.release()   # 대기 중인 작업 스레드를 깨움
+
+    def _forward(self, rows, fraction):
+        if not self._cancelled.is_set():   # 취소 전에 이미 보낸 묶음은 버림
+            self.chunkReady.emit(rows, fraction)
+
+    def _on_failed(self, message: str):
+        self._failed = True
+        self.failed.emit(message)
+
+    def _on_thread_finished(self):
+        # 스레드 종료 신호는 마지막 chunkReady 이후에 전달됨 (같은 스레드에서 발생한 queued 신호 순서)
+        self.finished.emit(not self._cancelled.is_set() and not self._failed)
+
+    def shutdown(self):
+        if self._thread.isRunning():
+            self.cancel()
+            self._thread.wait()
@@ -0,0 +1,55 @@
+from PyQt5.QtWidgets import QWidget, QTreeWidgetItem
+from PyQt5.QtCore import Qt, pyqtSignal
+from .prj_issues_ui import Ui_ProjectsIssuesView
+
+_ROLE_KEY = Qt.UserRole + 1
+
+
+class ProjectsIssuesWidget(QWidget):
+    """
+    데이터 검증 결과 패널. 외부 주입:
+      - setRunning(): 검증 진행 중 표시
+      - setViolations(list[Violation]): 위반 목록 표시 (없으면 목록 숨김)
+    외부 신호:
+      - recordActivated(kind, record_id): 항목 더블클릭
+    """
+    recordActivated = pyqtSignal(str, str)
+
+    # 한 번에 표시할 최대 항목 수 (나머지는 요약 라벨에 개수만 표시)
+    MAX_ROWS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ui = Ui_ProjectsIssuesView()
+        self.ui.setupUi(self)
+        self.ui.treeIssues.itemDoubleClicked.connect(self._on_double_clicked)
+        self.ui.treeIssues.hide()
+
+    def setRunning(self):
+        self.ui.labelSummary.setText("데이터 검증 중...")
+
+    def setViolations(self, violations):
+        t = self.ui.treeIssues
+        t.clear()
+        if not violations:
+            self.ui.labelSummary.setText("✅ 데이터 검증: 문제 없음")
+            t.hide()
+            return
+        records = {(v.kind, v.record_id) for v in violations if v.kind}
+        self.ui.labelSummary.setText(f"⚠ 데이터 검증: {len(violations)}건 (레코드 {len(records)}개)")
+        items = []
+        for v in violations[:self.MAX_ROWS]:
+            it = QTreeWidgetItem([v.path, v.message])
+            it.setToolTip(1, v.message)
+            it.setData(0, _ROLE_KEY, (v.kind or "", v.record_id or ""))
+            items.append(it)
+        if len(violations) > self.MAX_ROWS:
+            items.append(QTreeWidgetItem(["…", f"외 {len(violations) - self.MAX_ROWS}건"]))
+        t.addTopLevelItems(items)
+        t.resizeColumnToContents(0)
+        t.show()
+
+    def _on_double_clicked(self, item, _column):
+        key = item.data(0, _ROLE_KEY)
+        if key and key[0] and key[1]:
+            self.recordActivated.emit(key[0], key[1])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'E:/Jihoon0146/UKSDT/src/tools/projects/components/prj_issues.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ProjectsIssuesView(object):
+    def setupUi(self, ProjectsIssuesView):
+        ProjectsIssuesView.setObjectName("ProjectsIssuesView")
+        self.verticalLayout = QtWidgets.QVBoxLayout(ProjectsIssuesView)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.labelSummary = QtWidgets.QLabel(ProjectsIssuesView)
+        self.labelSummary.setObjectName("labelSummary")
+        self.verticalLayout.addWidget(self.labelSummary)
+        self.treeIssues = QtWidgets.QTreeWidget(ProjectsIssuesView)
+        self.treeIssues.setRootIsDecorated(False)
+        self.treeIssues.setUniformRowHeights(True)
+        self.treeIssues.setAlternatingRowColors(True)
+        self.treeIssues.setMaximumHeight(160)
+        self.treeIssues.setObjectName("treeIssues")
+        self.verticalLayout.addWidget(self.treeIssues)
+
+        self.retranslateUi(ProjectsIssuesView)
+        QtCore.QMetaObject.connectSlotsByName(ProjectsIssuesView)
+
+    def retranslateUi(self, ProjectsIssuesView):
+        _translate = QtCore.QCoreApplication.translate
+        self.labelSummary.setText(_translate("ProjectsIssuesView", "데이터 검증 중..."))
+        self.treeIssues.headerItem().setText(0, _translate("ProjectsIssuesView", "위치"))
+        self.treeIssues.headerItem().setText(1, _translate("ProjectsIssuesView", "내용"))
@@ -1,26 +1,215 @@
+import json
+import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Literal, Dict, Any
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Literal, Dict, Any, Union, Iterator, Tuple
+
+try:  # 선택 의존성: 설치되어 있으면 더 빠른 JSON 엔진 사용
+    import orjson
+except ImportError:
+    orjson = None
 
 Status = Literal["in_progress", "completed"]
 
-@dataclass
-class Wrapper:
-    id: str
-    name: str
-    type: Literal["wrapper"]
-    status: Status
+# ---------- 레코드 압축 표현 ----------
+# Wrapper/Project 는 __dict__ 없는 __slots__ 클래스입니다.
+#  - owner/status/type/wrapper_id 는 sys.intern → 같은 값은 문자열 1개를 공유
+#  - 날짜는 "YYYY-MM-DD" 대신 date ordinal(int)로 보관, 같은 날짜는 같은 int 객체 공유
+#  - 형식이 잘못된 날짜는 원문 문자열 그대로 보관 (검증 단계에서 보고, 저장 시 그대로 기록)
+# 생성자 인자와 to_dict()/DataModel.from_json()/to_json() 형식은 dataclass 시절과 동일합니다.
+
+DateValue = Union[int, str]
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=16384)
+def _date_to_ordinal(text: str) -> DateValue:
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return date.fromisoformat(text).toordinal()
+        except ValueError:
+            pass
+    return text
+
+
+@lru_cache(maxsize=16384)
+def _ordinal_to_date(value: int) -> str:
+    return date.fromordinal(value).isoformat()
+
+
+def pack_date(value) -> DateValue:
+    """YYYY-MM-DD → ordinal (잘못된 형식은 원문 유지)"""
+    if isinstance(value, str):
+        return _date_to_ordinal(value)
+    return value
+
+
+def unpack_date(value: DateValue):
+    return _ordinal_to_date(value) if isinstance(value, int) else value
+
+
+class _Record:
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f: getattr(self, f) for f in self._fields}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]):
+        """cls(**d) 와 같은 결과. 알려진 필드만 있으면 setter 를 거치지 않는 빠른 경로 사용"""
+        if d.keys() <= cls._field_set:
+            try:
+                return cls._fast(d)
+            except KeyError:
+                pass  # 필수 필드 누락 → 생성자에서 동일한 TypeError 발생
+        return cls(**d)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    __hash__ = None  # dataclass(eq=True) 와 동일하게 unhashable
+
+    def __repr__(self):
+        args = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({args})"
+
+
+class Wrapper(_Record):
+    __slots__ = ("id", "name", "_type", "_status")
+    _fields = ("id", "name", "type", "status")
+    _field_set = frozenset(_fields)
+
+    def __init__(self, id: str, name: str, type: Literal["wrapper"], status: Status):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.status = status
+
+    @property
+    def type(self) -> str:
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        self._type = _intern(value)
+
+    @property
+    def status(self) -> Status:
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = _intern(value)
+
+    @classmethod
+    def _fast(cls, d):
+        self = object.__new__(cls)
+        self.id = d["id"]
+        self.name = d["name"]
+        self._type = _intern(d["type"])
+        self._status = _intern(d["status"])
+        return self
+
+
+class Project(_Record):
+    __slots__ = ("id", "name", "_type", "_status", "_wrapper_id", "_owner",
+                 "_start", "_end", "notes")
+    _fields = ("id", "name", "type", "status", "wrapper_id", "owner",
+               "start_date", "end_date", "notes")
+    _field_set = frozenset(_fields)
+
+    def __init__(self, id: str, name: str, type: Literal["project"], status: Status,
+                 wrapper_id: Optional[str], owner: str,
+                 start_date: str, end_date: str, notes: str = ""):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.status = status
+        self.wrapper_id = wrapper_id
+        self.owner = owner
+        self.start_date = start_date  # YYYY-MM-DD
+        self.end_date = end_date      # YYYY-MM-DD
+        self.notes = notes
+
+    @property
+    def type(self) -> str:
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        self._type = _intern(value)
+
+    @property
+    def status(self) -> Status:
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = _intern(value)
+
+    @property
+    def wrapper_id(self) -> Optional[str]:
+        return self._wrapper_id
+
+    @wrapper_id.setter
+    def wrapper_id(self, value):
+        self._wrapper_id = _intern(value)
+
+    @property
+    def owner(self) -> str:
+        return self._owner
+
+    @owner.setter
+    def owner(self, value):
+        self._owner = _intern(value)
+
+    @property
+    def start_date(self) -> str:
+        return unpack_date(self._start)
+
+    @start_date.setter
+    def start_date(self, value):
+        self._start = pack_date(value)
+
+    @property
+    def end_date(self) -> str:
+        return unpack_date(self._end)
+
+    @end_date.setter
+    def end_date(self, value):
+        self._end = pack_date(value)
+
+    # 파싱된 날짜 (형식 오류면 None)
+    @property
+    def start_ordinal(self) -> Optional[int]:
+        return self._start if isinstance(self._start, int) else None
+
+    @property
+    def end_ordinal(self) -> Optional[int]:
+        return self._end if isinstance(self._end, int) else None
+
+    @classmethod
+    def _fast(cls, d):
+        self = object.__new__(cls)
+        self.id = d["id"]
+        self.name = d["name"]
+        self._type = _intern(d["type"])
+        self._status = _intern(d["status"])
+        self._wrapper_id = _intern(d["wrapper_id"])
+        self._owner = _intern(d["owner"])
+        self._start = pack_date(d["start_date"])
+        self._end = pack_date(d["end_date"])
+        self.notes = d.get("notes", "")
+        return self
 
-@dataclass
-class Project:
-    id: str
-    name: str
-    type: Literal["project"]
-    status: Status
-    wrapper_id: Optional[str]
-    owner: str
-    start_date: str  # YYYY-MM-DD
-    end_date: str    # YYYY-MM-DD
-    notes: str = ""
 
 @dataclass
 class DataModel:
@@ -29,12 +218,131 @@ class DataModel:
 
     @staticmethod
     def from_json(obj: Dict[str, Any]) -> "DataModel":
-        wrappers = [Wrapper(**w) for w in obj.get("wrappers", [])]
-        projects = [Project(**p) for p in obj.get("projects", [])]
+        wrappers = [Wrapper.from_dict(w) for w in obj.get("wrappers", [])]
+        projects = [Project.from_dict(p) for p in obj.get("projects", [])]
         return DataModel(wrappers, projects)
 
     def to_json(self) -> Dict[str, Any]:
         return {
-            "wrappers": [w.__dict__ for w in self.wrappers],
-            "projects": [p.__dict__ for p in self.projects],
+            "wrappers": [w.to_dict() for w in self.wrappers],
+            "projects": [p.to_dict() for p in self.projects],
         }
+
+
+# ---------- JSON 코덱 ----------
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_ws(text: str, idx: int) -> int:
+    return _WS.match(text, idx).end()
+
+
+def _expect(text: str, idx: int, char: str) -> int:
+    if idx >= len(text) or text[idx] != char:
+        raise json.JSONDecodeError(f"Expecting '{char}'", text, idx)
+    return idx + 1
+
+
+class JsonCodec:
+    """Projects 데이터 JSON 인코딩/디코딩
+
+    - engine: "orjson"(설치 시) | "json". 기본은 사용 가능한 가장 빠른 엔진
+    - pretty=False: 공백 없는 compact 출력 (기본), True: indent=2
+    - 표준 json 엔진의 디코드는 레코드 단위 스트리밍(iter_records)으로 수행해
+      문서 전체의 중간 dict 목록을 만들지 않고 바로 Wrapper/Project 로 변환합니다.
+    """
+
+    def __init__(self, pretty: bool = False, engine: Optional[str] = None):
+        if engine is None:
+            engine = "orjson" if orjson is not None else "json"
+        if engine == "orjson" and orjson is None:
+            raise ValueError("orjson 이 설치되어 있지 않습니다")
+        self.engine = engine
+        self.pretty = pretty
+        self._decoder = json.JSONDecoder()
+
+    # ---------- 일반 값 ----------
+    def loads(self, text: Union[str, bytes]) -> Any:
+        if self.engine == "orjson":
+            return orjson.loads(text)
+        return json.loads(text)
+
+    def dumps(self, obj: Any) -> str:
+        if self.engine == "orjson":
+            option = orjson.OPT_INDENT_2 if self.pretty else 0
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        if self.pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=2)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    # ---------- 스트리밍 디코드 ----------
+    def iter_records(self, text: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """{"wrappers": [...], "projects": [...]} 문서를 (키, 레코드 dict) 단위로 디코드"""
+        if self.engine == "orjson":
+            # orjson 은 문서 단위 디코드가 표준 json 의 레코드 단위 디코드보다 빠름
+            for key, value in orjson.loads(text).items():
+                if isinstance(value, list):
+                    for item in value:
+                        yield key, item
+            return
+        raw_decode = self._decoder.raw_decode
+        ws = " \t\n\r"
+        idx = _expect(text, _skip_ws(text, 0), "{")
+        idx = _skip_ws(text, idx)
+        if idx < len(text) and text[idx] == "}":
+            return
+        while True:
+            key, idx = raw_decode(text, _skip_ws(text, idx))
+            idx = _expect(text, _skip_ws(text, idx), ":")
+            idx = _skip_ws(text, idx)
+            if idx < len(text) and text[idx] == "[":
+                idx = _skip_ws(text, idx + 1)
+                if idx < len(text) and text[idx] == "]":
+                    idx += 1
+                else:
+                    while True:
+                        item, idx = raw_decode(text, idx)
+                        yield key, item
+                        # compact 입력에서는 정규식 없이 구분자를 바로 확인
+                        if idx < len(text) and text[idx] in ws:
+                            idx = _skip_ws(text, idx)
+                        if idx < len(text) and text[idx] == ",":
+                            idx += 1
+                            if idx < len(text) and text[idx] in ws:
+                                idx = _skip_ws(text, idx)
+                            continue
+                        idx = _expect(text, idx, "]")
+                        break
+            else:
+                _, idx = raw_decode(text, idx)  # 배열이 아닌 최상위 값은 무시
+            idx = _skip_ws(text, idx)
+            if idx < len(text) and text[idx] == "}":
+                return
+            idx = _expect(text, idx, ",")
+
+    # ---------- DataModel ----------
+    def decode_model(self, text: Union[str, bytes]) -> DataModel:
+        if self.engine == "orjson":
+            return DataModel.from_json(orjson.loads(text))
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+        wrappers, projects = [], []
+        for key, rec in self.iter_records(text):
+            if key == "wrappers":
+                wrappers.append(Wrapper.from_dict(rec))
+            elif key == "projects":
+                projects.append(Project.from_dict(rec))
+        return DataModel(wrappers, projects)
+
+    def encode_model(self, data_model: DataModel) -> str:
+        return self.encode_snapshot(data_model.to_json())
+
+    def encode_snapshot(self, snapshot: Dict[str, Any]) -> str:
+        """to_json() 결과(dict) 인코딩. compact 출력은 레코드 단위로 이어 붙여 기록"""
+        if self.engine == "orjson" or self.pretty:
+            return self.dumps(snapshot)
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        parts = []
+        for key, records in snapshot.items():
+            parts.append(dumps(key) + ":[" + ",".join(dumps(r) for r in records) + "]")
+        return "{" + ",".join(parts) + "}"
@@ -0,0 +1,457 @@
+"""
+ProjectRepository: DataModel 위에 얹는 인덱스 저장소
+
+DataModel 의 wrappers/projects 리스트는 저장(직렬화) 순서를 그대로 유지하고,
+조회는 아래 인덱스를 통해 O(1) 로 수행합니다.
+  - id → Wrapper / Project
+  - wrapper_id → 하위 Project
+  - status → Wrapper / Wrapper 없는 Project / 전체 Project
+  - wrapper_id → 하위 Project 집계 (WrapperStats: 개수/완료 수/기간/담당자)
+모든 추가/수정/삭제는 반드시 repository 메서드를 거쳐야 인덱스가 유지됩니다.
+변경 내용은 Change 목록으로 subscribe() 한 리스너들에게 통지됩니다.
+batch() 블록 안의 변경은 블록이 끝날 때 한 번에 통지됩니다 (일괄 작업 → 저장/트리 갱신 1회).
+새 레코드 ID 는 new_id()/new_ids() 로 할당합니다 (prj_ids, id 인덱스로 중복 확인).
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .prj_ids import IdAllocator
+from .prj_models import DataModel, Project, Wrapper
+
+STATUSES = ("in_progress", "completed")
+_PROJECT_INDEX_KEYS = ("status", "wrapper_id")
+# wrapper 집계에만 영향을 주는 프로젝트 필드 (인덱스 키 변경 시에는 재색인으로 함께 갱신)
+_STATS_KEYS = ("owner", "start_date", "end_date")
+
+
+@dataclass
+class Change:
+    """단일 레코드 변경 내역
+
+    op: "add" | "update" | "delete"
+    kind: "wrapper" | "project"
+    before/after: add 는 after 에 전체 필드, delete 는 before 에 전체 필드,
+                  update 는 바뀐 필드만 이전/이후 값으로 담습니다.
+    source: "local"(이 프로그램에서 편집) | "external"(다른 사용자가 저장한 파일 변경 병합)
+    """
+    op: str
+    kind: str
+    record_id: str
+    before: Dict[str, Any] = field(default_factory=dict)
+    after: Dict[str, Any] = field(default_factory=dict)
+    source: str = "local"
+
+
+def _remove_identity(items: list, obj) -> None:
+    """== 비교(필드 전체 비교) 대신 객체 identity 로 리스트에서 제거"""
+    for i, x in enumerate(items):
+        if x is obj:
+            del items[i]
+            return
+
+
+def _diff_fields(obj, fields: Dict[str, Any]):
+    """실제로 값이 바뀌는 필드만 (이전값, 새값) dict 로 분리"""
+    before, after = {}, {}
+    for key, value in fields.items():
+        old = getattr(obj, key)
+        if old != value:
+            before[key] = old
+            after[key] = value
+    return before, after
+
+
+class WrapperStats:
+    """Wrapper 하위 프로젝트 집계. 프로젝트 추가/수정/삭제 때마다 증분 갱신
+
+    시작일/종료일은 날짜별 개수로 보관해 최소/최대값이 빠져도 전체 재조회 없이 갱신
+    (최소/최대는 조회 시 필요할 때만 다시 계산)
+    """
+    __slots__ = ("total", "completed", "owners", "_starts", "_ends", "_start_min", "_end_max")
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+        self.owners: Dict[str, int] = {}    # 담당자 → 프로젝트 수
+        self._starts: Dict[int, int] = {}   # 시작일 ordinal → 프로젝트 수
+        self._ends: Dict[int, int] = {}
+        self._start_min: Optional[int] = None
+        self._end_max: Optional[int] = None
+
+    @property
+    def in_progress(self) -> int:
+        return self.total - self.completed
+
+    @property
+    def progress(self) -> int:
+        """완료율 (%)"""
+        return int(self.completed / self.total * 100) if self.total else 0
+
+    @property
+    def all_completed(self) -> bool:
+        return self.total > 0 and self.completed == self.total
+
+    @property
+    def start_min(self) -> Optional[int]:
+        """가장 이른 시작일 (date ordinal, 유효한 날짜가 없으면 None)"""
+        if self._start_min is None and self._starts:
+            self._start_min = min(self._starts)
+        return self._start_min
+
+    @property
+    def end_max(self) -> Optional[int]:
+        """가장 늦은 종료일 (date ordinal)"""
+        if self._end_max is None and self._ends:
+            self._end_max = max(self._ends)
+        return self._end_max
+
+    def add(self, p: Project):
+        self.total += 1
+        if p.status == "completed":
+            self.completed += 1
+        self.owners[p.owner] = self.owners.get(p.owner, 0) + 1
+        start, end = p.start_ordinal, p.end_ordinal
+        if start is not None:
+            self._starts[start] = self._starts.get(start, 0) + 1
+            if self._start_min is not None and start < self._start_min:
+                self._start_min = start
+        if end is not None:
+            self._ends[end] = self._ends.get(end, 0) + 1
+            if self._end_max is not None and end > self._end_max:
+                self._end_max = end
+
+    def remove(self, p: Project):
+        self.total -= 1
+        if p.status == "completed":
+            self.completed -= 1
+        _decrement(self.owners, p.owner)
+        start, end = p.start_ordinal, p.end_ordinal
+        if start is not None and _decrement(self._starts, start) and start == self._start_min:
+            self._start_min = None
+        if end is not None and _decrement(self._ends, end) and end == self._end_max:
+            self._end_max = None
+
+
+def _decrement(counts: Dict, key) -> bool:
+    """개수 1 감소, 0 이 되어 키가 사라지면 True"""
+    n = counts.get(key, 0) - 1
+    if n > 0:
+        counts[key] = n
+        return False
+    counts.pop(key, None)
+    return True
+
+
+_EMPTY_STATS = WrapperStats()
+
+
+class ProjectRepository:
+    def __init__(self, data_model: DataModel):
+        self.data_model = data_model
+        self._listeners: List[Callable[[List[Change]], None]] = []
+        self._batch_depth = 0
+        self._batch_changes: List[Change] = []
+        self._source = "local"
+        self._ids = IdAllocator(self.has_id)
+        self._rebuild_indexes()
+
+    # ---------- 변경 통지 ----------
+    def subscribe(self, listener: Callable[[List[Change]], None]):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[List[Change]], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, changes: List[Change]):
+        if not changes:
+            return
+        if self._source != "local":
+            for c in changes:
+                c.source = self._source
+        if self._batch_depth:
+            self._batch_changes.extend(changes)
+            return
+        for listener in list(self._listeners):
+            listener(changes)
+
+    @contextmanager
+    def batch(self):
+        """블록 안의 변경을 모아 블록 종료 시 한 번에 통지 (중첩 시 가장 바깥 블록에서 통지)
+
+        예외로 블록을 빠져나가도 이미 적용된 변경은 통지되어 리스너와 상태가 어긋나지 않음
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                changes, self._batch_changes = self._batch_changes, []
+                self._notify(changes)
+
+    @contextmanager
+    def merging(self):
+        """외부 변경 병합 블록: 변경은 source="external" 로 한 번에 통지 (저장/실행 취소 대상 아님)"""
+        outer, self._source = self._source, "external"
+        try:
+            with self.batch():
+                yield self
+        finally:
+            self._source = outer
+
+    # ---------- 인덱스 ----------
+    def _rebuild_indexes(self):
+        # dict 를 순서 있는 집합으로 사용 (삽입 순서 유지 + O(1) 삭제)
+        self._wrappers: Dict[str, Wrapper] = {}
+        self._projects: Dict[str, Project] = {}
+        self._children: Dict[str, Dict[str, Project]] = {}
+        self._wrappers_by_status: Dict[str, Dict[str, Wrapper]] = {s: {} for s in STATUSES}
+        self._loose_by_status: Dict[str, Dict[str, Project]] = {s: {} for s in STATUSES}
+        self._projects_by_status: Dict[str, Dict[str, Project]] = {s: {} for s in STATUSES}
+        self._projects_by_owner: Dict[str, Dict[str, Project]] = {}
+        self._stats: Dict[str, WrapperStats] = {}
+
+        for w in self.data_model.wrappers:
+            self._index_wrapper(w)
+        for p in self.data_model.projects:
+            self._index_project(p)
+
+    def _index_wrapper(self, w: Wrapper):
+        self._wrappers[w.id] = w
+        self._wrappers_by_status.setdefault(w.status, {})[w.id] = w
+
+    def _unindex_wrapper(self, w: Wrapper):
+        self._wrappers.pop(w.id, None)
+        self._wrappers_by_status.get(w.status, {}).pop(w.id, None)
+
+    def _index_project(self, p: Project):
+        self._projects[p.id] = p
+        self._projects_by_status.setdefault(p.status, {})[p.id] = p
+        self._index_owner(p)
+        if p.wrapper_id:
+            children = self._children.setdefault(p.wrapper_id, {})
+            stats = self._stats_for(p.wrapper_id)
+            old = children.get(p.id)
+            if old is not None:
+                stats.remove(old)  # 중복 ID: 나중 레코드만 인덱스에 남음
+            children[p.id] = p
+            stats.add(p)
+        else:
+            self._loose_by_status.setdefault(p.status, {})[p.id] = p
+
+    def _unindex_project(self, p: Project):
+        self._projects.pop(p.id, None)
+        self._projects_by_status.get(p.status, {}).pop(p.id, None)
+        self._unindex_owner(p)
+        if p.wrapper_id:
+            children = self._children.get(p.wrapper_id)
+            if children is not None:
+                if children.pop(p.id, None) is not None:
+                    self._stats[p.wrapper_id].remove(p)
+                if not children:
+                    del self._children[p.wrapper_id]
+                    del self._stats[p.wrapper_id]
+        else:
+            self._loose_by_status.get(p.status, {}).pop(p.id, None)
+
+    def _index_owner(self, p: Project):
+        self._projects_by_owner.setdefault(p.owner, {})[p.id] = p
+
+    def _unindex_owner(self, p: Project):
+        by_owner = self._projects_by_owner.get(p.owner)
+        if by_owner is not None:
+            by_owner.pop(p.id, None)
+            if not by_owner:
+                del self._projects_by_owner[p.owner]
+
+    def _stats_for(self, wrapper_id: str) -> WrapperStats:
+        stats = self._stats.get(wrapper_id)
+        if stats is None:
+            stats = self._stats[wrapper_id] = WrapperStats()
+        return stats
+
+    # ---------- 조회 ----------
+    def get_project(self, project_id: str) -> Optional[Project]:
+        return self._projects.get(project_id)
+
+    def get_wrapper(self, wrapper_id: str) -> Optional[Wrapper]:
+        return self._wrappers.get(wrapper_id)
+
+    def has_id(self, record_id: str) -> bool:
+        return record_id in self._wrappers or record_id in self._projects
+
+    def new_id(self, kind: str) -> str:
+        """새 레코드 ID (kind: "wrapper" → w..., "project" → p...)"""
+        return self._ids.new_id(kind[0])
+
+    def new_ids(self, kind: str, n: int) -> List[str]:
+        """새 레코드 ID n 개 (가져오기 등 대량 추가용)"""
+        return self._ids.block(kind[0], n)
+
+    def wrappers(self) -> List[Wrapper]:
+        return list(self._wrappers.values())
+
+    def projects(self) -> List[Project]:
+        return list(self._projects.values())
+
+    def children_of(self, wrapper_id: str) -> List[Project]:
+        """Wrapper 하위 프로젝트 목록"""
+        return list(self._children.get(wrapper_id, {}).values())
+
+    def wrapper_stats(self, wrapper_id: str) -> WrapperStats:
+        """하위 프로젝트 집계 (O(1), 반환값은 읽기 전용으로 사용)"""
+        return self._stats.get(wrapper_id, _EMPTY_STATS)
+
+    def has_children(self, wrapper_id: str) -> bool:
+        return bool(self._children.get(wrapper_id))
+
+    def count_children(self, wrapper_id: str) -> int:
+        return len(self._children.get(wrapper_id, ()))
+
+    def count_status_children(self, status: str) -> int:
+        """상태 루트 바로 아래 항목 수 (wrapper + wrapper 없는 프로젝트)"""
+        return (len(self._wrappers_by_status.get(status, ())) +
+                len(self._loose_by_status.get(status, ())))
+
+    def wrappers_by_status(self, status: str) -> List[Wrapper]:
+        return list(self._wrappers_by_status.get(status, {}).values())
+
+    def loose_projects(self, status: str) -> List[Project]:
+        """Wrapper 에 속하지 않은 상태별 프로젝트 목록"""
+        return list(self._loose_by_status.get(status, {}).values())
+
+    def projects_by_status(self, status: str) -> List[Project]:
+        return list(self._projects_by_status.get(status, {}).values())
+
+    # id 목록 (레코드 객체를 거치지 않는 트리 로드용, 표시 순서와 동일)
+    def wrapper_ids_by_status(self, status: str) -> List[str]:
+        return list(self._wrappers_by_status.get(status, {}))
+
+    def loose_project_ids(self, status: str) -> List[str]:
+        return list(self._loose_by_status.get(status, {}))
+
+    def child_ids(self, wrapper_id: str) -> List[str]:
+        return list(self._children.get(wrapper_id, {}))
+
+    def project_ids_by_status(self, status: str) -> List[str]:
+        return list(self._projects_by_status.get(status, {}))
+
+    def project_ids_by_owner(self, owner: str) -> List[str]:
+        return list(self._projects_by_owner.get(owner, {}))
+
+    def owners(self) -> List[str]:
+        """프로젝트 담당자 목록 (정렬)"""
+        return sorted(self._projects_by_owner)
+
+    # ---------- 변경 ----------
+    def add_wrapper(self, wrapper: Wrapper) -> Wrapper:
+        if wrapper.id in self._wrappers:
+            raise ValueError(f"중복된 Wrapper ID: {wrapper.id}")
+        self.data_model.wrappers.append(wrapper)
+        self._index_wrapper(wrapper)
+        self._notify([Change("add", "wrapper", wrapper.id, after=wrapper.to_dict())])
+        return wrapper
+
+    def add_project(self, project: Project) -> Project:
+        if project.id in self._projects:
+            raise ValueError(f"중복된 Project ID: {project.id}")
+        self.data_model.projects.append(project)
+        self._index_project(project)
+        self._notify([Change("add", "project", project.id, after=project.to_dict())])
+        return project
+
+    def update_wrapper(self, wrapper_id: str, **fields) -> Optional[Wrapper]:
+        w = self._wrappers.get(wrapper_id)
+        if w is None:
+            return None
+        before, after = _diff_fields(w, fields)
+        if not after:
+            return w
+        reindex = "status" in after
+        if reindex:
+            self._unindex_wrapper(w)
+        for key, value in after.items():
+            setattr(w, key, value)
+        if reindex:
+            self._index_wrapper(w)
+        self._notify([Change("update", "wrapper", wrapper_id, before, after)])
+        return w
+
+    def update_project(self, project_id: str, **fields) -> Optional[Project]:
+        p = self._projects.get(project_id)
+        if p is None:
+            return None
+        before, after = _diff_fields(p, fields)
+        if not after:
+            return p
+        # 인덱스 키(status/wrapper_id)가 바뀔 때만 재색인하여 형제 순서를 유지
+        reindex = any(k in after for k in _PROJECT_INDEX_KEYS)
+        # 담당자만 바뀌면 담당자 인덱스만 갱신
+        reowner = "owner" in after and not reindex
+        # 담당자/날짜만 바뀌면 wrapper 집계만 갱신
+        restat = not reindex and p.wrapper_id in self._stats and any(k in after for k in _STATS_KEYS)
+        if reindex:
+            self._unindex_project(p)
+        elif reowner:
+            self._unindex_owner(p)
+        if restat:
+            self._stats[p.wrapper_id].remove(p)
+        for key, value in after.items():
+            setattr(p, key, value)
+        if reindex:
+            self._index_project(p)
+        elif reowner:
+            self._index_owner(p)
+        if restat:
+            self._stats[p.wrapper_id].add(p)
+        self._notify([Change("update", "project", project_id, before, after)])
+        return p
+
+    def delete_wrapper(self, wrapper_id: str) -> Optional[Wrapper]:
+        w = self._wrappers.get(wrapper_id)
+        if w is None:
+            return None
+        self._unindex_wrapper(w)
+        _remove_identity(self.data_model.wrappers, w)
+        self._notify([Change("delete", "wrapper", wrapper_id, before=w.to_dict())])
+        return w
+
+    def delete_project(self, project_id: str) -> Optional[Project]:
+        p = self._projects.get(project_id)
+        if p is None:
+            return None
+        self._unindex_project(p)
+        _remove_identity(self.data_model.projects, p)
+        self._notify([Change("delete", "project", project_id, before=p.to_dict())])
+        return p
+
+    # ---------- 변경 재적용 (실행 취소/다시 실행) ----------
+    def apply_changes(self, changes: List[Change], reverse: bool = False):
+        """Change 목록을 다시 적용 (reverse=True 면 역순으로 되돌림)
+
+        add/delete 는 Change 에 담긴 전체 필드로 레코드를 다시 만들고, update 는 바뀐 필드만 적용.
+        적용 결과는 일반 변경과 같이 리스너에 통지됩니다. 복원된 레코드는 목록 끝에 추가됩니다.
+        """
+        for c in (reversed(changes) if reverse else changes):
+            op = c.op
+            if reverse:
+                op = {"add": "delete", "delete": "add"}.get(op, op)
+            fields = c.before if reverse else c.after
+            if op == "add":
+                data = c.after if c.op == "add" else c.before
+                if c.kind == "wrapper":
+                    self.add_wrapper(Wrapper.from_dict(data))
+                else:
+                    self.add_project(Project.from_dict(data))
+            elif op == "delete":
+                if c.kind == "wrapper":
+                    self.delete_wrapper(c.record_id)
+                else:
+                    self.delete_project(c.record_id)
+            elif c.kind == "wrapper":
+                self.update_wrapper(c.record_id, **fields)
+            else:
+                self.update_project(c.record_id, **fields)
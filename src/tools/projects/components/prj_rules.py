@@ -0,0 +1,51 @@
+"""
+Projects 데이터 검증 규칙 (Qt 비의존)
+
+- projects.schema.json 검사(prj_schema) + 스키마로 표현할 수 없는 규칙
+  (존재하지 않는 날짜, 없는 wrapper 참조, 중복 ID)
+- GUI 백그라운드 검증(prj_validation)과 CLI/엔진(engine)이 함께 사용
+"""
+
+import re
+from collections import Counter
+from typing import Callable, List
+
+from .prj_models import Project
+from .prj_schema import CompiledSchema, Violation
+
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def check_dates(p: Project, path: str, out: List[Violation]):
+    # 패턴(YYYY-MM-DD)은 맞지만 존재하지 않는 날짜 (예: 2025-02-30)
+    for field, ordinal in (("start_date", p.start_ordinal), ("end_date", p.end_ordinal)):
+        value = getattr(p, field)
+        if ordinal is None and isinstance(value, str) and _ISO_DATE.match(value):
+            out.append(Violation(f"{path}.{field}", f"존재하지 않는 날짜: {value!r}", "project", p.id))
+
+
+def check_wrapper_ref(p: Project, has_wrapper: Callable[[str], bool], path: str, out: List[Violation]):
+    if p.wrapper_id and not has_wrapper(p.wrapper_id):
+        out.append(Violation(f"{path}.wrapper_id",
+                             f"존재하지 않는 wrapper 참조: {p.wrapper_id!r} (트리에 표시되지 않음)",
+                             "project", p.id))
+
+
+def validate_records(schema: CompiledSchema, wrappers, projects) -> List[Violation]:
+    """Wrapper/Project 목록 전체 검증 (스키마 + 날짜/참조/중복 ID 규칙)"""
+    out: List[Violation] = []
+    wrapper_ids = set()
+    for i, w in enumerate(wrappers):
+        out.extend(schema.validate_record("wrapper", w.to_dict(), f"wrappers[{i}]"))
+        wrapper_ids.add(w.id)
+    for i, p in enumerate(projects):
+        path = f"projects[{i}]"
+        out.extend(schema.validate_record("project", p.to_dict(), path))
+        check_dates(p, path, out)
+        check_wrapper_ref(p, wrapper_ids.__contains__, path, out)
+
+    for kind, records in (("wrapper", wrappers), ("project", projects)):
+        for rid, n in Counter(r.id for r in records).items():
+            if n > 1:
+                out.append(Violation(f"{kind}s", f"중복 ID {rid!r} ({n}건, 하나만 표시됨)", kind, rid))
+    return out
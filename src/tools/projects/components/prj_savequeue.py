@@ -0,0 +1,90 @@
+"""
+SaveQueue: Projects 저장 파이프라인 (비동기 + 디바운스)
+
+- enqueue(changes): 변경을 모아 두고 짧은 대기 시간(delay_ms) 안의 저장 요청을 1회로 합침
+- 실제 디스크 기록은 전용 QThread 의 작업자가 수행 → GUI 스레드는 디스크를 기다리지 않음
+  (변경분만 넘김. 전체 스냅샷이 필요한 기록/압축은 저장소가 작업 스레드에서 디스크 상태로 만듦)
+- 결과는 saved(int) / failed(str) 신호로 통지
+- 앱 종료(aboutToQuit) 시 남은 변경을 기록하고 스레드를 정리
+"""
+
+from PyQt5.QtCore import (QObject, QThread, QTimer, QMetaObject, QCoreApplication,
+                          Qt, pyqtSignal, pyqtSlot)
+
+
+class _SaveWorker(QObject):
+    done = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, storage):
+        super().__init__()
+        self.storage = storage
+
+    @pyqtSlot(object)
+    def write(self, changes):
+        try:
+            self.storage.commit(changes)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(len(changes))
+
+    @pyqtSlot()
+    def drain(self):
+        """BlockingQueuedConnection 으로 호출 → 이전에 쌓인 write 가 모두 끝났음을 보장"""
+        self.storage.close()
+
+
+class SaveQueue(QObject):
+    saved = pyqtSignal(int)    # 기록된 변경 수
+    failed = pyqtSignal(str)   # 오류 메시지
+
+    _writeRequested = pyqtSignal(object)
+
+    def __init__(self, storage, delay_ms: int = 300, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self._pending = []
+        self._closed = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+        self._thread = QThread()
+        self._thread.setObjectName("ProjectsSaveThread")
+        self._worker = _SaveWorker(storage)
+        self._worker.moveToThread(self._thread)
+        self._writeRequested.connect(self._worker.write)
+        self._worker.done.connect(self.saved)
+        self._worker.failed.connect(self.failed)
+        self._thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def enqueue(self, changes):
+        """변경 저장 요청. 대기 시간 안에 들어온 요청은 한 번의 기록으로 합쳐짐"""
+        if self._closed:
+            return
+        self._pending.extend(changes)
+        self._timer.start()  # 재시작 → 마지막 요청 기준으로 대기
+
+    def flush(self):
+        self._timer.stop()
+        if not self._pending:
+            return
+        changes, self._pending = self._pending, []
+        self._writeRequested.emit(changes)
+
+    def shutdown(self):
+        """남은 변경 기록 후 작업 스레드 종료 (중복 호출 안전)"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        QMetaObject.invokeMethod(self._worker, "drain", Qt.BlockingQueuedConnection)
+        self._thread.quit()
+        self._thread.wait()
@@ -0,0 +1,225 @@
+"""
+projects.schema.json 검증기
+
+JSON Schema(draft-07) 중 projects.schema.json 이 사용하는 키워드
+(type, required, properties, items, enum, const, pattern)만 지원합니다.
+스키마는 compile_schema() 로 한 번만 검사 함수(클로저) 트리로 컴파일하고,
+이후 레코드마다 스키마 dict 를 다시 해석하지 않습니다.
+
+각 스키마 노드는 두 가지로 컴파일됩니다.
+  - 판정 함수(_compile_pred): 경로 문자열 없이 통과 여부만 계산 (대부분의 레코드)
+  - 검사 함수(_compile): 판정이 실패한 값에 대해서만 경로/메시지가 있는 위반 목록 생성
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# (값, 경로, 위반 목록) → None
+Check = Callable[[Any, str, List["Violation"]], None]
+
+
+@dataclass
+class Violation:
+    path: str                         # 예: projects[3].start_date
+    message: str
+    kind: Optional[str] = None        # "wrapper" | "project" | None(문서 전체)
+    record_id: Optional[str] = None
+
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+# isinstance 한 번으로 판정 가능한 타입 (integer/number 는 bool 제외가 필요해 별도 처리)
+_SIMPLE_TYPES = {"object": dict, "array": list, "string": str, "boolean": bool, "null": type(None)}
+
+
+def _compile_pred(schema: Dict[str, Any]) -> Callable[[Any], bool]:
+    preds: List[Callable[[Any], bool]] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if all(n in _SIMPLE_TYPES for n in names):
+            types = tuple(_SIMPLE_TYPES[n] for n in names)
+            preds.append(lambda v, types=types: isinstance(v, types))
+        else:
+            type_preds = tuple(_TYPE_CHECKS[n] for n in names)
+            preds.append(lambda v, ps=type_preds: any(p(v) for p in ps))
+
+    if "const" in schema:
+        preds.append(lambda v, const=schema["const"]: v == const)
+
+    if "enum" in schema:
+        preds.append(frozenset(schema["enum"]).__contains__)
+
+    if "pattern" in schema:
+        search = re.compile(schema["pattern"]).search
+        preds.append(lambda v, search=search: not isinstance(v, str) or search(v) is not None)
+
+    if "required" in schema:
+        required = frozenset(schema["required"])
+        preds.append(lambda v, required=required: not isinstance(v, dict) or required <= v.keys())
+
+    if "properties" in schema:
+        props = tuple((k, _compile_pred(s)) for k, s in schema["properties"].items())
+
+        def pred_props(v, props=props):
+            if isinstance(v, dict):
+                for key, ok in props:
+                    if key in v and not ok(v[key]):
+                        return False
+            return True
+        preds.append(pred_props)
+
+    if "items" in schema:
+        item_ok = _compile_pred(schema["items"])
+        preds.append(lambda v, ok=item_ok: not isinstance(v, list) or all(map(ok, v)))
+
+    if not preds:
+        return lambda v: True
+    if len(preds) == 1:
+        return preds[0]
+    preds = tuple(preds)
+    return lambda v, preds=preds: all(p(v) for p in preds)
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    ok = _compile_pred(schema)
+    checks: List[Check] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        preds = [_TYPE_CHECKS[n] for n in names]
+        expected = "|".join(names)
+
+        def check_type(v, path, out, preds=preds, expected=expected):
+            if not any(p(v) for p in preds):
+                out.append(Violation(path, f"타입 오류: {expected} 필요, {type(v).__name__} 입력"))
+        checks.append(check_type)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(v, path, out, const=const):
+            if v != const:
+                out.append(Violation(path, f"값은 {const!r} 이어야 함 (입력: {v!r})"))
+        checks.append(check_const)
+
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+
+        def check_enum(v, path, out, allowed=allowed):
+            if v not in allowed:
+                out.append(Violation(path, f"허용되지 않은 값: {v!r} (허용: {sorted(allowed)})"))
+        checks.append(check_enum)
+
+    if "pattern" in schema:
+        regex = re.compile(schema["pattern"])
+
+        def check_pattern(v, path, out, regex=regex):
+            if isinstance(v, str) and not regex.search(v):
+                out.append(Violation(path, f"형식 오류: {v!r} (패턴 {regex.pattern})"))
+        checks.append(check_pattern)
+
+    if "required" in schema:
+        required = tuple(schema["required"])
+
+        def check_required(v, path, out, required=required):
+            if isinstance(v, dict):
+                for key in required:
+                    if key not in v:
+                        out.append(Violation(f"{path}.{key}" if path else key, "필수 필드 누락"))
+        checks.append(check_required)
+
+    if "properties" in schema:
+        props = {k: _compile(s) for k, s in schema["properties"].items()}
+
+        def check_props(v, path, out, props=props):
+            if isinstance(v, dict):
+                for key, sub in props.items():
+                    if key in v:
+                        sub(v[key], f"{path}.{key}" if path else key, out)
+        checks.append(check_props)
+
+    if "items" in schema:
+        item_check = _compile(schema["items"])
+
+        def check_items(v, path, out, item_check=item_check):
+            if isinstance(v, list):
+                for i, item in enumerate(v):
+                    item_check(item, f"{path}[{i}]", out)
+        checks.append(check_items)
+
+    def check_all(v, path, out, ok=ok, checks=tuple(checks)):
+        if ok(v):
+            return
+        for c in checks:
+            c(v, path, out)
+    return check_all
+
+
+class CompiledSchema:
+    """컴파일된 projects 스키마. 문서 전체 또는 레코드 단위로 검증"""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self._document = _compile(schema)
+        props = schema.get("properties", {})
+        # 레코드 단위 검사기 (가져오기/증분 검증용)
+        self._records = {
+            "wrapper": _compile(props.get("wrappers", {}).get("items", {})),
+            "project": _compile(props.get("projects", {}).get("items", {})),
+        }
+
+    def validate(self, obj: Dict[str, Any]) -> List[Violation]:
+        out: List[Violation] = []
+        self._document(obj, "", out)
+        _attach_record_ids(obj, out)
+        return out
+
+    def validate_record(self, kind: str, record: Dict[str, Any], path: str = "") -> List[Violation]:
+        out: List[Violation] = []
+        self._records[kind](record, path or kind, out)
+        for v in out:
+            v.kind = kind
+            v.record_id = record.get("id") if isinstance(record, dict) else None
+        return out
+
+
+_RECORD_PATH = re.compile(r"^(wrappers|projects)\[(\d+)\]")
+
+
+def _attach_record_ids(obj: Dict[str, Any], violations: List[Violation]):
+    for v in violations:
+        m = _RECORD_PATH.match(v.path)
+        if not m:
+            continue
+        table, i = m.group(1), int(m.group(2))
+        v.kind = "wrapper" if table == "wrappers" else "project"
+        try:
+            record = obj[table][i]
+            v.record_id = record.get("id") if isinstance(record, dict) else None
+        except (KeyError, IndexError, TypeError):
+            pass
+
+
+_compiled_cache: Dict[str, CompiledSchema] = {}
+
+
+def load_schema(path: Path) -> CompiledSchema:
+    """스키마 파일을 읽어 컴파일 (경로별 1회 캐시)"""
+    key = str(Path(path).resolve())
+    if key not in _compiled_cache:
+        schema = json.loads(Path(path).read_text(encoding="utf-8"))
+        _compiled_cache[key] = CompiledSchema(schema)
+    return _compiled_cache[key]
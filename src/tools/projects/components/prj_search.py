@@ -0,0 +1,222 @@
+"""
+Projects 전문 검색 (문자 n-gram 역색인)
+
+- 색인 대상: Project(name, owner, notes, id), Wrapper(name, id)
+- 한국어는 형태소 분석 없이 문자 2-gram(bigram)으로 색인 → 부분 문자열 검색 가능
+  (예: "프로젝트" → 프로/로젝/젝트). 1글자 검색어는 정규화된 본문을 직접 검사
+- 검색어는 공백으로 나눈 모든 단어를 포함하는 레코드(AND)를 반환
+- bigram 후보는 본문 포함 여부로 한 번 더 확인 → 결과는 부분 문자열 검색과 동일
+- ProjectRepository 변경 통지로 바뀐 레코드만 재색인 (전체 재색인 없음)
+- 최초 색인은 SearchIndexer 가 작업 스레드에서 생성, 그동안의 검색은 전체 검사로 처리
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QObject, QThread, QCoreApplication, pyqtSignal, pyqtSlot
+
+Key = Tuple[str, str]  # (kind, record_id)
+
+SEARCH_FIELDS = {
+    "wrapper": ("name", "id"),
+    "project": ("name", "owner", "notes", "id"),
+}
+
+
+def normalize(text: str) -> str:
+    """NFKC 정규화 + 대소문자 무시 (한글 자모 조합형/완성형 차이 제거)"""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def record_text(kind: str, record) -> str:
+    # 필드 경계를 넘는 일치가 생기지 않도록 줄바꿈으로 연결
+    return normalize("\n".join(getattr(record, f) or "" for f in SEARCH_FIELDS[kind]))
+
+
+def bigrams(text: str) -> Set[str]:
+    grams = set()
+    for token in text.split():
+        grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+class SearchIndex:
+    """레코드 키 → 정규화 본문, bigram → 레코드 키 집합"""
+
+    def __init__(self):
+        self._texts: Dict[Key, str] = {}
+        self._postings: Dict[str, Set[Key]] = {}
+
+    @classmethod
+    def build(cls, wrappers: Iterable, projects: Iterable) -> "SearchIndex":
+        index = cls()
+        for w in wrappers:
+            index.add("wrapper", w)
+        for p in projects:
+            index.add("project", p)
+        return index
+
+    def __len__(self):
+        return len(self._texts)
+
+    # ---------- 색인 갱신 ----------
+    def add(self, kind: str, record):
+        key = (kind, record.id)
+        if key in self._texts:
+            self.remove(key)
+        text = record_text(kind, record)
+        self._texts[key] = text
+        postings = self._postings
+        for g in bigrams(text):
+            bucket = postings.get(g)
+            if bucket is None:
+                postings[g] = bucket = set()
+            bucket.add(key)
+
+    def remove(self, key: Key):
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for g in bigrams(text):
+            bucket = self._postings.get(g)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._postings[g]
+
+    def apply(self, changes, repo):
+        """ProjectRepository 변경분 반영 (검색 필드가 바뀐 레코드만 재색인)"""
+        for c in changes:
+            key = (c.kind, c.record_id)
+            if c.op == "delete":
+                self.remove(key)
+                continue
+            if c.op == "update" and not (set(c.after or ()) & set(SEARCH_FIELDS[c.kind])):
+                continue
+            record = repo.get_wrapper(c.record_id) if c.kind == "wrapper" else repo.get_project(c.record_id)
+            if record is None:
+                self.remove(key)
+            else:
+                self.add(c.kind, record)
+
+    # ---------- 검색 ----------
+    def search(self, query: str) -> Set[Key]:
+        terms = normalize(query).split()
+        if not terms:
+            return set()
+        # 선택도가 높은(후보가 적은) 단어부터 처리해 이후 단어는 후보 안에서만 확인
+        scored = sorted((self._candidates(t), t) for t in terms if len(t) >= 2)
+        result: Optional[Set[Key]] = None
+        for _size, term in scored:
+            result = self._match_term(term, result)
+            if not result:
+                return set()
+        for term in (t for t in terms if len(t) < 2):
+            result = self._scan(term, result)
+            if not result:
+                return set()
+        return result
+
+    def _candidates(self, term: str) -> int:
+        sizes = [len(self._postings.get(g, ())) for g in bigrams(term)]
+        return min(sizes) if sizes else 0
+
+    def _match_term(self, term: str, within: Optional[Set[Key]]) -> Set[Key]:
+        buckets = sorted((self._postings.get(g, set()) for g in bigrams(term)), key=len)
+        if not buckets[0]:
+            return set()
+        candidates = buckets[0] if within is None else (buckets[0] & within)
+        for bucket in buckets[1:]:
+            candidates = candidates & bucket
+            if not candidates:
+                return set()
+        texts = self._texts
+        return {k for k in candidates if term in texts[k]}
+
+    def _scan(self, term: str, within: Optional[Set[Key]]) -> Set[Key]:
+        texts = self._texts
+        if within is None:
+            return {k for k, text in texts.items() if term in text}
+        return {k for k in within if term in texts[k]}
+
+
+def scan_repository(repo, query: str) -> Set[Key]:
+    """색인 없이 전체 레코드 검사 (색인 생성 완료 전 사용)"""
+    terms = normalize(query).split()
+    if not terms:
+        return set()
+    result = set()
+    for kind, records in (("wrapper", repo.wrappers()), ("project", repo.projects())):
+        for r in records:
+            text = record_text(kind, r)
+            if all(t in text for t in terms):
+                result.add((kind, r.id))
+    return result
+
+
+# ---------- 백그라운드 색인 ----------
+class _IndexWorker(QObject):
+    built = pyqtSignal(int, object)   # (세대 번호, SearchIndex)
+
+    @pyqtSlot(int, object, object)
+    def build(self, generation, wrappers, projects):
+        self.built.emit(generation, SearchIndex.build(wrappers, projects))
+
+
+class SearchIndexer(QObject):
+    """SearchIndex 생성/유지. 색인이 준비되면 ready 신호"""
+    ready = pyqtSignal()
+
+    _buildRequested = pyqtSignal(int, object, object)
+
+    def __init__(self, repo, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.index: Optional[SearchIndex] = None
+        self._generation = 0
+        self._backlog: List = []   # 색인 생성 중 들어온 변경 (완료 후 반영)
+
+        self._thread = QThread()
+        self._thread.setObjectName("ProjectsSearchIndexThread")
+        self._worker = _IndexWorker()
+        self._worker.moveToThread(self._thread)
+        self._buildRequested.connect(self._worker.build)
+        self._worker.built.connect(self._on_built)
+        self._thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def rebuild(self):
+        """전체 색인 재생성 요청 (로드/가져오기 직후)"""
+        self._generation += 1
+        self.index = None
+        self._backlog.clear()
+        self._buildRequested.emit(self._generation, self.repo.wrappers(), self.repo.projects())
+
+    def _on_built(self, generation, index):
+        if generation != self._generation:
+            return
+        # 작업 스레드가 읽은 뒤 바뀐 레코드는 현재 값으로 다시 색인
+        index.apply(self._backlog, self.repo)
+        self._backlog.clear()
+        self.index = index
+        self.ready.emit()
+
+    def on_changes(self, changes):
+        if self.index is None:
+            self._backlog.extend(changes)
+        else:
+            self.index.apply(changes, self.repo)
+
+    def search(self, query: str) -> Set[Key]:
+        if self.index is None:
+            return scan_repository(self.repo, query)
+        return self.index.search(query)
+
+    def shutdown(self):
+        if not self._thread.isRunning():
+            return
+        self._thread.quit()
+        self._thread.wait()
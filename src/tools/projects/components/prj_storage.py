@@ -0,0 +1,493 @@
+"""
+Projects 데이터 저장소 백엔드
+
+- JsonFileStorage: 기존 방식. 저장할 때마다 JSON 파일 전체를 다시 씀
+- JournalStorage : 스냅샷(JSON) + 추가 전용 저널(<파일>.journal)
+    · 변경 1건 = 저널 1줄 추가 (O(1) I/O)
+    · 로드 시 스냅샷 위에 저널을 재생
+    · 저널이 일정 길이를 넘으면 스냅샷으로 압축(compaction)
+    · 쓰다가 종료되어 깨진 마지막 줄은 무시 → 마지막으로 완전히 기록된 상태로 복구,
+      다음 기록 전에 그 조각을 잘라내 새 레코드가 이어 붙지 않게 함
+- SqliteStorage  : SQLite DB(<파일>.sqlite3). status/wrapper_id/owner/날짜 컬럼 인덱스,
+                   DB 가 없으면 기존 JSON 을 스키마 검증 후 1회 가져오기(migration)
+                   open_storage(on_migration_error=...) 이면 가져오기 실패 시 JournalStorage 로 대체
+
+백엔드 선택: 환경변수 UKSDT_PROJECTS_STORAGE = "journal"(기본) | "json" | "sqlite"
+스냅샷 형식: 기본 compact JSON, UKSDT_PROJECTS_JSON_PRETTY=1 이면 indent=2
+
+공통 인터페이스 (commit 은 작업 스레드에서 호출될 수 있음):
+  - load() -> DataModel
+  - commit(changes) : 변경분(Change)만 받아 기록. 전체 스냅샷이 필요하면(JSON 파일, 저널 압축)
+                      저장소가 디스크 상태에 변경분을 적용해 직접 만듦 → 호출자(GUI 스레드)는 모델을 직렬화하지 않음
+  - close()
+  - watch_paths() -> [Path] : 외부 변경 감시 대상 파일 (prj_watcher)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .prj_models import DataModel, JsonCodec, Project, Wrapper
+from .prj_schema import load_schema
+
+STORAGE_ENV = "UKSDT_PROJECTS_STORAGE"
+PRETTY_ENV = "UKSDT_PROJECTS_JSON_PRETTY"
+_TAIL_CHUNK = 64 * 1024   # 저널 끝 검사 시 뒤에서부터 읽는 단위
+
+
+def atomic_write_text(path: Path, text: str):
+    """임시 파일에 쓴 뒤 rename → 쓰는 도중 중단되어도 기존 파일은 손상되지 않음"""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _change_record(c) -> Dict[str, Any]:
+    """Change → 저널 레코드 dict"""
+    rec = {"op": c.op, "kind": c.kind, "id": c.record_id}
+    if c.op != "delete":
+        rec["data"] = c.after
+    return rec
+
+
+def _apply_record(tables: Dict[str, Dict[str, Dict[str, Any]]], rec: Dict[str, Any]) -> bool:
+    """저널 레코드 1건을 tables(kind → id → 레코드 dict)에 적용. 알 수 없는 kind 면 False"""
+    table = tables.get(rec.get("kind"))
+    if table is None:
+        return False
+    op, rid = rec.get("op"), rec.get("id")
+    if op == "add":
+        table[rid] = dict(rec.get("data", {}))
+    elif op == "update":
+        if rid in table:
+            table[rid].update(rec.get("data", {}))
+    elif op == "delete":
+        table.pop(rid, None)
+    return True
+
+
+def _read_snapshot_tables(codec: JsonCodec, path: Path) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    tables = {"wrapper": {}, "project": {}}
+    for key, rec in codec.iter_records(path.read_text(encoding="utf-8")):
+        if key == "wrappers":
+            tables["wrapper"][rec["id"]] = rec
+        elif key == "projects":
+            tables["project"][rec["id"]] = rec
+    return tables
+
+
+def _tables_to_snapshot(tables: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    return {"wrappers": list(tables["wrapper"].values()), "projects": list(tables["project"].values())}
+
+
+class JsonFileStorage:
+    """JSON 스냅샷 파일 하나만 사용하는 저장소
+
+    commit 은 파일을 다시 읽어 변경분을 적용한 뒤 전체를 다시 씀 (저장 작업 스레드에서 수행)
+    """
+
+    def __init__(self, path: Path, codec: Optional[JsonCodec] = None):
+        self.path = Path(path)
+        self.codec = codec or JsonCodec()
+        self._lock = threading.Lock()
+
+    def load(self) -> DataModel:
+        return self.codec.decode_model(self.path.read_text(encoding="utf-8"))
+
+    def commit(self, changes) -> None:
+        if not changes:
+            return
+        with self._lock:
+            tables = _read_snapshot_tables(self.codec, self.path)
+            for c in changes:
+                _apply_record(tables, _change_record(c))
+            atomic_write_text(self.path, self.codec.encode_snapshot(_tables_to_snapshot(tables)))
+
+    def close(self):
+        pass
+
+    def watch_paths(self) -> List[Path]:
+        return [self.path]
+
+
+class JournalStorage:
+    """스냅샷 + 추가 전용 저널 저장소
+
+    저널 레코드 (한 줄 = JSON 1개):
+      {"op": "add",    "kind": "project", "id": "p1", "data": {...전체 필드}}
+      {"op": "update", "kind": "project", "id": "p1", "data": {...바뀐 필드}}
+      {"op": "delete", "kind": "project", "id": "p1"}
+    모든 레코드는 '값 설정/삭제'이므로 같은 레코드를 다시 재생해도 결과가 같습니다.
+
+    압축(전체 스냅샷 기록)은 저널이 compact_every 건과 스냅샷 레코드 수의 1/COMPACT_DIVISOR 중
+    큰 값에 도달할 때 commit 안에서 수행 → 대량 추가(가져오기) 중에도 압축 비용은 데이터 크기에 비례해 분산.
+    압축 스냅샷은 디스크의 스냅샷 + 저널을 재생해 만들며, 기록/압축과 레코드 수 갱신은 모두 _lock 안에서 수행
+    """
+    COMPACT_DIVISOR = 4
+
+    def __init__(self, path: Path, compact_every: int = 500, codec: Optional[JsonCodec] = None):
+        self.path = Path(path)
+        self.codec = codec or JsonCodec()
+        self._line_codec = JsonCodec(pretty=False, engine=self.codec.engine)  # 저널은 항상 한 줄 1레코드
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        # 압축 중인 저널 세그먼트 (압축 완료 후 삭제)
+        self.compacting_path = self.path.with_name(self.path.name + ".journal.compacting")
+        self.compact_every = compact_every
+        self._fh = None
+        self._records = 0
+        self._snapshot_records = 0
+        self._lock = threading.Lock()
+
+    # ---------- load ----------
+    def load(self) -> DataModel:
+        tables = self.load_tables()
+        return DataModel.from_json({
+            "wrappers": list(tables["wrapper"].values()),
+            "projects": list(tables["project"].values()),
+        })
+
+    def load_tables(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """스냅샷 + 저널 재생 결과 (kind → id → 레코드 dict)"""
+        with self._lock:
+            tables, self._snapshot_records, self._records = self._read_tables()
+        return tables
+
+    def _read_tables(self):
+        """(tables, 스냅샷 레코드 수, 저널 레코드 수). _lock 안에서 호출"""
+        tables = _read_snapshot_tables(self.codec, self.path)
+        snapshot_records = len(tables["wrapper"]) + len(tables["project"])
+        # 압축 도중 종료된 경우 이전 세그먼트부터 재생
+        records = 0
+        for journal in (self.compacting_path, self.journal_path):
+            if journal.exists():
+                with open(journal, "r", encoding="utf-8") as f:
+                    records += self.replay_lines(f, tables, journal.name)
+        return tables, snapshot_records, records
+
+    def replay_lines(self, lines, tables: Dict[str, Dict[str, Dict[str, Any]]],
+                     source: str = "", touched: Optional[set] = None) -> int:
+        """저널 줄들을 tables 에 적용. touched 를 주면 바뀐 (kind, id) 를 모음"""
+        count = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = self.codec.loads(line)
+            except ValueError:
+                # 기록 중 중단된 마지막 줄
+                print(f"[WARN] 손상된 저널 레코드 무시: {source}")
+                continue
+            if not _apply_record(tables, rec):
+                continue
+            if touched is not None:
+                touched.add((rec["kind"], rec.get("id")))
+            count += 1
+        return count
+
+    # ---------- commit ----------
+    def _needs_compaction(self) -> bool:
+        threshold = max(self.compact_every, self._snapshot_records // self.COMPACT_DIVISOR)
+        return self._records >= threshold
+
+    def commit(self, changes) -> None:
+        """변경분을 저널에 추가하고, 저널이 길어졌으면 이어서 압축"""
+        if not changes:
+            return
+        lines = [self._line_codec.dumps(_change_record(c)) for c in changes]
+        with self._lock:
+            self._append(lines)
+            if self._needs_compaction():
+                self._compact()
+
+    def _append(self, lines: List[str]):
+        if self._fh is None:
+            self._repair_tail()
+            self._fh = open(self.journal_path, "a", encoding="utf-8")
+        self._fh.write("\n".join(lines) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._records += len(lines)
+
+    def _repair_tail(self):
+        """비정상 종료로 줄바꿈 없이 끝난 마지막 줄 정리 (다음 레코드가 그 뒤에 이어 붙지 않도록)
+
+        - 완전한 레코드면 줄바꿈만 추가 (로드 때 이미 적용됨)
+        - 기록 중 중단된 조각이면 마지막 줄바꿈 위치까지 잘라냄 (로드 때 무시됨)
+        """
+        try:
+            f = open(self.journal_path, "rb+")
+        except FileNotFoundError:
+            return
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            start = size
+            tail = b""
+            while start > 0:
+                step = min(_TAIL_CHUNK, start)
+                start -= step
+                f.seek(start)
+                tail = f.read(step) + tail
+                cut = tail.rfind(b"\n")
+                if cut >= 0:
+                    start += cut + 1
+                    tail = tail[cut + 1:]
+                    break
+            if not tail:
+                return
+            try:
+                self.codec.loads(tail.decode("utf-8"))
+            except ValueError:   # UnicodeDecodeError 포함
+                print(f"[WARN] 저널 끝의 불완전한 레코드 제거: {self.journal_path.name} ({len(tail)} bytes)")
+                f.truncate(start)
+            else:
+                f.seek(0, os.SEEK_END)
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ---------- compaction ----------
+    def compact(self):
+        """스냅샷 + 저널을 재생한 현재 상태를 스냅샷 파일로 쓰고 저널을 비움"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        """_lock 안에서 호출 (저장 작업 스레드 → GUI 스레드를 막지 않음)"""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        tables, _, _ = self._read_tables()
+        # 이전 압축이 끝나지 못했으면 세그먼트를 그대로 두고 저널도 남겨 둠
+        # (스냅샷 기록 전에 종료돼도 두 세그먼트가 다시 재생됨. 재생은 여러 번 해도 결과가 같음)
+        if self.journal_path.exists() and not self.compacting_path.exists():
+            os.replace(self.journal_path, self.compacting_path)
+        self._records = 0
+        self._snapshot_records = len(tables["wrapper"]) + len(tables["project"])
+        try:
+            atomic_write_text(self.path, self.codec.encode_snapshot(_tables_to_snapshot(tables)))
+            for segment in (self.compacting_path, self.journal_path):
+                if segment.exists():
+                    segment.unlink()
+        except OSError as e:
+            # 세그먼트가 남아 있으므로 다음 로드 때 재생되어 데이터 손실 없음
+            print(f"[ERROR] 저널 압축 실패: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def watch_paths(self) -> List[Path]:
+        return [self.path, self.journal_path]
+
+
+WRAPPER_COLUMNS = ("id", "name", "type", "status")
+PROJECT_COLUMNS = ("id", "name", "type", "status", "wrapper_id", "owner",
+                   "start_date", "end_date", "notes")
+
+_SQLITE_DDL = """
+CREATE TABLE IF NOT EXISTS wrappers (
+    id     TEXT PRIMARY KEY,
+    name   TEXT NOT NULL,
+    type   TEXT NOT NULL DEFAULT 'wrapper',
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id         TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    type       TEXT NOT NULL DEFAULT 'project',
+    status     TEXT NOT NULL,
+    wrapper_id TEXT,
+    owner      TEXT NOT NULL DEFAULT '',
+    start_date TEXT NOT NULL,
+    end_date   TEXT NOT NULL,
+    notes      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_wrappers_status   ON wrappers(status);
+CREATE INDEX IF NOT EXISTS idx_projects_status   ON projects(status);
+CREATE INDEX IF NOT EXISTS idx_projects_wrapper  ON projects(wrapper_id);
+CREATE INDEX IF NOT EXISTS idx_projects_owner    ON projects(owner);
+CREATE INDEX IF NOT EXISTS idx_projects_start    ON projects(start_date);
+CREATE INDEX IF NOT EXISTS idx_projects_end      ON projects(end_date);
+"""
+
+
+class SchemaValidationError(ValueError):
+    """가져올 JSON 이 projects.schema.json 을 만족하지 않음"""
+
+    def __init__(self, violations):
+        self.violations = violations
+        head = "\n".join(f"  - {v.path}: {v.message}" for v in violations[:10])
+        more = f"\n  ... 외 {len(violations) - 10}건" if len(violations) > 10 else ""
+        super().__init__(f"스키마 검증 실패 ({len(violations)}건)\n{head}{more}")
+
+
+def import_json_to_sqlite(json_path: Path, db_path: Path, schema_path: Optional[Path] = None) -> int:
+    """기존 JSON 파일을 스키마 검증 후 SQLite DB 로 1회 가져오기. 가져온 레코드 수 반환"""
+    json_path = Path(json_path)
+    obj = json.loads(json_path.read_text(encoding="utf-8"))
+    schema_path = Path(schema_path) if schema_path else json_path.with_name("projects.schema.json")
+    if schema_path.exists():
+        violations = load_schema(schema_path).validate(obj)
+        if violations:
+            raise SchemaValidationError(violations)
+
+    wrappers = obj.get("wrappers", [])
+    projects = obj.get("projects", [])
+    conn = sqlite3.connect(str(db_path))
+    try:
+        with conn:
+            conn.executescript(_SQLITE_DDL)
+            conn.executemany(
+                "INSERT OR REPLACE INTO wrappers (id, name, type, status) VALUES (?, ?, ?, ?)",
+                ([w.get(c) for c in WRAPPER_COLUMNS] for w in wrappers))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO projects ({', '.join(PROJECT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(PROJECT_COLUMNS))})",
+                ([p.get(c, "" if c == "notes" else None) for c in PROJECT_COLUMNS] for p in projects))
+    finally:
+        conn.close()
+    return len(wrappers) + len(projects)
+
+
+class SqliteStorage:
+    """SQLite 저장소
+
+    변경은 레코드 단위 UPSERT/UPDATE/DELETE 로 한 트랜잭션에 기록합니다.
+    조회 헬퍼(children/counts/query_projects)는 인덱스 컬럼을 사용해
+    전체 로드 없이 보고서/스크립트에서 바로 질의할 수 있습니다.
+    """
+
+    def __init__(self, path: Path, db_path: Optional[Path] = None):
+        self.path = Path(path)  # 최초 가져오기 대상 JSON
+        self.db_path = Path(db_path) if db_path else self.path.with_suffix(".sqlite3")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not self.db_path.exists():
+                import_json_to_sqlite(self.path, self.db_path)
+            # 저장은 작업 스레드에서 수행될 수 있으므로 스레드 검사 대신 lock 사용
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(_SQLITE_DDL)
+        return self._conn
+
+    def migrate(self) -> None:
+        """DB 가 없으면 JSON 가져오기 (스키마 위반 시 SchemaValidationError, DB 파일은 만들지 않음)"""
+        with self._lock:
+            self._connect()
+
+    # ---------- load/commit ----------
+    def load(self) -> DataModel:
+        with self._lock:
+            conn = self._connect()
+            wrappers = [Wrapper(**dict(r)) for r in
+                        conn.execute("SELECT * FROM wrappers ORDER BY rowid")]
+            projects = [Project(**dict(r)) for r in
+                        conn.execute("SELECT * FROM projects ORDER BY rowid")]
+        return DataModel(wrappers, projects)
+
+    def commit(self, changes) -> None:
+        if not changes:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for c in changes:
+                    table, columns = (("wrappers", WRAPPER_COLUMNS) if c.kind == "wrapper"
+                                      else ("projects", PROJECT_COLUMNS))
+                    if c.op == "add":
+                        cols = [k for k in columns if k in c.after]
+                        # UPSERT: 기존 행의 rowid(표시 순서)를 유지
+                        conn.execute(
+                            f"INSERT INTO {table} ({', '.join(cols)}) "
+                            f"VALUES ({', '.join('?' * len(cols))}) "
+                            f"ON CONFLICT(id) DO UPDATE SET "
+                            + ", ".join(f"{k}=excluded.{k}" for k in cols if k != "id"),
+                            [c.after[k] for k in cols])
+                    elif c.op == "update":
+                        cols = [k for k in c.after if k in columns and k != "id"]
+                        if cols:
+                            conn.execute(
+                                f"UPDATE {table} SET {', '.join(f'{k}=?' for k in cols)} WHERE id=?",
+                                [c.after[k] for k in cols] + [c.record_id])
+                    elif c.op == "delete":
+                        conn.execute(f"DELETE FROM {table} WHERE id=?", (c.record_id,))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def watch_paths(self) -> List[Path]:
+        return [self.db_path, self.db_path.with_name(self.db_path.name + "-wal")]
+
+    # ---------- 조회 헬퍼 ----------
+    def children(self, wrapper_id: str) -> List[Project]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT * FROM projects WHERE wrapper_id=? ORDER BY rowid", (wrapper_id,)).fetchall()
+        return [Project(**dict(r)) for r in rows]
+
+    def counts(self, wrapper_id: str) -> Tuple[int, int]:
+        """(전체, 완료) 하위 프로젝트 수"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(status='completed'), 0) FROM projects WHERE wrapper_id=?",
+                (wrapper_id,)).fetchone()
+        return int(row[0]), int(row[1])
+
+    def query_projects(self, status: Optional[str] = None, owner: Optional[str] = None,
+                       wrapper_id: Optional[str] = None, start_from: Optional[str] = None,
+                       end_to: Optional[str] = None) -> List[Project]:
+        """조건 필터 (날짜는 YYYY-MM-DD 문자열 비교 → 인덱스 사용)"""
+        where, args = [], []
+        for column, op, value in (("status", "=", status), ("owner", "=", owner),
+                                  ("wrapper_id", "=", wrapper_id),
+                                  ("end_date", ">=", start_from), ("start_date", "<=", end_to)):
+            if value is not None:
+                where.append(f"{column} {op} ?")
+                args.append(value)
+        sql = "SELECT * FROM projects"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            rows = self._connect().execute(sql + " ORDER BY rowid", args).fetchall()
+        return [Project(**dict(r)) for r in rows]
+
+
+def open_storage(path: Path, backend: Optional[str] = None,
+                 on_migration_error: Optional[Callable[[Exception], None]] = None):
+    """설정(환경변수)에 따라 저장소 백엔드 생성
+
+    on_migration_error: 지정하면 sqlite 최초 가져오기를 바로 수행하고, 기존 JSON 이 스키마 검증에
+    실패하면 오류를 전달한 뒤 JournalStorage 로 대체 (지정하지 않으면 load() 에서 예외)
+    """
+    backend = (backend or os.environ.get(STORAGE_ENV, "journal")).lower()
+    codec = JsonCodec(pretty=os.environ.get(PRETTY_ENV, "") in ("1", "true", "yes"))
+    if backend == "json":
+        return JsonFileStorage(path, codec=codec)
+    if backend == "journal":
+        return JournalStorage(path, codec=codec)
+    if backend == "sqlite":
+        storage = SqliteStorage(path)
+        if on_migration_error is not None:
+            try:
+                storage.migrate()
+            except ValueError as e:   # SchemaValidationError / JSON 형식 오류
+                print(f"[WARN] SQLite 가져오기 실패, JSON 저널 저장소 사용: {e}")
+                on_migration_error(e)
+                return JournalStorage(path, codec=codec)
+        return storage
+    raise ValueError(f"알 수 없는 Projects 저장소 백엔드: {backend}")
@@ -0,0 +1,119 @@
+"""
+하위 목록 테이블 모델 (상태 루트 하위 목록 / Wrapper 하위 프로젝트 목록)
+
+- repository 인덱스가 돌려주는 레코드 목록을 그대로 보관, 셀 문자열은 화면에 보이는 행만 data() 에서 생성
+  → QTableWidgetItem 을 셀마다 만들던 방식과 달리 행 수와 무관하게 즉시 표시
+- 레코드는 repository 가 제자리 수정하므로 이름/상태 변경은 다시 그릴 때 그대로 반영
+- 열 너비는 앞쪽 일부 행(SAMPLE_ROWS)만 측정, 행 높이는 고정 (resizeColumnsToContents 전체 측정 없음)
+"""
+
+from typing import Callable, List, Sequence, Tuple
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QHeaderView
+
+from .prj_treebuilder import ROLE_TYPE, ROLE_ID
+
+Column = Tuple[str, Callable[[object], str]]  # (헤더, 레코드 → 표시 문자열)
+
+SAMPLE_ROWS = 200   # 열 너비 계산에 사용하는 행 수
+MAX_COLUMN_WIDTH = 400
+
+
+def _status_text(record) -> str:
+    return "완료" if record.status == "completed" else "진행 중"
+
+
+def _status_icon_name(record) -> str:
+    icon = "✅" if record.status == "completed" else "🔄"
+    return f"{icon} {record.name}"
+
+
+# 상태 루트 하위 목록 (wrapper + wrapper 없는 프로젝트)
+CHILDREN_COLUMNS: List[Column] = [
+    ("ID", lambda r: r.id),
+    ("이름", lambda r: r.name),
+    ("상태", lambda r: r.status),
+]
+
+# Wrapper 상세뷰 하위 프로젝트 목록
+WRAPPER_PROJECT_COLUMNS: List[Column] = [
+    ("프로젝트명", _status_icon_name),
+    ("담당자", lambda r: r.owner),
+    ("상태", _status_text),
+    ("시작일", lambda r: r.start_date),
+    ("종료일", lambda r: r.end_date),
+]
+
+
+class RecordTableModel(QAbstractTableModel):
+    """레코드 목록 → 읽기 전용 테이블 (ROLE_TYPE/ROLE_ID 로 레코드 식별)"""
+
+    def __init__(self, columns: Sequence[Column], parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._records: List = []
+
+    def set_records(self, records: List):
+        """표시 목록 교체 (목록은 복사하지 않고 그대로 보관)"""
+        self.beginResetModel()
+        self._records = records
+        self.endResetModel()
+
+    def record(self, row: int):
+        return self._records[row]
+
+    # ---------- QAbstractTableModel ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r = self._records[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            value = self._columns[index.column()][1](r)
+            return "" if value is None else str(value)
+        if role == ROLE_TYPE:
+            return r.type
+        if role == ROLE_ID:
+            return r.id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section][0]
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+def setup_table_view(view, model: RecordTableModel):
+    """모델 연결 + 고정 행 높이 (행마다 높이를 측정하지 않음)"""
+    view.setModel(model)
+    vh = view.verticalHeader()
+    vh.setSectionResizeMode(QHeaderView.Fixed)
+    vh.setDefaultSectionSize(view.fontMetrics().height() + 8)
+
+
+def fit_columns(view, sample_rows: int = SAMPLE_ROWS):
+    """헤더 + 앞쪽 sample_rows 행의 문자열 폭으로 열 너비 설정"""
+    model = view.model()
+    fm = view.fontMetrics()
+    header_fm = view.horizontalHeader().fontMetrics()
+    rows = min(model.rowCount(), sample_rows)
+    for col in range(model.columnCount()):
+        width = header_fm.horizontalAdvance(str(model.headerData(col, Qt.Horizontal) or ""))
+        for row in range(rows):
+            text = model.data(model.index(row, col))
+            if text:
+                width = max(width, fm.horizontalAdvance(text))
+        view.setColumnWidth(col, min(width + 24, MAX_COLUMN_WIDTH))
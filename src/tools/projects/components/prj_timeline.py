@@ -0,0 +1,461 @@
+"""
+Projects 타임라인(간트) 패널
+
+- wrapper/프로젝트 1개 = 막대 1개 (QGraphicsItem), 행 순서는 트리와 같음
+  (상태 → wrapper → 하위 프로젝트, 이어서 wrapper 없는 프로젝트). 날짜가 없는 레코드는 표시하지 않음
+- x = date ordinal (1일 = 1 scene 단위), 확대/축소는 가로 방향만 → 화면에 보이는 행 수는 항상 일정
+- 장면 색인은 BSP 트리 → 스크롤/확대 시 보이는 영역의 막대만 그림
+- 상세도(LOD): 1일 폭(px)에 따라 막대 → 막대+이름 / 아주 짧은 막대는 1px 선, 눈금은 월/분기/연 단위
+- 날짜는 레코드에 ordinal 로 보관된 값(Project.start_ordinal, WrapperStats)을 그대로 사용 (문자열 파싱 없음)
+- repository 변경은 바뀐 막대만 갱신, 행이 생기거나 없어지는 변경만 모아서 행 배치를 다시 계산
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtWidgets import QWidget, QGraphicsItem, QGraphicsScene, QGraphicsView, QToolTip
+from PyQt5.QtCore import Qt, QEvent, QPointF, QRectF, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QPen, QTransform
+
+from .prj_repository import STATUSES
+from .prj_timeline_ui import Ui_ProjectsTimelineView
+
+ROW_HEIGHT = 22
+BAR_HEIGHT = {"wrapper": 16, "project": 12}
+HEADER_HEIGHT = 22          # 상단 날짜 눈금 (화면에 고정)
+MARGIN_DAYS = 30            # 장면 좌우 여백
+
+# 확대 범위 (1일 폭, px)
+MIN_PX_PER_DAY = 0.02
+MAX_PX_PER_DAY = 40.0
+DEFAULT_DAYS = 365          # 처음 표시할 기간
+MIN_BAR_PX = 2              # 이보다 좁은 막대는 1px 선으로
+LABEL_MIN_PX = 40           # 이보다 넓은 막대만 이름 표시
+TICK_MIN_PX = 60            # 눈금 최소 간격
+_TICK_MONTHS = (1, 3, 12, 60, 120)
+
+RELAYOUT_DELAY_MS = 50
+
+_COLORS = {
+    ("wrapper", "in_progress"): QColor("#c98a2e"),
+    ("wrapper", "completed"): QColor("#7d6c52"),
+    ("project", "in_progress"): QColor("#3d8bd9"),
+    ("project", "completed"): QColor("#5c8f5c"),
+}
+_OVERDUE_COLOR = QColor("#d9534f")
+_TODAY_COLOR = QColor("#e05050")
+_TEXT_COLOR = QColor("#ffffff")
+_SELECTED_PEN = QPen(QColor("#ffd24a"), 2)
+_SELECTED_PEN.setCosmetic(True)
+
+Key = Tuple[str, str]
+
+
+def _span(start: Optional[int], end: Optional[int]) -> Optional[Tuple[int, int]]:
+    """(시작, 종료) ordinal. 한쪽만 있으면 하루짜리, 둘 다 없으면 None"""
+    if start is None:
+        start = end
+    if start is None:
+        return None
+    if end is None or end < start:
+        end = start
+    return start, end
+
+
+def _project_span(p) -> Optional[Tuple[int, int]]:
+    return _span(p.start_ordinal, p.end_ordinal)
+
+
+def _wrapper_span(stats) -> Optional[Tuple[int, int]]:
+    return _span(stats.start_min, stats.end_max)
+
+
+def _ticks(first: float, last: float, px_per_day: float):
+    """보이는 범위의 눈금 (ordinal, 라벨). 간격은 TICK_MIN_PX 이상이 되는 가장 작은 월 단위"""
+    step = next((s for s in _TICK_MONTHS if s * 30.4 * px_per_day >= TICK_MIN_PX), _TICK_MONTHS[-1])
+    d = date.fromordinal(min(max(int(first), 1), date.max.toordinal()))
+    y, m = d.year, d.month
+    if step >= 12:
+        y -= y % (step // 12)
+        m = 1
+    else:
+        m = (m - 1) // step * step + 1
+    while y <= date.max.year:
+        ordinal = date(y, m, 1).toordinal()
+        if ordinal > last:
+            break
+        yield ordinal, (f"{y}-{m:02d}" if step < 12 else str(y))
+        m += step
+        y, m = y + (m - 1) // 12, (m - 1) % 12 + 1
+
+
+class _BarItem(QGraphicsItem):
+    """막대 1개. 위치는 scene 좌표의 사각형으로 직접 보관 (pos 는 항상 0)"""
+
+    def __init__(self, kind: str, record_id: str):
+        super().__init__()
+        self.kind = kind
+        self.record_id = record_id
+        self.text = ""
+        self.color = _COLORS[(kind, "in_progress")]
+        self.row = -1
+        self.span: Tuple[int, int] = (0, 0)
+        self._rect = QRectF()
+        self.setFlag(QGraphicsItem.ItemIsSelectable)
+
+    def set_geometry(self, span: Tuple[int, int], row: int):
+        if span == self.span and row == self.row:
+            return
+        self.prepareGeometryChange()
+        self.span, self.row = span, row
+        height = BAR_HEIGHT[self.kind]
+        top = HEADER_HEIGHT + row * ROW_HEIGHT + (ROW_HEIGHT - height) / 2
+        self._rect = QRectF(span[0], top, span[1] - span[0] + 1, height)
+
+    def set_style(self, text: str, color: QColor):
+        if text != self.text or color != self.color:
+            self.text, self.color = text, color
+            self.update()
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        rect = self._rect
+        transform = painter.worldTransform()
+        width_px = rect.width() * transform.m11()
+        if width_px < MIN_BAR_PX:
+            painter.setPen(QPen(self.color, 0))
+            painter.drawLine(QPointF(rect.left(), rect.top()), QPointF(rect.left(), rect.bottom()))
+            return
+        painter.setPen(_SELECTED_PEN if self.isSelected() else Qt.NoPen)
+        painter.setBrush(self.color)
+        painter.drawRect(rect)
+        if width_px >= LABEL_MIN_PX and self.text:
+            # 글자는 가로 확대 없이 장치 좌표로, 막대가 왼쪽으로 잘려도 보이는 부분에 표시
+            target = transform.mapRect(rect).adjusted(4, 0, -2, 0)
+            target.setLeft(max(target.left(), 4))
+            painter.save()
+            painter.resetTransform()
+            painter.setPen(_TEXT_COLOR)
+            painter.drawText(target, Qt.AlignVCenter | Qt.AlignLeft, self.text)
+            painter.restore()
+
+
+class TimelineScene(QGraphicsScene):
+    laidOut = pyqtSignal(int)   # 행 배치 재계산 완료 (막대 수)
+
+    def __init__(self, repo, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self._items: Dict[Key, _BarItem] = {}
+        self._rows = 0
+        self._today = date.today().toordinal()
+        self._relayout_timer = QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(RELAYOUT_DELAY_MS)
+        self._relayout_timer.timeout.connect(self.relayout)
+
+    # ---------- 조회 ----------
+    def item(self, kind: str, record_id: str) -> Optional[_BarItem]:
+        return self._items.get((kind, record_id))
+
+    def bar_count(self) -> int:
+        return len(self._items)
+
+    def today(self) -> int:
+        return self._today
+
+    def tooltip(self, item: _BarItem) -> str:
+        if item.kind == "wrapper":
+            w = self.repo.get_wrapper(item.record_id)
+            if w is None:
+                return ""
+            stats = self.repo.wrapper_stats(w.id)
+            return (f"{w.name}\n{date.fromordinal(item.span[0])} ~ {date.fromordinal(item.span[1])}\n"
+                    f"완료 {stats.completed}/{stats.total} ({stats.progress}%)")
+        p = self.repo.get_project(item.record_id)
+        if p is None:
+            return ""
+        status = "완료" if p.status == "completed" else "진행 중"
+        return (f"{p.name}\n{p.start_date} ~ {p.end_date}\n"
+                f"담당자: {p.owner or '(미지정)'} · {status}")
+
+    # ---------- 배치 ----------
+    def _style(self, kind: str, record) -> QColor:
+        if (kind == "project" and record.status == "in_progress"
+                and record.end_ordinal is not None and record.end_ordinal < self._today):
+            return _OVERDUE_COLOR
+        return _COLORS.get((kind, record.status), _COLORS[(kind, "in_progress")])
+
+    def _layout(self) -> List[Tuple[str, object, Tuple[int, int]]]:
+        """트리 순서의 (kind, 레코드, 기간) 행 목록"""
+        repo = self.repo
+        rows = []
+        for status in STATUSES:
+            for w in repo.wrappers_by_status(status):
+                span = _wrapper_span(repo.wrapper_stats(w.id))
+                if span is None:
+                    continue   # 하위 프로젝트에 날짜가 하나도 없음
+                rows.append(("wrapper", w, span))
+                for p in repo.children_of(w.id):
+                    span = _project_span(p)
+                    if span is not None:
+                        rows.append(("project", p, span))
+            for p in repo.loose_projects(status):
+                span = _project_span(p)
+                if span is not None:
+                    rows.append(("project", p, span))
+        return rows
+
+    def relayout(self):
+        """행 배치 다시 계산. 기존 막대는 재사용하고 위치가 바뀐 막대만 색인 갱신"""
+        self._relayout_timer.stop()
+        self._today = date.today().toordinal()
+        rows = self._layout()
+        stale = dict(self._items)
+        items: Dict[Key, _BarItem] = {}
+        first = last = self._today
+        for row, (kind, record, span) in enumerate(rows):
+            key = (kind, record.id)
+            item = stale.pop(key, None)
+            if item is None:
+                item = _BarItem(kind, record.id)
+                self.addItem(item)
+            item.set_geometry(span, row)
+            item.set_style(record.name, self._style(kind, record))
+            items[key] = item
+            first = min(first, span[0])
+            last = max(last, span[1])
+        for item in stale.values():
+            self.removeItem(item)
+        self._items = items
+        self._rows = len(rows)
+        self.setSceneRect(first - MARGIN_DAYS, 0, last - first + 2 * MARGIN_DAYS,
+                          HEADER_HEIGHT + (self._rows + 1) * ROW_HEIGHT)
+        self.laidOut.emit(len(items))
+
+    def _refresh(self, kind: str, record_id: str) -> bool:
+        """막대 하나의 기간/이름/색 갱신. 행이 생기거나 없어져야 하면 False"""
+        item = self._items.get((kind, record_id))
+        if kind == "wrapper":
+            record = self.repo.get_wrapper(record_id)
+            span = _wrapper_span(self.repo.wrapper_stats(record_id)) if record is not None else None
+        else:
+            record = self.repo.get_project(record_id)
+            span = _project_span(record) if record is not None else None
+        if (item is None) != (span is None):
+            return False
+        if item is not None:
+            item.set_geometry(span, item.row)
+            item.set_style(record.name, self._style(kind, record))
+            rect = self.sceneRect()
+            if span[0] - MARGIN_DAYS < rect.left() or span[1] + MARGIN_DAYS > rect.right():
+                self.setSceneRect(rect.united(QRectF(span[0] - MARGIN_DAYS, 0,
+                                                     span[1] - span[0] + 2 * MARGIN_DAYS, rect.height())))
+        return True
+
+    def on_changes(self, changes):
+        """repository 변경 통지 → 바뀐 막대만 갱신, 행 구성이 바뀌면 배치 재계산 예약"""
+        if self._relayout_timer.isActive():
+            return
+        for c in changes:
+            if c.op != "update" or "status" in c.after or "wrapper_id" in c.after:
+                self._relayout_timer.start()
+                return
+        for c in changes:
+            ok = self._refresh(c.kind, c.record_id)
+            if ok and c.kind == "project":
+                p = self.repo.get_project(c.record_id)
+                ok = p is None or not p.wrapper_id or self._refresh("wrapper", p.wrapper_id)
+            if not ok:
+                self._relayout_timer.start()
+                return
+
+    # ---------- 배경/눈금 ----------
+    def drawBackground(self, painter, rect: QRectF):
+        palette = self.palette()
+        painter.fillRect(rect, palette.base())
+        # 행 줄무늬 (보이는 행만)
+        stripe = palette.alternateBase()
+        top = max(int((rect.top() - HEADER_HEIGHT) // ROW_HEIGHT), 0)
+        bottom = min(int((rect.bottom() - HEADER_HEIGHT) // ROW_HEIGHT) + 1, self._rows)
+        for row in range(top - top % 2 + 1, bottom, 2):
+            painter.fillRect(QRectF(rect.left(), HEADER_HEIGHT + row * ROW_HEIGHT, rect.width(), ROW_HEIGHT),
+                             stripe)
+        grid = QPen(palette.mid().color(), 0)
+        painter.setPen(grid)
+        for ordinal, _label in _ticks(rect.left(), rect.right(), painter.worldTransform().m11()):
+            painter.drawLine(QPointF(ordinal, rect.top()), QPointF(ordinal, rect.bottom()))
+        if rect.left() <= self._today <= rect.right():
+            painter.setPen(QPen(_TODAY_COLOR, 0, Qt.DashLine))
+            painter.drawLine(QPointF(self._today, rect.top()), QPointF(self._today, rect.bottom()))
+
+    def drawForeground(self, painter, rect: QRectF):
+        """화면 상단에 고정된 날짜 눈금 (장치 좌표로 그림)"""
+        transform = painter.worldTransform()
+        if transform.mapRect(rect).top() > HEADER_HEIGHT:
+            return
+        width = painter.device().width()
+        inverse, _ok = transform.inverted()
+        first = inverse.map(QPointF(0, 0)).x()
+        last = inverse.map(QPointF(width, 0)).x()
+        palette = self.palette()
+        painter.save()
+        painter.resetTransform()
+        painter.fillRect(QRectF(0, 0, width, HEADER_HEIGHT), palette.window())
+        painter.setPen(palette.windowText().color())
+        for ordinal, label in _ticks(first, last, transform.m11()):
+            x = transform.map(QPointF(ordinal, 0)).x()
+            painter.drawLine(QPointF(x, 0), QPointF(x, HEADER_HEIGHT))
+            painter.drawText(QRectF(x + 3, 0, TICK_MIN_PX * 2, HEADER_HEIGHT),
+                             Qt.AlignVCenter | Qt.AlignLeft, label)
+        painter.setPen(palette.mid().color())
+        painter.drawLine(QPointF(0, HEADER_HEIGHT - 0.5), QPointF(width, HEADER_HEIGHT - 0.5))
+        painter.restore()
+
+
+class ProjectsTimelineWidget(QWidget):
+    """
+    타임라인 패널. 외부 주입:
+      - setRepository(repo): 장면 구성 (이후 변경은 on_changes 로 전달)
+      - select(kind, record_id): 트리 선택과 같은 막대 선택/표시 (None 이면 선택 해제)
+    외부 신호:
+      - recordActivated(kind, record_id): 막대 클릭
+    조작: Ctrl+휠 확대/축소, Shift+휠 가로 이동, 빈 곳 드래그로 이동
+    """
+    recordActivated = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ui = Ui_ProjectsTimelineView()
+        self.ui.setupUi(self)
+        self.scene: Optional[TimelineScene] = None
+        self._selecting = False
+        self._positioned = False
+
+        v = self.ui.graphicsView
+        v.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        v.setDragMode(QGraphicsView.ScrollHandDrag)
+        v.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        v.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        v.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        v.viewport().installEventFilter(self)
+        self._vscroll = 0
+        v.verticalScrollBar().valueChanged.connect(self._on_vscroll)
+
+        self.ui.btnZoomIn.clicked.connect(lambda: self.zoom(2.0))
+        self.ui.btnZoomOut.clicked.connect(lambda: self.zoom(0.5))
+        self.ui.btnFit.clicked.connect(self.fitAll)
+        self.ui.btnToday.clicked.connect(self.showToday)
+
+    def setRepository(self, repo):
+        self.scene = TimelineScene(repo, self)
+        self.scene.selectionChanged.connect(self._on_selection_changed)
+        self.scene.laidOut.connect(self._update_info)
+        self.scene.relayout()
+        self.ui.graphicsView.setScene(self.scene)
+
+    def on_changes(self, changes):
+        if self.scene is not None:
+            self.scene.on_changes(changes)
+
+    # ---------- 선택 ----------
+    def select(self, kind: Optional[str], record_id: Optional[str] = None):
+        if self.scene is None:
+            return
+        item = self.scene.item(kind, record_id) if kind else None
+        self._selecting = True
+        try:
+            self.scene.clearSelection()
+            if item is not None:
+                item.setSelected(True)
+        finally:
+            self._selecting = False
+        if item is not None:
+            v = self.ui.graphicsView
+            rect = item.sceneBoundingRect()
+            visible = v.mapToScene(v.viewport().rect()).boundingRect()
+            # 긴 막대는 시작 부분만 보이게 (화면보다 넓은 영역을 요청하면 가운데로 이동하므로)
+            rect.setWidth(min(rect.width(), visible.width() / 2))
+            v.ensureVisible(rect, 20, HEADER_HEIGHT + ROW_HEIGHT)
+
+    def _on_selection_changed(self):
+        if self._selecting:
+            return
+        items = self.scene.selectedItems()
+        if len(items) == 1:
+            self.recordActivated.emit(items[0].kind, items[0].record_id)
+
+    # ---------- 확대/이동 ----------
+    def pxPerDay(self) -> float:
+        return self.ui.graphicsView.transform().m11()
+
+    def zoom(self, factor: float):
+        current = self.pxPerDay()
+        target = min(max(current * factor, MIN_PX_PER_DAY), MAX_PX_PER_DAY)
+        if target != current:
+            self.ui.graphicsView.scale(target / current, 1.0)
+
+    def _set_px_per_day(self, px_per_day: float):
+        px_per_day = min(max(px_per_day, MIN_PX_PER_DAY), MAX_PX_PER_DAY)
+        self.ui.graphicsView.setTransform(QTransform.fromScale(px_per_day, 1.0))
+
+    def _center_x(self, ordinal: float):
+        v = self.ui.graphicsView
+        y = v.mapToScene(v.viewport().rect().center()).y()
+        v.centerOn(ordinal, y)
+
+    def fitAll(self):
+        if self.scene is None:
+            return
+        rect = self.scene.sceneRect()
+        self._set_px_per_day(self.ui.graphicsView.viewport().width() / max(rect.width(), 1))
+        self._center_x(rect.center().x())
+
+    def showToday(self):
+        if self.scene is not None:
+            self._center_x(self.scene.today())
+
+    def _initial_position(self):
+        # 뷰 크기가 정해진 뒤 처음 한 번만: 오늘 기준 DEFAULT_DAYS 일 표시
+        self._set_px_per_day(self.ui.graphicsView.viewport().width() / DEFAULT_DAYS)
+        self.showToday()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._positioned and self.scene is not None:
+            self._positioned = True
+            QTimer.singleShot(0, self._initial_position)
+
+    def _update_info(self, count: int):
+        self.ui.labelInfo.setText(f"막대 {count:,}개")
+
+    def _on_vscroll(self, value: int):
+        # 세로 스크롤은 화면을 복사해 옮기므로 고정 눈금 영역(+이동 거리)을 다시 그림
+        dy = abs(value - self._vscroll)
+        self._vscroll = value
+        viewport = self.ui.graphicsView.viewport()
+        viewport.update(0, 0, viewport.width(), HEADER_HEIGHT + dy)
+
+    def eventFilter(self, obj, event):
+        if obj is self.ui.graphicsView.viewport():
+            if event.type() == QEvent.Wheel:
+                modifiers = event.modifiers()
+                delta = event.angleDelta().y()
+                if modifiers & Qt.ControlModifier:
+                    self.zoom(1.25 if delta > 0 else 0.8)
+                    return True
+                if modifiers & Qt.ShiftModifier:
+                    bar = self.ui.graphicsView.horizontalScrollBar()
+                    bar.setValue(bar.value() - delta)
+                    return True
+            elif event.type() == QEvent.ToolTip and self.scene is not None:
+                item = self.ui.graphicsView.itemAt(event.pos())
+                if isinstance(item, _BarItem):
+                    QToolTip.showText(event.globalPos(), self.scene.tooltip(item), obj)
+                else:
+                    QToolTip.hideText()
+                return True
+        return super().eventFilter(obj, event)
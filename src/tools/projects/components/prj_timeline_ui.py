@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'E:/Jihoon0146/UKSDT/src/tools/projects/components/prj_timeline.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ProjectsTimelineView(object):
+    def setupUi(self, ProjectsTimelineView):
+        ProjectsTimelineView.setObjectName("ProjectsTimelineView")
+        self.verticalLayout = QtWidgets.QVBoxLayout(ProjectsTimelineView)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.headerLayout = QtWidgets.QHBoxLayout()
+        self.headerLayout.setObjectName("headerLayout")
+        self.labelTitle = QtWidgets.QLabel(ProjectsTimelineView)
+        self.labelTitle.setObjectName("labelTitle")
+        self.headerLayout.addWidget(self.labelTitle)
+        self.labelInfo = QtWidgets.QLabel(ProjectsTimelineView)
+        self.labelInfo.setText("")
+        self.labelInfo.setObjectName("labelInfo")
+        self.headerLayout.addWidget(self.labelInfo)
+        spacerItem = QtWidgets.QSpacerItem(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.headerLayout.addItem(spacerItem)
+        self.btnZoomOut = QtWidgets.QToolButton(ProjectsTimelineView)
+        self.btnZoomOut.setObjectName("btnZoomOut")
+        self.headerLayout.addWidget(self.btnZoomOut)
+        self.btnZoomIn = QtWidgets.QToolButton(ProjectsTimelineView)
+        self.btnZoomIn.setObjectName("btnZoomIn")
+        self.headerLayout.addWidget(self.btnZoomIn)
+        self.btnFit = QtWidgets.QToolButton(ProjectsTimelineView)
+        self.btnFit.setObjectName("btnFit")
+        self.headerLayout.addWidget(self.btnFit)
+        self.btnToday = QtWidgets.QToolButton(ProjectsTimelineView)
+        self.btnToday.setObjectName("btnToday")
+        self.headerLayout.addWidget(self.btnToday)
+        self.verticalLayout.addLayout(self.headerLayout)
+        self.graphicsView = QtWidgets.QGraphicsView(ProjectsTimelineView)
+        self.graphicsView.setMinimumWidth(320)
+        self.graphicsView.setObjectName("graphicsView")
+        self.verticalLayout.addWidget(self.graphicsView)
+
+        self.retranslateUi(ProjectsTimelineView)
+        QtCore.QMetaObject.connectSlotsByName(ProjectsTimelineView)
+
+    def retranslateUi(self, ProjectsTimelineView):
+        _translate = QtCore.QCoreApplication.translate
+        self.labelTitle.setText(_translate("ProjectsTimelineView", "타임라인"))
+        self.btnZoomOut.setToolTip(_translate("ProjectsTimelineView", "축소 (Ctrl+휠)"))
+        self.btnZoomOut.setText(_translate("ProjectsTimelineView", "－"))
+        self.btnZoomIn.setToolTip(_translate("ProjectsTimelineView", "확대 (Ctrl+휠)"))
+        self.btnZoomIn.setText(_translate("ProjectsTimelineView", "＋"))
+        self.btnFit.setToolTip(_translate("ProjectsTimelineView", "전체 기간 표시"))
+        self.btnFit.setText(_translate("ProjectsTimelineView", "전체"))
+        self.btnToday.setToolTip(_translate("ProjectsTimelineView", "오늘로 이동"))
+        self.btnToday.setText(_translate("ProjectsTimelineView", "오늘"))
@@ -0,0 +1,460 @@
+"""
+ProjectsTreeModel: ProjectRepository 인덱스를 직접 사용하는 지연 로딩 트리 모델
+
+- 최상위 상태 루트(진행 중/완료)만 미리 만들고,
+  상태 루트/Wrapper 의 하위 노드는 펼쳐질 때(fetchMore) 처음 생성합니다.
+- 노드는 (node_type, node_id) 만 들고 있고 표시 데이터는 repository 에서 바로 읽습니다.
+- apply(changes): ProjectRepository 변경 통지를 받아 로드된 노드만 증분 갱신
+- set_issues(issues): 검증 위반 레코드를 빨간 글씨 + 툴팁으로 표시
+- set_filter(TreeFilter): 일치 레코드와 그 상위 노드만 표시 (일치 항목은 굵게)
+- 하위 노드가 많은 부모는 FETCH_BATCH 개씩 나눠 생성 (스크롤 시 다음 묶음 로드)
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor, QFont
+
+from .prj_repository import ProjectRepository
+from .prj_treebuilder import (ROLE_TYPE, ROLE_ID, ROLE_COLLAPSED, ROLE_STATUS, ROLE_OWNER,
+                              ROLE_WRAPPER, ROLE_START, ROLE_END, STATUS_LABELS,
+                              wrapper_label, project_label)
+
+
+Key = Tuple[str, str]  # (node_type, node_id)
+
+# 한 번의 fetchMore 로 생성하는 최대 행 수
+FETCH_BATCH = 500
+
+
+class _Node:
+    __slots__ = ("node_type", "node_id", "parent", "children", "pending", "row")
+
+    def __init__(self, node_type: str, node_id: str, parent: Optional["_Node"]):
+        self.node_type = node_type
+        self.node_id = node_id
+        self.parent = parent
+        self.children: List["_Node"] = []
+        # 아직 행으로 만들지 않은 하위 키 (None: 하위 목록 미조회). project 는 하위가 없음
+        self.pending: Optional[List[Key]] = [] if node_type == "project" else None
+        self.row = 0  # 부모 children 내 위치 힌트 (삽입/삭제 시 어긋나면 재계산)
+
+    @property
+    def key(self) -> Key:
+        return (self.node_type, self.node_id)
+
+
+class TreeFilter:
+    """트리 표시 범위: 일치 레코드 + 그 상위 노드
+
+    - matches: 검색 일치 레코드 키 집합 (None: 검색 없음). 일치 항목은 굵게 표시
+    - scope: 조건 필터(prj_filter)를 통과한 프로젝트 id 집합 (None: 조건 없음)
+    - 검색에 일치한 wrapper 는 (scope 안의) 하위 프로젝트 전체를 함께 표시
+    - 부모별 표시 자식 목록은 모델이 해당 부모를 처음 조회할 때 계산 (생성 비용 O(일치 수))
+    """
+
+    def __init__(self, repo: ProjectRepository, matches: Optional[Set[Key]] = None,
+                 scope: Optional[Set[str]] = None, highlight: bool = True):
+        self.matches: Set[Key] = matches if matches is not None else set()
+        self.highlight = highlight and matches is not None
+        self.scope = scope
+        if matches is None:
+            project_ids = set(scope or ())
+            full = set()
+        else:
+            project_ids = {rid for kind, rid in matches if kind == "project"}
+            if scope is not None:
+                project_ids &= scope
+            full = {k for k in matches if k[0] == "wrapper"}
+            if scope is not None:
+                # 조건에 맞는 하위 프로젝트가 없는 wrapper 는 표시하지 않음
+                full = {k for k in full if any(pid in scope for pid in repo.child_ids(k[1]))}
+
+        wrapper_ids = set()
+        get_project = repo.get_project
+        for pid in project_ids:
+            p = get_project(pid)
+            if p is not None and p.wrapper_id:
+                wrapper_ids.add(p.wrapper_id)
+        wrapper_ids.update(rid for kind, rid in full)
+
+        self.full: Set[Key] = full              # 하위 전체를 표시하는 wrapper
+        # 종류별 표시 id (부모 목록을 id 그대로 거를 수 있도록 분리)
+        self.project_ids: Set[str] = project_ids
+        self.wrapper_ids: Set[str] = wrapper_ids
+
+    def total(self) -> int:
+        """일치 레코드 수 (상위 노드로만 표시되는 wrapper 제외)"""
+        return len(self.project_ids) + len(self.full)
+
+
+class ProjectsTreeModel(QAbstractItemModel):
+    def __init__(self, repo: ProjectRepository, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self._root = _Node("root", "", None)
+        self._root.pending = []
+        # 로드된 노드만 보관: (node_type, node_id) → _Node
+        self._nodes: Dict[Tuple[str, str], _Node] = {}
+        # 검증 위반 레코드: (node_type, node_id) → 툴팁 문구
+        self._issues: Dict[Tuple[str, str], str] = {}
+        self._issue_brush = QBrush(QColor("#d9534f"))
+        self._filter: Optional[TreeFilter] = None
+        self._match_font = QFont()
+        self._match_font.setBold(True)
+        for status in STATUS_LABELS:
+            self._append_node(self._root, "status_root", status)
+
+    # ---------- 내부 노드 관리 ----------
+    def _append_node(self, parent: _Node, node_type: str, node_id: str) -> _Node:
+        node = _Node(node_type, node_id, parent)
+        node.row = len(parent.children)
+        parent.children.append(node)
+        self._nodes[node.key] = node
+        return node
+
+    def _forget(self, node: _Node):
+        self._nodes.pop(node.key, None)
+        for child in node.children:
+            self._forget(child)
+
+    def _row_of(self, node: _Node) -> int:
+        siblings = node.parent.children
+        if node.row >= len(siblings) or siblings[node.row] is not node:
+            node.row = siblings.index(node)
+        return node.row
+
+    def _node(self, index: QModelIndex) -> _Node:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _index_of(self, node: _Node) -> QModelIndex:
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(self._row_of(node), 0, node)
+
+    def _expected_children(self, node: _Node) -> int:
+        if self._filter is not None:
+            # 필터 적용 중: 표시할 하위 키를 바로 계산해 두고 fetchMore 때 사용
+            if node.pending is None:
+                node.pending = self._child_keys(node)
+            return len(node.pending) + len(node.children)
+        if node.node_type == "status_root":
+            return self.repo.count_status_children(node.node_id)
+        if node.node_type == "wrapper":
+            return self.repo.count_children(node.node_id)
+        return 0
+
+    def _child_keys(self, node: _Node) -> List[Key]:
+        if node.node_type == "status_root":
+            wrapper_ids = self.repo.wrapper_ids_by_status(node.node_id)
+            project_ids = self.repo.loose_project_ids(node.node_id)
+        else:
+            wrapper_ids = []
+            project_ids = self.repo.child_ids(node.node_id)
+        f = self._filter
+        if f is not None:
+            if node.key not in f.full:
+                wrapper_ids = [i for i in wrapper_ids if i in f.wrapper_ids]
+                project_ids = [i for i in project_ids if i in f.project_ids]
+            elif f.scope is not None:
+                project_ids = [i for i in project_ids if i in f.scope]
+        keys = [("wrapper", i) for i in wrapper_ids]
+        keys += [("project", i) for i in project_ids]
+        return keys
+
+    def _parent_key(self, key: Key) -> Optional[Key]:
+        """레코드가 현재 속해야 하는 부모 노드 키 (표시되지 않는 레코드면 None)"""
+        node_type, node_id = key
+        if node_type == "wrapper":
+            w = self.repo.get_wrapper(node_id)
+            return ("status_root", w.status) if w else None
+        p = self.repo.get_project(node_id)
+        if p is None:
+            return None
+        return ("wrapper", p.wrapper_id) if p.wrapper_id else ("status_root", p.status)
+
+    def _fetch(self, node: _Node, limit: int = FETCH_BATCH):
+        if node.pending is None:
+            node.pending = self._child_keys(node)
+        batch = []
+        while node.pending and len(batch) < limit:
+            n = limit - len(batch)
+            keys, node.pending[:n] = node.pending[:n], []
+            # 대기 중에 삭제/이동된 레코드는 건너뜀
+            batch += [k for k in keys if k not in self._nodes and self._parent_key(k) == node.key]
+        if not batch:
+            return
+        first = len(node.children)
+        self.beginInsertRows(self._index_of(node), first, first + len(batch) - 1)
+        for node_type, node_id in batch:
+            self._append_node(node, node_type, node_id)
+        self.endInsertRows()
+
+    # ---------- QAbstractItemModel ----------
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if column != 0 or row < 0 or row >= len(node.children):
+            return QModelIndex()
+        child = node.children[row]
+        child.row = row
+        return self.createIndex(row, column, child)
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        if node.pending is not None:
+            return bool(node.children or node.pending)
+        return self._expected_children(node) > 0
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        if node.pending is not None:
+            return bool(node.pending)
+        return self._expected_children(node) > 0
+
+    def fetchMore(self, parent):
+        self._fetch(self._node(parent))
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Projects"
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == ROLE_TYPE:
+            return node.node_type
+        if role == ROLE_ID:
+            return node.node_id
+        if role == ROLE_COLLAPSED:
+            # '완료' 루트는 기본적으로 접힌 상태로 표시
+            return node.node_type == "status_root" and node.node_id == "completed"
+        if role == Qt.DisplayRole:
+            return self._label(node)
+        if role == Qt.ForegroundRole:
+            return self._issue_brush if node.key in self._issues else None
+        if role == Qt.ToolTipRole:
+            return self._issues.get(node.key)
+        if ROLE_STATUS <= role <= ROLE_END:
+            return self._record_role(node, role)
+        if role == Qt.FontRole:
+            f = self._filter
+            if f is not None and f.highlight and node.key in f.matches:
+                return self._match_font
+            return None
+        return None
+
+    def _record_role(self, node: _Node, role: int):
+        if node.node_type == "status_root":
+            return node.node_id if role == ROLE_STATUS else None
+        if node.node_type == "wrapper":
+            w = self.repo.get_wrapper(node.node_id)
+            return w.status if w is not None and role == ROLE_STATUS else None
+        p = self.repo.get_project(node.node_id)
+        if p is None:
+            return None
+        if role == ROLE_STATUS:
+            return p.status
+        if role == ROLE_OWNER:
+            return p.owner
+        if role == ROLE_WRAPPER:
+            return p.wrapper_id
+        if role == ROLE_START:
+            return p.start_ordinal
+        return p.end_ordinal
+
+    def _label(self, node: _Node) -> str:
+        if node.node_type == "status_root":
+            return STATUS_LABELS.get(node.node_id, node.node_id)
+        if node.node_type == "wrapper":
+            w = self.repo.get_wrapper(node.node_id)
+            return wrapper_label(w, self.repo.wrapper_stats(w.id)) if w else ""
+        p = self.repo.get_project(node.node_id)
+        return project_label(p) if p else ""
+
+    # ---------- 조회 ----------
+    def index_for(self, node_type: str, node_id: str) -> Optional[QModelIndex]:
+        """로드된 노드의 인덱스 (아직 로드되지 않았으면 None)"""
+        node = self._nodes.get((node_type, node_id))
+        return self._index_of(node) if node is not None else None
+
+    def reveal(self, node_type: str, node_id: str) -> Optional[QModelIndex]:
+        """상위 노드를 필요한 만큼 로드한 뒤 인덱스 반환 (트리에 표시되지 않는 레코드면 None)"""
+        key = (node_type, node_id)
+        if key not in self._nodes:
+            parent_key = self._parent_key(key)
+            if parent_key is None:
+                return None
+            if parent_key[0] == "wrapper" and self.reveal(*parent_key) is None:
+                return None
+            parent = self._nodes[parent_key]
+            while key not in self._nodes and (parent.pending is None or parent.pending):
+                self._fetch(parent)
+        return self.index_for(node_type, node_id)
+
+    # ---------- 필터 ----------
+    def set_filter(self, tree_filter: Optional[TreeFilter]):
+        """표시 범위 변경 (None: 전체). 상태 루트만 남기고 하위는 다시 지연 로드"""
+        self.beginResetModel()
+        self._filter = tree_filter
+        self._nodes = {}
+        for root in self._root.children:
+            root.children = []
+            root.pending = None
+            self._nodes[root.key] = root
+        self.endResetModel()
+
+    def tree_filter(self) -> Optional[TreeFilter]:
+        return self._filter
+
+    # ---------- 검증 표시 ----------
+    def set_issues(self, issues: Dict[Tuple[str, str], str]):
+        """검증 위반 표시 갱신. 로드된 노드 중 표시가 바뀐 것만 dataChanged"""
+        old, self._issues = self._issues, dict(issues)
+        for key in old.keys() | self._issues.keys():
+            if old.get(key) == self._issues.get(key):
+                continue
+            node = self._nodes.get(key)
+            if node is not None:
+                idx = self._index_of(node)
+                self.dataChanged.emit(idx, idx, [Qt.ForegroundRole, Qt.ToolTipRole])
+
+    # ---------- 증분 갱신 ----------
+    def apply(self, changes):
+        """변경 반영. 필터 적용 중에는 일치 여부가 바뀔 수 있으므로 호출자가 set_filter 로 다시 계산"""
+        badges = set()  # 진행률 배지를 다시 그릴 wrapper
+        for change in changes:
+            if change.kind == "wrapper":
+                self.sync_wrapper(change.record_id)
+            elif change.kind == "project":
+                self.sync_project(change.record_id)
+                if change.op == "update" and not ({"status", "wrapper_id"} & set(change.after)):
+                    continue
+                for fields in (change.before, change.after):
+                    if fields and fields.get("wrapper_id"):
+                        badges.add(fields["wrapper_id"])
+                p = self.repo.get_project(change.record_id)
+                if p is not None and p.wrapper_id:
+                    badges.add(p.wrapper_id)
+        for wrapper_id in badges:
+            node = self._nodes.get(("wrapper", wrapper_id))
+            if node is not None and node.parent is not None:
+                self._emit_changed(node)
+
+    def _remove_node(self, node: _Node):
+        parent = node.parent
+        row = self._row_of(node)
+        self.beginRemoveRows(self._index_of(parent), row, row)
+        del parent.children[row]
+        self.endRemoveRows()
+        node.parent = None
+        return node
+
+    def _insert_node(self, parent: _Node, row: int, node: _Node):
+        self.beginInsertRows(self._index_of(parent), row, row)
+        node.parent = parent
+        node.row = row
+        parent.children.insert(row, node)
+        self._nodes[node.key] = node
+        self.endInsertRows()
+
+    def _accepts_new_child(self, parent: Optional[_Node], key: Key) -> bool:
+        """새 자식을 지금 행으로 추가할 수 있는지 (미로드 부모는 펼칠 때 함께 로드됨)"""
+        if parent is None:
+            return False
+        if parent.pending is not None:
+            # 아직 행으로 만들지 않은 대기 항목이면 다음 fetchMore 때 생성
+            return key not in parent.pending
+        if self._expected_children(parent) == 1:
+            # 첫 자식이 생긴 빈 부모: 펼침 화살표가 바로 보이도록 로드된 것으로 간주
+            parent.pending = []
+            return True
+        return False
+
+    def _wrapper_insert_row(self, bucket: _Node) -> int:
+        # 버킷 안에서 wrapper 는 항상 loose project 보다 앞에 위치
+        row = 0
+        for child in bucket.children:
+            if child.node_type != "wrapper":
+                break
+            row += 1
+        return row
+
+    def _emit_changed(self, node: _Node):
+        idx = self._index_of(node)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def sync_wrapper(self, wrapper_id: str):
+        w = self.repo.get_wrapper(wrapper_id)
+        node = self._nodes.get(("wrapper", wrapper_id))
+
+        if w is None:
+            if node is not None:
+                self._remove_node(node)
+                self._forget(node)
+            return
+
+        bucket = self._nodes[("status_root", w.status)]
+        if node is not None and node.parent is bucket:
+            self._emit_changed(node)
+            return
+
+        if node is not None:
+            # 상태 변경: 로드된 하위 노드를 유지한 채 버킷 사이 이동
+            self._remove_node(node)
+        if not self._accepts_new_child(bucket, ("wrapper", wrapper_id)):
+            if node is not None:
+                self._forget(node)
+            return
+        if node is None:
+            node = _Node("wrapper", wrapper_id, bucket)
+        self._insert_node(bucket, self._wrapper_insert_row(bucket), node)
+
+    def sync_project(self, project_id: str):
+        p = self.repo.get_project(project_id)
+        node = self._nodes.get(("project", project_id))
+
+        if p is None:
+            if node is not None:
+                self._remove_node(node)
+                self._forget(node)
+            return
+
+        if p.wrapper_id:
+            # 존재하지 않는 wrapper 를 가리키면 표시하지 않음 (_child_keys 와 동일: wrapper 노드의 child_ids 로만 표시)
+            parent = self._nodes.get(("wrapper", p.wrapper_id))
+        else:
+            parent = self._nodes.get(("status_root", p.status))
+
+        if node is not None and node.parent is parent:
+            self._emit_changed(node)
+            return
+
+        if node is not None:
+            self._remove_node(node)
+        if not self._accepts_new_child(parent, ("project", project_id)):
+            if node is not None:
+                self._forget(node)
+            return
+        if node is None:
+            node = _Node("project", project_id, parent)
+        self._insert_node(parent, len(parent.children), node)
@@ -1,49 +1,195 @@
 # app/tree_panel.py
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import QDate, QTimer, pyqtSignal
 from .prj_treeview_ui import Ui_ProjectsTreeView
+from .prj_treebuilder import ROLE_COLLAPSED, ROLE_TYPE, ROLE_ID
+from .prj_filter import NO_WRAPPER, FilterCriteria
 
 class ProjectsTreeViewWidget(QWidget):
     """
     좌측 트리 패널. 외부 주입:
-      - setModel(model): QStandardItemModel 주입
+      - setModel(model): 트리 모델 주입 (1회, 이후 변경은 모델 증분 갱신)
+      - setSearchInfo(text): 검색 결과 요약 표시 (빈 문자열이면 숨김)
+      - setOwners(list[str]) / setWrappers(list[(id, name)]): 필터 선택 항목 갱신
     외부 신호:
-      - selectionChanged(QModelIndex or None)
+      - selectionChanged(QModelIndex or None): 현재 항목 (다중 선택 시 마지막으로 클릭한 항목)
+      - searchChanged(str): 검색어 변경 (입력이 잠시 멈춘 뒤 1회)
+      - filterChanged(): 필터 조건 변경 (filterCriteria() 로 조회)
     """
     selectionChanged = pyqtSignal(object)
+    searchChanged = pyqtSignal(str)
+    filterChanged = pyqtSignal()
+
+    SEARCH_DELAY_MS = 150
+    # 자동으로 펼치는 wrapper 최대 수 (대용량 데이터에서 펼침만으로 수만 행이 생성되지 않도록)
+    EXPAND_WRAPPERS_MAX = 100
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ui = Ui_ProjectsTreeView()
         self.ui.setupUi(self)
 
+        # 검색어 입력 디바운스
+        self._searchTimer = QTimer(self)
+        self._searchTimer.setSingleShot(True)
+        self._searchTimer.setInterval(self.SEARCH_DELAY_MS)
+        self._searchTimer.timeout.connect(lambda: self.searchChanged.emit(self.ui.editSearch.text()))
+        self.ui.editSearch.textChanged.connect(self._searchTimer.start)
+
+        # 조건 필터 (담당자/상태/wrapper/기간)
+        ui = self.ui
+        ui.btnFilter.toggled.connect(ui.frameFilter.setVisible)
+        ui.comboOwner.addItem("전체", None)
+        ui.comboStatus.addItem("전체", None)
+        ui.comboStatus.addItem("진행 중", "in_progress")
+        ui.comboStatus.addItem("완료", "completed")
+        ui.comboFilterWrapper.addItem("전체", None)
+        today = QDate.currentDate()
+        ui.dateFrom.setDate(today.addMonths(-1))
+        ui.dateTo.setDate(today)
+        ui.checkDate.toggled.connect(ui.dateFrom.setEnabled)
+        ui.checkDate.toggled.connect(ui.dateTo.setEnabled)
+        for combo in (ui.comboOwner, ui.comboStatus, ui.comboFilterWrapper):
+            combo.currentIndexChanged.connect(self._emit_filter)
+        ui.checkDate.toggled.connect(self._emit_filter)
+        ui.dateFrom.dateChanged.connect(self._on_date_changed)
+        ui.dateTo.dateChanged.connect(self._on_date_changed)
+        ui.btnClearFilter.clicked.connect(self.clearFilter)
+
     def setModel(self, model):
+        # 이전 selection model 연결 해제 (모델 교체 시 중복 연결 방지)
+        old_sel = self.ui.treeProjects.selectionModel()
+        if old_sel is not None:
+            try:
+                old_sel.selectionChanged.disconnect(self._emit_selection)
+            except TypeError:
+                pass
+
         self.ui.treeProjects.setModel(model)
-        self.ui.treeProjects.expandAll()
-        
-        # '완료' 루트를 접힌 상태로 설정
-        if model.rowCount() >= 2:  # 진행 중, 완료 순서
-            completed_index = model.index(1, 0)  # 두 번째 루트 (완료)
-            if completed_index.isValid():
-                collapsed_flag = model.data(completed_index, Qt.UserRole + 10)
-                if collapsed_flag:
-                    self.ui.treeProjects.setExpanded(completed_index, False)
-        
+        self.expandDefault()
+
         sel = self.ui.treeProjects.selectionModel()
         if sel is not None:
             sel.selectionChanged.connect(self._emit_selection)
 
+    def expandDefault(self, include_collapsed: bool = False):
+        """expandAll() 대신 접힘 플래그가 없는 루트와 그 하위 wrapper 만 펼침
+
+        '완료' 루트는 접힌 상태 유지 → 펼칠 때 fetchMore 로 처음 로드.
+        include_collapsed=True (검색/필터 결과)면 모든 루트를 펼침
+        """
+        view = self.ui.treeProjects
+        model = view.model()
+        for row in range(model.rowCount()):
+            root = model.index(row, 0)
+            if model.data(root, ROLE_COLLAPSED) and not include_collapsed:
+                continue
+            if model.canFetchMore(root):
+                model.fetchMore(root)
+            view.setExpanded(root, True)
+            for r in range(min(model.rowCount(root), self.EXPAND_WRAPPERS_MAX)):
+                child = model.index(r, 0, root)
+                if model.hasChildren(child):
+                    if model.canFetchMore(child):
+                        model.fetchMore(child)
+                    view.setExpanded(child, True)
+
+    def setSearchInfo(self, text: str):
+        self.ui.labelSearchInfo.setText(text)
+        self.ui.labelSearchInfo.setVisible(bool(text))
+
+    # ---------- 조건 필터 ----------
+    def filterCriteria(self) -> FilterCriteria:
+        ui = self.ui
+        owner = ui.comboOwner.currentData()
+        status = ui.comboStatus.currentData()
+        wrapper = ui.comboFilterWrapper.currentData()
+        date_from = date_to = None
+        if ui.checkDate.isChecked():
+            date_from = ui.dateFrom.date().toPyDate().toordinal()
+            date_to = ui.dateTo.date().toPyDate().toordinal()
+        return FilterCriteria(
+            owners=frozenset() if owner is None else frozenset([owner]),
+            statuses=frozenset() if status is None else frozenset([status]),
+            wrapper_ids=frozenset() if wrapper is None else frozenset([wrapper]),
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    def setOwners(self, owners):
+        self._refill(self.ui.comboOwner, [(o, o or "(미지정)") for o in owners])
+
+    def setWrappers(self, wrappers):
+        self._refill(self.ui.comboFilterWrapper, [(NO_WRAPPER, "(없음)")] + list(wrappers))
+
+    def _refill(self, combo, items):
+        """선택 항목 다시 채우기 (현재 선택 유지, 선택 항목이 사라지면 '전체' → filterChanged)"""
+        current = combo.currentData()
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItem("전체", None)
+            for data, text in items:
+                combo.addItem(text, data)
+            index = combo.findData(current) if current is not None else 0
+            combo.setCurrentIndex(max(0, index))
+        finally:
+            combo.blockSignals(False)
+        if current is not None and combo.currentData() != current:
+            self.filterChanged.emit()
+
+    def clearFilter(self):
+        ui = self.ui
+        widgets = (ui.comboOwner, ui.comboStatus, ui.comboFilterWrapper, ui.checkDate)
+        for w in widgets:
+            w.blockSignals(True)
+        try:
+            for combo in widgets[:3]:
+                combo.setCurrentIndex(0)
+            ui.checkDate.setChecked(False)
+        finally:
+            for w in widgets:
+                w.blockSignals(False)
+        ui.dateFrom.setEnabled(False)
+        ui.dateTo.setEnabled(False)
+        self.filterChanged.emit()
+
+    def _on_date_changed(self, *_):
+        if self.ui.checkDate.isChecked():
+            self.filterChanged.emit()
+
+    def _emit_filter(self, *_):
+        self.filterChanged.emit()
+
     def _emit_selection(self, *_):
-        sel = self.ui.treeProjects.selectionModel()
-        idxs = sel.selectedIndexes() if sel else []
-        self.selectionChanged.emit(idxs[0] if idxs else None)
+        self.selectionChanged.emit(self.selectedIndex())
 
     # 선택 인덱스 조회(옵션)
     def selectedIndex(self):
+        """현재 항목이 선택되어 있으면 현재 항목, 아니면 선택 항목 중 첫 번째"""
         sel = self.ui.treeProjects.selectionModel()
-        idxs = sel.selectedIndexes() if sel else []
+        if sel is None:
+            return None
+        current = sel.currentIndex()
+        if current.isValid() and sel.isSelected(current):
+            return current
+        idxs = sel.selectedIndexes()
         return idxs[0] if idxs else None
 
+    def selectedNodes(self):
+        """선택된 모든 노드의 (node_type, node_id) 목록"""
+        sel = self.ui.treeProjects.selectionModel()
+        if sel is None:
+            return []
+        return [(i.data(ROLE_TYPE), i.data(ROLE_ID)) for i in sel.selectedRows()]
+
+    def selectIndex(self, index):
+        """인덱스 선택 + 스크롤 (selectionChanged 신호 차단 여부는 호출자가 결정)"""
+        if index is None or not index.isValid():
+            return
+        self.ui.treeProjects.setCurrentIndex(index)
+        self.ui.treeProjects.scrollTo(index)
+
     # QTreeView 직접 접근(옵션)
     def view(self):
         return self.ui.treeProjects
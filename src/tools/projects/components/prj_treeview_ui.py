@@ -17,10 +17,71 @@ class Ui_ProjectsTreeView(object):
         self.verticalLayout = QtWidgets.QVBoxLayout(ProjectsTreeView)
         self.verticalLayout.setContentsMargins(0, 0, 0, 0)
         self.verticalLayout.setObjectName("verticalLayout")
+        self.searchLayout = QtWidgets.QHBoxLayout()
+        self.searchLayout.setObjectName("searchLayout")
+        self.editSearch = QtWidgets.QLineEdit(ProjectsTreeView)
+        self.editSearch.setClearButtonEnabled(True)
+        self.editSearch.setObjectName("editSearch")
+        self.searchLayout.addWidget(self.editSearch)
+        self.btnFilter = QtWidgets.QToolButton(ProjectsTreeView)
+        self.btnFilter.setCheckable(True)
+        self.btnFilter.setObjectName("btnFilter")
+        self.searchLayout.addWidget(self.btnFilter)
+        self.verticalLayout.addLayout(self.searchLayout)
+        self.frameFilter = QtWidgets.QFrame(ProjectsTreeView)
+        self.frameFilter.setVisible(False)
+        self.frameFilter.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frameFilter.setObjectName("frameFilter")
+        self.filterLayout = QtWidgets.QFormLayout(self.frameFilter)
+        self.filterLayout.setObjectName("filterLayout")
+        self.labelOwner = QtWidgets.QLabel(self.frameFilter)
+        self.labelOwner.setObjectName("labelOwner")
+        self.filterLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.labelOwner)
+        self.comboOwner = QtWidgets.QComboBox(self.frameFilter)
+        self.comboOwner.setObjectName("comboOwner")
+        self.filterLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.comboOwner)
+        self.labelStatus = QtWidgets.QLabel(self.frameFilter)
+        self.labelStatus.setObjectName("labelStatus")
+        self.filterLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.labelStatus)
+        self.comboStatus = QtWidgets.QComboBox(self.frameFilter)
+        self.comboStatus.setObjectName("comboStatus")
+        self.filterLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.comboStatus)
+        self.labelWrapper = QtWidgets.QLabel(self.frameFilter)
+        self.labelWrapper.setObjectName("labelWrapper")
+        self.filterLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.labelWrapper)
+        self.comboFilterWrapper = QtWidgets.QComboBox(self.frameFilter)
+        self.comboFilterWrapper.setObjectName("comboFilterWrapper")
+        self.filterLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.comboFilterWrapper)
+        self.checkDate = QtWidgets.QCheckBox(self.frameFilter)
+        self.checkDate.setObjectName("checkDate")
+        self.filterLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.checkDate)
+        self.dateLayout = QtWidgets.QHBoxLayout()
+        self.dateLayout.setObjectName("dateLayout")
+        self.dateFrom = QtWidgets.QDateEdit(self.frameFilter)
+        self.dateFrom.setEnabled(False)
+        self.dateFrom.setCalendarPopup(True)
+        self.dateFrom.setObjectName("dateFrom")
+        self.dateLayout.addWidget(self.dateFrom)
+        self.dateTo = QtWidgets.QDateEdit(self.frameFilter)
+        self.dateTo.setEnabled(False)
+        self.dateTo.setCalendarPopup(True)
+        self.dateTo.setObjectName("dateTo")
+        self.dateLayout.addWidget(self.dateTo)
+        self.filterLayout.setLayout(3, QtWidgets.QFormLayout.FieldRole, self.dateLayout)
+        self.btnClearFilter = QtWidgets.QPushButton(self.frameFilter)
+        self.btnClearFilter.setObjectName("btnClearFilter")
+        self.filterLayout.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.btnClearFilter)
+        self.verticalLayout.addWidget(self.frameFilter)
+        self.labelSearchInfo = QtWidgets.QLabel(ProjectsTreeView)
+        self.labelSearchInfo.setVisible(False)
+        self.labelSearchInfo.setText("")
+        self.labelSearchInfo.setObjectName("labelSearchInfo")
+        self.verticalLayout.addWidget(self.labelSearchInfo)
         self.treeProjects = QtWidgets.QTreeView(ProjectsTreeView)
         self.treeProjects.setHeaderHidden(True)
         self.treeProjects.setUniformRowHeights(True)
         self.treeProjects.setExpandsOnDoubleClick(True)
+        self.treeProjects.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.treeProjects.setObjectName("treeProjects")
         self.verticalLayout.addWidget(self.treeProjects)
 
@@ -28,4 +89,13 @@ class Ui_ProjectsTreeView(object):
         QtCore.QMetaObject.connectSlotsByName(ProjectsTreeView)
 
     def retranslateUi(self, ProjectsTreeView):
-        pass
+        _translate = QtCore.QCoreApplication.translate
+        self.editSearch.setPlaceholderText(_translate("ProjectsTreeView", "🔍 검색 (이름/담당자/메모/ID)"))
+        self.btnFilter.setText(_translate("ProjectsTreeView", "필터"))
+        self.labelOwner.setText(_translate("ProjectsTreeView", "담당자"))
+        self.labelStatus.setText(_translate("ProjectsTreeView", "상태"))
+        self.labelWrapper.setText(_translate("ProjectsTreeView", "Wrapper"))
+        self.checkDate.setText(_translate("ProjectsTreeView", "기간"))
+        self.dateFrom.setDisplayFormat(_translate("ProjectsTreeView", "yyyy-MM-dd"))
+        self.dateTo.setDisplayFormat(_translate("ProjectsTreeView", "yyyy-MM-dd"))
+        self.btnClearFilter.setText(_translate("ProjectsTreeView", "필터 초기화"))
@@ -0,0 +1,125 @@
+"""
+Projects 실행 취소/다시 실행
+
+- ProjectRepository 변경 통지(Change 목록)를 그대로 명령 하나로 보관 → 모델 전체 복사 없음
+  (update 는 바뀐 필드의 이전/이후 값만, add/delete 는 해당 레코드 1건만 보관)
+- 실행 취소/다시 실행은 repository.apply_changes() 로 적용 → 트리/검색/검증/저장은
+  일반 변경과 같은 경로로 증분 반영
+- 여러 변경을 하나의 명령으로 묶으려면 command(text) 블록 사용 (repository.batch() 포함)
+  변경 통지가 여러 번에 나뉘는 작업(묶음 단위 가져오기)은 beginMacro/endMacro 로 묶음
+- 외부 변경 병합(source="external")은 기록하지 않음. 병합된 레코드를 다루는 명령이 스택에 있으면
+  되돌릴 기준이 달라지므로 스택을 비움
+"""
+
+from contextlib import contextmanager
+from typing import List, Optional
+
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QUndoCommand, QUndoStack
+
+from .prj_repository import Change, ProjectRepository
+
+UNDO_LIMIT = 200   # 보관할 최대 명령 수 (오래된 명령부터 버림)
+
+_KIND_LABELS = {"wrapper": "Wrapper", "project": "Project"}
+_OP_LABELS = {"add": "추가", "update": "수정", "delete": "삭제"}
+
+
+def describe(changes: List[Change]) -> str:
+    """명령 이름이 지정되지 않은 변경의 기본 이름 (예: 'Project 수정', '변경 3건')"""
+    if len(changes) == 1:
+        c = changes[0]
+        return f"{_KIND_LABELS.get(c.kind, c.kind)} {_OP_LABELS.get(c.op, c.op)}"
+    return f"변경 {len(changes)}건"
+
+
+class ChangeCommand(QUndoCommand):
+    def __init__(self, stack: "ProjectsUndoStack", text: str, changes: List[Change]):
+        super().__init__(text)
+        self._stack = stack
+        self._changes = changes
+        self._done = True   # push 시점에는 이미 repository 에 적용된 상태
+        self.keys = {(c.kind, c.record_id) for c in changes}
+
+    def undo(self):
+        self._stack._replay(self._changes, reverse=True)
+        self._done = False
+
+    def redo(self):
+        if self._done:
+            return  # QUndoStack.push() 가 호출하는 최초 redo 는 건너뜀
+        self._stack._replay(self._changes, reverse=False)
+        self._done = True
+
+
+def _command_keys(command: QUndoCommand) -> set:
+    """명령이 다루는 레코드 키 (beginMacro 로 묶인 명령은 하위 명령 전체)"""
+    keys = set(getattr(command, "keys", ()))
+    for i in range(command.childCount()):
+        keys |= _command_keys(command.child(i))
+    return keys
+
+
+class ProjectsUndoStack(QUndoStack):
+    """repository 변경을 자동으로 기록하는 실행 취소 스택
+
+    replayed 신호: 실행 취소/다시 실행으로 repository 가 바뀐 뒤 (저장/화면 갱신용)
+    """
+    replayed = pyqtSignal()
+
+    def __init__(self, repo: ProjectRepository, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.setUndoLimit(UNDO_LIMIT)
+        self._replaying = False
+        self._text: Optional[str] = None
+        self._macro_depth = 0
+        self._clear_after_macro = False
+        repo.subscribe(self._on_changes)
+
+    @contextmanager
+    def command(self, text: str):
+        """블록 안의 변경을 text 이름의 명령 하나로 기록"""
+        outer, self._text = self._text, self._text or text
+        try:
+            with self.repo.batch():
+                yield
+        finally:
+            self._text = outer
+
+    def _on_changes(self, changes: List[Change]):
+        if self._replaying:
+            return
+        if changes[0].source != "local":
+            self._on_external(changes)
+            return
+        self.push(ChangeCommand(self, self._text or describe(changes), list(changes)))
+
+    def _on_external(self, changes: List[Change]):
+        keys = {(c.kind, c.record_id) for c in changes}
+        # command() 는 이 클래스에서 블록용으로 재정의했으므로 QUndoStack.command 로 조회
+        if any(not keys.isdisjoint(_command_keys(QUndoStack.command(self, i))) for i in range(self.count())):
+            if self._macro_depth:
+                self._clear_after_macro = True   # 매크로 도중에는 비울 수 없음
+            else:
+                self.clear()
+
+    def beginMacro(self, text: str):
+        self._macro_depth += 1
+        super().beginMacro(text)
+
+    def endMacro(self):
+        super().endMacro()
+        self._macro_depth -= 1
+        if not self._macro_depth and self._clear_after_macro:
+            self._clear_after_macro = False
+            self.clear()
+
+    def _replay(self, changes: List[Change], reverse: bool):
+        self._replaying = True
+        try:
+            with self.repo.batch():
+                self.repo.apply_changes(changes, reverse=reverse)
+        finally:
+            self._replaying = False
+        self.replayed.emit()
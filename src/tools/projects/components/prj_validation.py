@@ -0,0 +1,178 @@
+"""
+ProjectsValidator: projects 데이터 백그라운드 검증
+
+- 스키마(projects.schema.json)는 load_schema() 로 한 번만 컴파일
+- 전체 검증(validate_all)은 전용 QThread 에서 수행 → GUI 스레드는 레코드 목록 복사만 함
+- 전체 검증 이후의 변경은 GUI 스레드에서 변경된 레코드만 즉시 재검증 (on_changes)
+- 결과는 finished(list[Violation]) 신호와 issues_for(kind, id) 로 제공
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QThread, QCoreApplication, pyqtSignal, pyqtSlot
+
+from .prj_rules import check_dates, check_wrapper_ref, validate_records
+from .prj_schema import CompiledSchema, Violation, load_schema
+
+Key = Tuple[str, str]  # (kind, record_id)
+
+
+# ---------- 작업 스레드 ----------
+class _ValidateWorker(QObject):
+    done = pyqtSignal(int, object)   # (세대 번호, list[Violation])
+    failed = pyqtSignal(str)
+
+    def __init__(self, schema_path: Path):
+        super().__init__()
+        self.schema_path = schema_path
+
+    @pyqtSlot(int, object, object)
+    def run(self, generation, wrappers, projects):
+        try:
+            schema = load_schema(self.schema_path)
+            violations = validate_records(schema, wrappers, projects)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(generation, violations)
+
+
+class ProjectsValidator(QObject):
+    finished = pyqtSignal(object)   # list[Violation] (현재 전체 위반 목록)
+    failed = pyqtSignal(str)
+
+    _runRequested = pyqtSignal(int, object, object)
+
+    def __init__(self, schema_path: Path, repo, parent=None):
+        super().__init__(parent)
+        self.schema_path = Path(schema_path)
+        self.repo = repo
+        self._generation = 0
+        self._running = False
+        self._dirty = set()   # 전체 검증 진행 중 GUI 스레드에서 다시 검증한 레코드
+        # (kind, id) → 위반 목록. 문서 전체 위반은 ("", "") 키
+        self._issues: Dict[Key, List[Violation]] = {}
+
+        self._thread = QThread()
+        self._thread.setObjectName("ProjectsValidateThread")
+        self._worker = _ValidateWorker(self.schema_path)
+        self._worker.moveToThread(self._thread)
+        self._runRequested.connect(self._worker.run)
+        self._worker.done.connect(self._on_done)
+        self._worker.failed.connect(self._on_failed)
+        self._thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    # ---------- 전체 검증 ----------
+    def validate_all(self):
+        """현재 데이터 전체 검증 요청 (로드/가져오기 직후). 이전 요청 결과는 무시됨"""
+        self._generation += 1
+        self._running = True
+        self._dirty.clear()
+        # 목록만 복사 (레코드 → dict 변환과 검사는 작업 스레드). 중복 ID 검출을 위해 원본 목록 사용
+        dm = self.repo.data_model
+        self._runRequested.emit(self._generation, list(dm.wrappers), list(dm.projects))
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _on_done(self, generation, violations):
+        if generation != self._generation:
+            return
+        self._running = False
+        issues: Dict[Key, List[Violation]] = {}
+        for v in violations:
+            key = (v.kind or "", v.record_id or "")
+            if key in self._dirty:
+                continue  # 검증 도중 바뀐 레코드는 GUI 스레드 결과 유지
+            issues.setdefault(key, []).append(v)
+        for key in self._dirty:
+            if key in self._issues:
+                issues[key] = self._issues[key]
+        self._dirty.clear()
+        self._issues = issues
+        self.finished.emit(self.violations())
+
+    def _on_failed(self, message: str):
+        self._running = False
+        self.failed.emit(message)
+
+    # ---------- 증분 검증 ----------
+    def _schema(self) -> Optional[CompiledSchema]:
+        try:
+            return load_schema(self.schema_path)
+        except (OSError, ValueError):
+            return None  # 스키마 오류는 전체 검증(failed 신호)에서 보고
+
+    def on_changes(self, changes):
+        """repository 변경 통지 → 바뀐 레코드만 재검증"""
+        schema = self._schema()
+        if schema is None:
+            return
+        touched = False
+        for c in changes:
+            key = (c.kind, c.record_id)
+            if self._running:
+                self._dirty.add(key)
+            touched |= self._issues.pop(key, None) is not None
+            if c.op == "delete":
+                if c.kind == "wrapper":
+                    touched |= self._recheck_children(schema, c.record_id)
+                continue
+            found = self._check_one(schema, c.kind, c.record_id)
+            if found:
+                self._issues[key] = found
+                touched = True
+            if c.kind == "wrapper" and c.op == "add":
+                touched |= self._recheck_children(schema, c.record_id)
+        if touched and not self._running:
+            self.finished.emit(self.violations())
+
+    def _check_one(self, schema: CompiledSchema, kind: str, record_id: str) -> List[Violation]:
+        out: List[Violation] = []
+        if kind == "wrapper":
+            w = self.repo.get_wrapper(record_id)
+            if w is not None:
+                out.extend(schema.validate_record("wrapper", w.to_dict(), f"wrapper {record_id}"))
+        else:
+            p = self.repo.get_project(record_id)
+            if p is not None:
+                path = f"project {record_id}"
+                out.extend(schema.validate_record("project", p.to_dict(), path))
+                check_dates(p, path, out)
+                check_wrapper_ref(p, lambda wid: self.repo.get_wrapper(wid) is not None, path, out)
+        return out
+
+    def _recheck_children(self, schema: CompiledSchema, wrapper_id: str) -> bool:
+        """wrapper 추가/삭제 시 해당 wrapper 를 참조하는 프로젝트의 참조 위반 갱신"""
+        touched = False
+        for p in self.repo.children_of(wrapper_id):
+            key = ("project", p.id)
+            if self._running:
+                self._dirty.add(key)
+            self._issues.pop(key, None)
+            found = self._check_one(schema, "project", p.id)
+            if found:
+                self._issues[key] = found
+            touched = True
+        return touched
+
+    # ---------- 조회 ----------
+    def violations(self) -> List[Violation]:
+        return [v for vs in self._issues.values() for v in vs]
+
+    def issues_for(self, kind: str, record_id: str) -> List[Violation]:
+        return self._issues.get((kind, record_id), [])
+
+    def flagged(self) -> Iterable[Key]:
+        return (k for k in self._issues if k[0])
+
+    def shutdown(self):
+        if not self._thread.isRunning():
+            return
+        self._thread.quit()
+        self._thread.wait()
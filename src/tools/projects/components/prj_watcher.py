@@ -0,0 +1,308 @@
+"""
+Projects 데이터 파일 외부 변경 감시 + 증분 병합
+
+공유 드라이브의 데이터 파일을 다른 사용자가 저장하면:
+  1) QFileSystemWatcher 가 변경 감지 (연속 이벤트는 WATCH_DELAY_MS 동안 모아 1회 처리)
+  2) 작업 스레드에서 디스크 상태를 읽고 레코드별 해시를 직전 읽기와 비교 → 바뀐 레코드만 전달
+     · journal 백엔드: 스냅샷이 그대로면 저널에서 새로 추가된 줄만 읽음
+     · 그 외(스냅샷 교체/json/sqlite): 전체를 읽어 해시 비교
+  3) GUI 스레드에서 바뀐 레코드만 repository 에 병합 (repo.merging() → 트리/검색/검증 증분 갱신)
+
+이 프로그램이 직접 저장한 결과와 다른 사용자의 변경을 구분하기 위해, 로컬에서 편집한 레코드는
+편집 후 상태의 해시를 저장 확인 전까지 보관합니다. 디스크 상태가
+  - 로컬 편집 중 하나와 같으면: 자신의 저장 → 무시
+  - 로컬에서 편집하지 않은 레코드면: 외부 변경 → 병합
+  - 로컬에서도 편집했는데 다르면: 충돌 → conflicted 신호 (accept_external / keep_local 로 해결)
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import (QObject, QThread, QTimer, QFileSystemWatcher, QCoreApplication,
+                          pyqtSignal, pyqtSlot)
+
+from .prj_models import Project, Wrapper
+from .prj_repository import Change, ProjectRepository
+from .prj_storage import JournalStorage
+
+Key = Tuple[str, str]  # (kind, record_id)
+WATCH_DELAY_MS = 500
+
+_RECORD_TYPES = {"wrapper": Wrapper, "project": Project}
+
+
+def _normalize(kind: str, d: Dict) -> Dict:
+    """디스크 dict → 메모리 레코드와 같은 형태 (기본값/날짜 표기 통일)"""
+    return _RECORD_TYPES[kind].from_dict(d).to_dict()
+
+
+def _hash(d: Optional[Dict]) -> Optional[int]:
+    return None if d is None else hash(tuple(sorted(d.items())))
+
+
+def local_hash(repo: ProjectRepository, kind: str, record_id: str) -> Optional[int]:
+    record = repo.get_wrapper(record_id) if kind == "wrapper" else repo.get_project(record_id)
+    return None if record is None else _hash(record.to_dict())
+
+
+# ---------- 디스크 상태 (작업 스레드) ----------
+class DiskState:
+    """마지막으로 읽은 디스크 상태의 레코드별 해시. scan() 은 그 이후 바뀐 레코드만 반환"""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._hashes: Optional[Dict[Key, int]] = None
+        self._stat = None
+        # journal 백엔드 증분 읽기용
+        self._tables = None
+        self._snapshot_stat = None
+        self._journal_id = None
+        self._offset = 0
+
+    def _stat_of(self, path: Path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def scan(self) -> Dict[Key, Optional[Dict]]:
+        """직전 scan 이후 바뀐 레코드 → 정규화된 dict (삭제는 None). 최초 호출은 기준만 기록"""
+        stat = tuple(self._stat_of(p) for p in self.storage.watch_paths())
+        if stat == self._stat:
+            return {}
+        self._stat = stat
+        if isinstance(self.storage, JournalStorage):
+            touched = self._scan_journal_tail()
+            if touched is not None:
+                return self._diff_keys(touched)
+            current = self._load_journal()
+        else:
+            dm = self.storage.load()
+            current = {("wrapper", w.id): w.to_dict() for w in dm.wrappers}
+            current.update((("project", p.id), p.to_dict()) for p in dm.projects)
+        return self._diff_all(current)
+
+    def _diff_all(self, current: Dict[Key, Dict]) -> Dict[Key, Optional[Dict]]:
+        hashes = {k: _hash(d) for k, d in current.items()}
+        old, self._hashes = self._hashes, hashes
+        if old is None:
+            return {}
+        changed = {k: current[k] for k, h in hashes.items() if old.get(k) != h}
+        changed.update((k, None) for k in old if k not in hashes)
+        return changed
+
+    def _diff_keys(self, keys) -> Dict[Key, Optional[Dict]]:
+        changed = {}
+        for kind, rid in keys:
+            raw = self._tables[kind].get(rid)
+            d = None if raw is None else _normalize(kind, raw)
+            h = _hash(d)
+            if self._hashes.get((kind, rid)) != h:
+                if h is None:
+                    self._hashes.pop((kind, rid), None)
+                else:
+                    self._hashes[(kind, rid)] = h
+                changed[(kind, rid)] = d
+        return changed
+
+    # journal: 스냅샷이 그대로이고 저널이 이어서 늘어난 경우 새 줄만 읽음
+    def _load_journal(self) -> Dict[Key, Dict]:
+        s = self.storage
+        self._snapshot_stat = self._stat_of(s.path)
+        self._journal_id, self._offset = self._journal_position()
+        # 위치를 먼저 기록 → 읽는 도중 추가된 줄은 다음 증분 읽기에서 다시 적용 (재적용해도 결과 동일)
+        self._tables = s.load_tables()
+        return {(kind, rid): _normalize(kind, d)
+                for kind, table in self._tables.items() for rid, d in table.items()}
+
+    def _journal_position(self):
+        st = self._stat_of(self.storage.journal_path)
+        return (None, 0) if st is None else (st[2], st[1])
+
+    def _scan_journal_tail(self) -> Optional[set]:
+        s = self.storage
+        if (self._tables is None or self._hashes is None or s.compacting_path.exists()
+                or self._stat_of(s.path) != self._snapshot_stat):
+            return None
+        journal_id, size = self._journal_position()
+        if journal_id is None and self._journal_id is None:
+            return set()
+        if journal_id != self._journal_id or size < self._offset:
+            return None  # 저널 교체(압축) → 전체 다시 읽기
+        with open(s.journal_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+        end = data.rfind(b"\n") + 1   # 기록 중인 마지막 줄은 다음에 읽음
+        self._offset += end
+        touched = set()
+        s.replay_lines(data[:end].decode("utf-8").splitlines(), self._tables, s.journal_path.name, touched)
+        return touched
+
+
+class _ScanWorker(QObject):
+    scanned = pyqtSignal(object)   # Dict[Key, Optional[dict]]
+    failed = pyqtSignal(str)
+
+    def __init__(self, storage):
+        super().__init__()
+        self.disk = DiskState(storage)
+
+    @pyqtSlot()
+    def scan(self):
+        try:
+            changed = self.disk.scan()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        if changed:
+            self.scanned.emit(changed)
+
+
+# ---------- 감시/병합 (GUI 스레드) ----------
+class ProjectsFileWatcher(QObject):
+    """외부 변경 감시 + 병합
+
+    reader: 디스크 읽기 전용 저장소 인스턴스 (저장용 인스턴스와 별도, 작업 스레드에서만 사용)
+    """
+    merged = pyqtSignal(int)          # 병합한 외부 변경 레코드 수
+    conflicted = pyqtSignal(object)   # List[Key]: 로컬과 외부에서 모두 바뀐 레코드
+    failed = pyqtSignal(str)
+
+    _scanRequested = pyqtSignal()
+
+    def __init__(self, reader, repo: ProjectRepository, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self._paths = [Path(p) for p in reader.watch_paths()]
+        # 로컬 편집 레코드 → 편집 후 상태 해시들 (디스크에서 확인되면 제거)
+        self._local: Dict[Key, set] = {}
+        self._conflicts: Dict[Key, Optional[Dict]] = {}
+        repo.subscribe(self._on_changes)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(WATCH_DELAY_MS)
+        self._timer.timeout.connect(self._scanRequested)
+
+        self._fs = QFileSystemWatcher(self)
+        self._fs.fileChanged.connect(self._on_fs_event)
+        self._fs.directoryChanged.connect(self._on_fs_event)
+        self._rewatch()
+
+        self._thread = QThread()
+        self._thread.setObjectName("ProjectsWatchThread")
+        self._worker = _ScanWorker(reader)
+        self._worker.moveToThread(self._thread)
+        self._scanRequested.connect(self._worker.scan)
+        self._worker.scanned.connect(self._on_scanned)
+        self._worker.failed.connect(self.failed)
+        self._thread.start()
+        self._scanRequested.emit()   # 기준 상태 기록
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def _rewatch(self):
+        # 원자적 저장(rename)이나 새로 생긴 저널은 감시 목록에서 빠지므로 매번 다시 등록
+        watched = set(self._fs.files()) | set(self._fs.directories())
+        wanted = {str(p) for p in self._paths if p.exists()}
+        wanted |= {str(p.parent) for p in self._paths if p.parent.exists()}
+        missing = sorted(wanted - watched)
+        if missing:
+            self._fs.addPaths(missing)
+
+    def _on_fs_event(self, _path):
+        self._rewatch()
+        self._timer.start()
+
+    # ---------- 로컬 편집 기록 ----------
+    def _on_changes(self, changes: List[Change]):
+        for c in changes:
+            if c.source != "local":
+                continue
+            key = (c.kind, c.record_id)
+            self._local.setdefault(key, set()).add(local_hash(self.repo, c.kind, c.record_id))
+
+    # ---------- 병합 ----------
+    def _on_scanned(self, changed: Dict[Key, Optional[Dict]]):
+        external = {}
+        for key, d in changed.items():
+            disk = _hash(d)
+            edits = self._local.get(key)
+            if edits is None:
+                external[key] = d
+            elif disk in edits:
+                # 자신의 저장이 디스크에 반영됨. 이후 편집이 없으면 확인 완료
+                if disk == local_hash(self.repo, *key):
+                    del self._local[key]
+            elif disk != local_hash(self.repo, *key):
+                self._conflicts[key] = d
+        if external:
+            self._merge(external)
+            self.merged.emit(len(external))
+        if self._conflicts:
+            self.conflicted.emit(list(self._conflicts))
+
+    def _merge(self, records: Dict[Key, Optional[Dict]]):
+        # wrapper 추가/수정 → project → wrapper 삭제 순서 (참조 대상이 먼저 존재하도록)
+        order = {"wrapper": 0, "project": 1}
+        keys = sorted(records, key=lambda k: 2 if (k[0] == "wrapper" and records[k] is None) else order[k[0]])
+        with self.repo.merging():
+            for kind, rid in keys:
+                self._apply(kind, rid, records[(kind, rid)])
+
+    def _apply(self, kind: str, rid: str, d: Optional[Dict]):
+        repo = self.repo
+        exists = (repo.get_wrapper(rid) if kind == "wrapper" else repo.get_project(rid)) is not None
+        if d is None:
+            if exists:
+                repo.delete_wrapper(rid) if kind == "wrapper" else repo.delete_project(rid)
+        elif not exists:
+            repo.add_wrapper(Wrapper.from_dict(d)) if kind == "wrapper" else repo.add_project(Project.from_dict(d))
+        else:
+            fields = {k: v for k, v in d.items() if k != "id"}
+            repo.update_wrapper(rid, **fields) if kind == "wrapper" else repo.update_project(rid, **fields)
+
+    # ---------- 충돌 해결 ----------
+    def conflict_record(self, key: Key) -> Optional[Dict]:
+        """충돌 레코드의 디스크(외부) 내용 (삭제면 None)"""
+        return self._conflicts.get(key)
+
+    def accept_external(self, keys: List[Key]):
+        """충돌 레코드를 외부 내용으로 덮어씀 (로컬 편집 폐기)"""
+        records = {k: self._conflicts.pop(k) for k in keys if k in self._conflicts}
+        for k in records:
+            self._local.pop(k, None)
+        if records:
+            self._merge(records)
+
+    def keep_local(self, keys: List[Key]) -> List[Change]:
+        """로컬 내용 유지. 다음 저장 때 디스크를 로컬 내용으로 다시 쓰기 위한 Change 목록 반환"""
+        out = []
+        for key in keys:
+            if key not in self._conflicts:
+                continue
+            disk = self._conflicts.pop(key)
+            kind, rid = key
+            record = self.repo.get_wrapper(rid) if kind == "wrapper" else self.repo.get_project(rid)
+            if record is None:
+                if disk is not None:
+                    out.append(Change("delete", kind, rid, before=disk))
+            elif disk is None:
+                out.append(Change("add", kind, rid, after=record.to_dict()))
+            else:
+                current = record.to_dict()
+                diff = {k: v for k, v in current.items() if disk.get(k) != v}
+                out.append(Change("update", kind, rid, {k: disk.get(k) for k in diff}, diff))
+            self._local[key] = {local_hash(self.repo, kind, rid)}
+        return out
+
+    def shutdown(self):
+        if not self._thread.isRunning():
+            return
+        self._timer.stop()
+        self._thread.quit()
+        self._thread.wait()
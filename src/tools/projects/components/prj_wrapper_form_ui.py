@@ -78,27 +78,28 @@ class Ui_WrapperDetailForm(object):
         self.progressBar.setProperty("value", 0)
         self.progressBar.setObjectName("progressBar")
         self.gridLayout.addWidget(self.progressBar, 2, 0, 1, 4)
+        self.lblPeriod = QtWidgets.QLabel(self.groupProjectStatus)
+        self.lblPeriod.setObjectName("lblPeriod")
+        self.gridLayout.addWidget(self.lblPeriod, 3, 0, 1, 1)
+        self.valPeriod = QtWidgets.QLabel(self.groupProjectStatus)
+        self.valPeriod.setObjectName("valPeriod")
+        self.gridLayout.addWidget(self.valPeriod, 3, 1, 1, 3)
+        self.lblOwners = QtWidgets.QLabel(self.groupProjectStatus)
+        self.lblOwners.setObjectName("lblOwners")
+        self.gridLayout.addWidget(self.lblOwners, 4, 0, 1, 1)
+        self.valOwners = QtWidgets.QLabel(self.groupProjectStatus)
+        self.valOwners.setWordWrap(True)
+        self.valOwners.setObjectName("valOwners")
+        self.gridLayout.addWidget(self.valOwners, 4, 1, 1, 3)
         self.verticalLayout.addWidget(self.groupProjectStatus)
         self.groupProjectList = QtWidgets.QGroupBox(WrapperDetailForm)
         self.groupProjectList.setObjectName("groupProjectList")
         self.projectListLayout = QtWidgets.QVBoxLayout(self.groupProjectList)
         self.projectListLayout.setObjectName("projectListLayout")
-        self.tableProjects = QtWidgets.QTableWidget(self.groupProjectList)
+        self.tableProjects = QtWidgets.QTableView(self.groupProjectList)
         self.tableProjects.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.tableProjects.setAlternatingRowColors(True)
         self.tableProjects.setObjectName("tableProjects")
-        self.tableProjects.setColumnCount(5)
-        self.tableProjects.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableProjects.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableProjects.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableProjects.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableProjects.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableProjects.setHorizontalHeaderItem(4, item)
         self.projectListLayout.addWidget(self.tableProjects)
         self.verticalLayout.addWidget(self.groupProjectList)
         self.buttonLayout = QtWidgets.QHBoxLayout()
@@ -138,17 +139,11 @@ class Ui_WrapperDetailForm(object):
         self.valCompleted.setText(_translate("WrapperDetailForm", "0개"))
         self.lblProgress.setText(_translate("WrapperDetailForm", "진행률:"))
         self.valProgress.setText(_translate("WrapperDetailForm", "0%"))
+        self.lblPeriod.setText(_translate("WrapperDetailForm", "기간:"))
+        self.valPeriod.setText(_translate("WrapperDetailForm", "-"))
+        self.lblOwners.setText(_translate("WrapperDetailForm", "담당자:"))
+        self.valOwners.setText(_translate("WrapperDetailForm", "-"))
         self.groupProjectList.setTitle(_translate("WrapperDetailForm", "하위 프로젝트"))
-        item = self.tableProjects.horizontalHeaderItem(0)
-        item.setText(_translate("WrapperDetailForm", "프로젝트명"))
-        item = self.tableProjects.horizontalHeaderItem(1)
-        item.setText(_translate("WrapperDetailForm", "담당자"))
-        item = self.tableProjects.horizontalHeaderItem(2)
-        item.setText(_translate("WrapperDetailForm", "상태"))
-        item = self.tableProjects.horizontalHeaderItem(3)
-        item.setText(_translate("WrapperDetailForm", "시작일"))
-        item = self.tableProjects.horizontalHeaderItem(4)
-        item.setText(_translate("WrapperDetailForm", "종료일"))
         self.btnSave.setText(_translate("WrapperDetailForm", "저장"))
         self.btnReset.setText(_translate("WrapperDetailForm", "되돌리기"))
         self.btnComplete.setText(_translate("WrapperDetailForm", "완료 처리"))
@@ -0,0 +1,254 @@
+"""
+Projects 엔진 (Qt 비의존)
+
+ProjectsWidget 과 CLI(python -m tools.projects)가 함께 사용하는 데이터 처리 계층.
+  - 로드/저장: open_storage() 백엔드 + 저장 대기 변경(pending) 관리
+  - 조회/집계: ProjectRepository (id/상태/wrapper 인덱스, WrapperStats)
+  - 완료 처리: 프로젝트 완료 → 모든 하위 프로젝트가 완료되는 wrapper 판정, wrapper 완료 조건
+  - 일괄 작업: 이동/담당자 변경/삭제
+  - 검증/리포트/내보내기, 가져오기(JSON 병합, ALM/Excel CSV·XLSX 스트리밍)
+GUI 확인 다이얼로그/실행 취소는 위젯이 담당하고, 엔진 메서드는 결과만 반환합니다.
+"""
+
+import csv
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .components.prj_import import ImportResult, ProjectImporter, read_chunks
+from .components.prj_models import DataModel, Project, Wrapper
+from .components.prj_repository import Change, ProjectRepository
+from .components.prj_rules import validate_records
+from .components.prj_schema import Violation, load_schema
+from .components.prj_storage import open_storage
+
+DATA_PATH = Path(os.path.join(os.environ.get("UKSDT_RESOURCE_PATH",""), "data", "projects.sample.json"))
+SCHEMA_PATH = DATA_PATH.with_name("projects.schema.json")
+
+PROJECT_CSV_COLUMNS = ("id", "name", "status", "wrapper_id", "wrapper_name",
+                       "owner", "start_date", "end_date", "notes")
+
+
+class EngineError(ValueError):
+    """엔진 작업 불가 (메시지는 사용자에게 그대로 표시)"""
+
+
+class ProjectsEngine:
+    def __init__(self, storage, data_model: Optional[DataModel] = None):
+        self.storage = storage
+        self.data_model = data_model if data_model is not None else storage.load()
+        self.repo = ProjectRepository(self.data_model)
+        # 아직 저장되지 않은 로컬 변경 (외부 변경 병합분은 이미 디스크에 있으므로 제외)
+        self.pending: List[Change] = []
+        self.repo.subscribe(self._collect_changes)
+
+    @classmethod
+    def open(cls, path: Optional[Path] = None, backend: Optional[str] = None) -> "ProjectsEngine":
+        return cls(open_storage(Path(path) if path else DATA_PATH, backend))
+
+    # ---------- 저장 ----------
+    def _collect_changes(self, changes: List[Change]):
+        self.pending.extend(c for c in changes if c.source == "local")
+
+    def take_pending(self) -> List[Change]:
+        """저장할 변경을 꺼내고 비움 (GUI 는 SaveQueue 로 넘김)"""
+        changes, self.pending = self.pending, []
+        return changes
+
+    def save(self) -> int:
+        """대기 중인 변경을 현재 스레드에서 바로 기록. 기록한 변경 수 반환"""
+        changes = self.take_pending()
+        if changes:
+            self.storage.commit(changes)
+        return len(changes)
+
+    def close(self):
+        self.storage.close()
+
+    # ---------- 조회 ----------
+    def projects_of(self, project_ids: Iterable[str]) -> List[Project]:
+        return [p for p in map(self.repo.get_project, project_ids) if p is not None]
+
+    def wrappers_of(self, wrapper_ids: Iterable[str]) -> List[Wrapper]:
+        return [w for w in map(self.repo.get_wrapper, wrapper_ids) if w is not None]
+
+    # ---------- 완료 처리 ----------
+    def wrappers_completed_by(self, projects: Iterable[Project]) -> List[Wrapper]:
+        """projects 를 완료하면 모든 하위 프로젝트가 완료되는 진행 중 wrapper"""
+        newly_completed: Dict[str, int] = {}
+        for p in projects:
+            if p.wrapper_id and p.status != "completed":
+                newly_completed[p.wrapper_id] = newly_completed.get(p.wrapper_id, 0) + 1
+        wrappers = []
+        for wrapper_id, n in newly_completed.items():
+            wrapper = self.repo.get_wrapper(wrapper_id)
+            stats = self.repo.wrapper_stats(wrapper_id)
+            if wrapper is not None and wrapper.status == "in_progress" and stats.completed + n == stats.total:
+                wrappers.append(wrapper)
+        return wrappers
+
+    def complete_projects(self, project_ids: Iterable[str],
+                          wrapper_ids: Iterable[str] = ()) -> Tuple[List[Project], List[Wrapper]]:
+        """프로젝트(+지정한 wrapper) 완료. 실제로 상태가 바뀐 레코드 반환"""
+        targets = [p for p in self.projects_of(project_ids) if p.status != "completed"]
+        wrappers = [w for w in self.wrappers_of(wrapper_ids) if w.status != "completed"]
+        with self.repo.batch():
+            for p in targets:
+                self.repo.update_project(p.id, status="completed")
+            for w in wrappers:
+                self.repo.update_wrapper(w.id, status="completed")
+        return targets, wrappers
+
+    def wrapper_completion_error(self, wrapper_id: str) -> Optional[str]:
+        """wrapper 를 완료할 수 없는 이유 (완료 가능하면 None)"""
+        wrapper = self.repo.get_wrapper(wrapper_id)
+        if wrapper is None:
+            return "Wrapper를 찾을 수 없음"
+        if wrapper.status == "completed":
+            return "이미 완료된 Wrapper입니다."
+        stats = self.repo.wrapper_stats(wrapper_id)
+        if not stats.total:
+            return "하위 프로젝트가 없는 Wrapper는 완료 처리할 수 없습니다."
+        if stats.completed < stats.total:
+            return (f"모든 하위 프로젝트가 완료되지 않았습니다.\n"
+                    f"완료: {stats.completed}개 / 전체: {stats.total}개")
+        return None
+
+    def complete_wrapper(self, wrapper_id: str) -> Wrapper:
+        error = self.wrapper_completion_error(wrapper_id)
+        if error:
+            raise EngineError(error)
+        return self.repo.update_wrapper(wrapper_id, status="completed")
+
+    # ---------- 일괄 작업 ----------
+    def move_projects(self, project_ids: Iterable[str], wrapper_id: Optional[str]) -> List[Project]:
+        if wrapper_id and self.repo.get_wrapper(wrapper_id) is None:
+            raise EngineError(f"존재하지 않는 Wrapper: {wrapper_id}")
+        targets = [p for p in self.projects_of(project_ids) if p.wrapper_id != wrapper_id]
+        with self.repo.batch():
+            for p in targets:
+                self.repo.update_project(p.id, wrapper_id=wrapper_id)
+        return targets
+
+    def set_owner(self, project_ids: Iterable[str], owner: str) -> List[Project]:
+        targets = [p for p in self.projects_of(project_ids) if p.owner != owner]
+        with self.repo.batch():
+            for p in targets:
+                self.repo.update_project(p.id, owner=owner)
+        return targets
+
+    def blocked_wrappers(self, wrapper_ids: Iterable[str], project_ids: Iterable[str]) -> List[Wrapper]:
+        """함께 삭제되지 않는 하위 프로젝트가 남아 삭제할 수 없는 wrapper"""
+        deleting = set(project_ids)
+        return [w for w in self.wrappers_of(wrapper_ids)
+                if any(pid not in deleting for pid in self.repo.child_ids(w.id))]
+
+    def delete_records(self, wrapper_ids: Iterable[str], project_ids: Iterable[str]):
+        """프로젝트 → wrapper 순서로 삭제 (하위 프로젝트가 남는 wrapper 는 호출 전에 제외)"""
+        projects = self.projects_of(project_ids)
+        wrappers = self.wrappers_of(wrapper_ids)
+        with self.repo.batch():
+            for p in projects:
+                self.repo.delete_project(p.id)
+            for w in wrappers:
+                self.repo.delete_wrapper(w.id)
+        return wrappers, projects
+
+    # ---------- 검증 ----------
+    def validate(self, schema_path: Optional[Path] = None) -> List[Violation]:
+        schema = load_schema(schema_path or self._schema_path())
+        return validate_records(schema, self.data_model.wrappers, self.data_model.projects)
+
+    def _schema_path(self) -> Path:
+        return Path(self.storage.watch_paths()[0]).with_name(SCHEMA_PATH.name)
+
+    # ---------- 리포트 ----------
+    def wrapper_report(self) -> List[Dict[str, Any]]:
+        """wrapper 별 진행 현황 (+ wrapper 없는 프로젝트 묶음)"""
+        rows = []
+        for w in self.repo.wrappers():
+            stats = self.repo.wrapper_stats(w.id)
+            rows.append({
+                "id": w.id,
+                "name": w.name,
+                "status": w.status,
+                "total": stats.total,
+                "completed": stats.completed,
+                "progress": stats.progress,
+                "start": date.fromordinal(stats.start_min).isoformat() if stats.start_min else "",
+                "end": date.fromordinal(stats.end_max).isoformat() if stats.end_max else "",
+                "owners": len(stats.owners),
+            })
+        loose = [p for status in ("in_progress", "completed") for p in self.repo.loose_projects(status)]
+        if loose:
+            completed = sum(p.status == "completed" for p in loose)
+            rows.append({
+                "id": "", "name": "(Wrapper 없음)", "status": "", "total": len(loose),
+                "completed": completed, "progress": completed * 100 // len(loose),
+                "start": "", "end": "", "owners": len({p.owner for p in loose}),
+            })
+        return rows
+
+    def overdue_projects(self, today: Optional[date] = None) -> List[Project]:
+        """종료일이 지난 진행 중 프로젝트"""
+        today_ordinal = (today or date.today()).toordinal()
+        return [p for p in self.repo.projects_by_status("in_progress")
+                if p.end_ordinal is not None and p.end_ordinal < today_ordinal]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "wrappers": len(self.data_model.wrappers),
+            "projects": len(self.data_model.projects),
+            "in_progress": len(self.repo.project_ids_by_status("in_progress")),
+            "completed": len(self.repo.project_ids_by_status("completed")),
+        }
+
+    # ---------- 내보내기 ----------
+    def export_json(self, path: Path):
+        Path(path).write_text(json.dumps(self.data_model.to_json(), ensure_ascii=False, indent=2),
+                              encoding="utf-8")
+
+    def export_csv(self, path: Path):
+        """프로젝트 목록 CSV (Excel 에서 한글이 깨지지 않도록 BOM 포함)"""
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(PROJECT_CSV_COLUMNS)
+            for p in self.data_model.projects:
+                wrapper = self.repo.get_wrapper(p.wrapper_id) if p.wrapper_id else None
+                writer.writerow([p.id, p.name, p.status, p.wrapper_id or "", wrapper.name if wrapper else "",
+                                 p.owner, p.start_date, p.end_date, p.notes])
+
+    # ---------- 가져오기 ----------
+    def import_json(self, path: Path) -> Tuple[int, int]:
+        """projects JSON(저장 파일과 같은 형식) 병합: 같은 ID 는 수정, 없는 ID 는 추가. (추가, 수정) 건수 반환"""
+        incoming = DataModel.from_json(json.loads(Path(path).read_text(encoding="utf-8")))
+        added = updated = 0
+        with self.repo.batch():
+            for records, get, add, update in (
+                (incoming.wrappers, self.repo.get_wrapper, self.repo.add_wrapper, self.repo.update_wrapper),
+                (incoming.projects, self.repo.get_project, self.repo.add_project, self.repo.update_project),
+            ):
+                for r in records:
+                    current = get(r.id)
+                    if current is None:
+                        add(r)
+                        added += 1
+                        continue
+                    before = current.to_dict()
+                    update(r.id, **{k: v for k, v in r.to_dict().items() if k != "id"})
+                    updated += current.to_dict() != before
+        return added, updated
+
+    def import_file(self, path: Path, update_existing: bool = True, create_wrappers: bool = True,
+                    progress: Optional[Callable[[float], None]] = None, save: bool = True) -> ImportResult:
+        """CSV/XLSX 내보내기 가져오기: IMPORT_CHUNK_ROWS 행씩 적용하고 저장 (파일 전체를 메모리에 올리지 않음)"""
+        importer = ProjectImporter(self.repo, update_existing, create_wrappers)
+        for rows, fraction in read_chunks(path):
+            importer.apply(rows)
+            if save:
+                self.save()
+            if progress is not None:
+                progress(fraction)
+        return importer.result
@@ -1,19 +1,32 @@
-import json
 import os
-import time
-from pathlib import Path
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QInputDialog, QMenu
+from datetime import date
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QMessageBox, QInputDialog, QMenu,
+                             QFileDialog, QProgressDialog)
 from PyQt5 import QtCore
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QKeySequence
 from .projects_ui import Ui_Projects
 
-from .components.prj_models import DataModel, Project, Wrapper
+from .engine import DATA_PATH, SCHEMA_PATH, ProjectsEngine
+from .components.prj_models import Project, Wrapper
+from .components.prj_storage import open_storage
+from .components.prj_savequeue import SaveQueue
+from .components.prj_treemodel import ProjectsTreeModel, TreeFilter
+from .components.prj_filter import match_projects
+from .components.prj_tablemodel import (RecordTableModel, CHILDREN_COLUMNS, WRAPPER_PROJECT_COLUMNS,
+                                        setup_table_view, fit_columns)
+from .components.prj_search import SearchIndexer
+from .components.prj_undo import ProjectsUndoStack
+from .components.prj_import import ProjectImporter
+from .components.prj_importjob import ImportJob
+from .components.prj_watcher import ProjectsFileWatcher
+from .components.prj_validation import ProjectsValidator
+from .components.prj_issues import ProjectsIssuesWidget
+from .components.prj_timeline import ProjectsTimelineWidget
 from .components.prj_treebuilder import *
 from .components.prj_detailview import *
 from .components.prj_treeview import *
 
-DATA_PATH = Path(os.path.join(os.environ.get("UKSDT_RESOURCE_PATH",""), "data", "projects.sample.json"))
-
 class ProjectsWidget(QWidget):
     def __init__(self):
         super().__init__()
@@ -23,16 +36,77 @@ class ProjectsWidget(QWidget):
         # 컴포넌트 탑재
         self.leftPanel = ProjectsTreeViewWidget(self)
         self.rightPanel = ProjectsDetailViewWidget(self)
+        self.issuesPanel = ProjectsIssuesWidget(self)
         self.ui.leftPane.layout().addWidget(self.leftPanel)
+        self.ui.leftPane.layout().addWidget(self.issuesPanel)
         self.ui.rightPane.layout().addWidget(self.rightPanel)
+        self.timelinePanel = ProjectsTimelineWidget(self)
+        self.ui.timelinePane.layout().addWidget(self.timelinePanel)
+
+        # 하위 목록 테이블: repository 레코드 목록을 그대로 보여주는 모델 (보이는 행만 그림)
+        self.childrenModel = RecordTableModel(CHILDREN_COLUMNS, self)
+        self.wrapperProjectsModel = RecordTableModel(WRAPPER_PROJECT_COLUMNS, self)
+        setup_table_view(self.rightPanel.children.tableChildren, self.childrenModel)
+        setup_table_view(self.rightPanel.wrapper.tableProjects, self.wrapperProjectsModel)
 
         # 데이터 로드 및 트리 구성
-        self.data_model = self._load_data()
-        self.model = build_tree_model(self.data_model)
+        # 로드/저장 대기 변경/완료 판정 등 데이터 처리는 Qt 비의존 엔진 (CLI 와 공용), 위젯은 표시/확인만 담당
+        # sqlite 최초 가져오기가 실패하면 사용자에게 알리고 JSON 저널 저장소로 대체 (감시용 저장소도 같은 백엔드)
+        self._storage_backend = None
+        self.engine = ProjectsEngine(open_storage(DATA_PATH, on_migration_error=self._on_storage_migration_failed))
+        self.storage = self.engine.storage
+        self.data_model = self.engine.data_model
+        self.repo = self.engine.repo
+        # 트리는 repository 인덱스를 직접 읽는 지연 로딩 모델 (펼칠 때 하위 노드 생성)
+        self.model = ProjectsTreeModel(self.repo, self)
         self.leftPanel.setModel(self.model)
+        # 검색 색인 (최초 생성은 작업 스레드, 이후 변경분만 반영).
+        # 필터 적용 중 트리 갱신 시 최신 색인으로 다시 검색하므로 트리보다 먼저 구독
+        self.searcher = SearchIndexer(self.repo, self)
+        self.repo.subscribe(self.searcher.on_changes)
+        self.searcher.rebuild()
+        self._search_text = ""
+        # 데이터 변경은 트리에 증분 반영 (전체 재구성 없음)
+        self.repo.subscribe(self._on_repo_changed)
+        # 타임라인: 막대는 처음 한 번 배치, 이후 바뀐 막대만 갱신
+        self.timelinePanel.setRepository(self.repo)
+        self.repo.subscribe(self.timelinePanel.on_changes)
+        self.timelinePanel.recordActivated.connect(self._reveal_record)
+
+        # 실행 취소/다시 실행: 변경분(Change)만 기록, 되돌린 결과도 같은 경로로 트리/저장에 반영
+        self.undo_stack = ProjectsUndoStack(self.repo, self)
+        self.undo_stack.replayed.connect(self._on_undo_replayed)
+        self.undoAction = self.undo_stack.createUndoAction(self, "실행 취소")
+        self.undoAction.setShortcut(QKeySequence.Undo)
+        self.redoAction = self.undo_stack.createRedoAction(self, "다시 실행")
+        self.redoAction.setShortcut(QKeySequence.Redo)
+        for action in (self.undoAction, self.redoAction):
+            action.setShortcutContext(Qt.WidgetWithChildrenShortcut)
+            self.addAction(action)
+
+        # CSV/XLSX 가져오기 진행 중인 작업 (한 번에 하나)
+        self._import_job = None
+
+        # 저장은 작업 스레드에서 비동기로, 짧은 시간 안의 연속 저장은 1회로 합쳐 기록
+        self.save_queue = SaveQueue(self.storage, parent=self)
+        self.save_queue.failed.connect(self._on_save_failed)
+
+        # 다른 사용자가 저장한 데이터 파일 변경 감시 → 바뀐 레코드만 병합 (읽기는 별도 저장소 인스턴스)
+        self.watcher = ProjectsFileWatcher(open_storage(DATA_PATH, self._storage_backend), self.repo, self)
+        self.watcher.conflicted.connect(self._on_external_conflict)
+        self.watcher.merged.connect(self._on_external_merged)
+
+        # 스키마 검증: 전체 검증은 작업 스레드, 이후 변경분은 레코드 단위로 즉시 재검증
+        self.validator = ProjectsValidator(SCHEMA_PATH, self.repo, self)
+        self.validator.finished.connect(self._on_validation_finished)
+        self.validator.failed.connect(self._on_validation_failed)
+        self.repo.subscribe(self.validator.on_changes)
+        self.issuesPanel.recordActivated.connect(self._reveal_record)
 
         # 시그널 연결
         self.leftPanel.selectionChanged.connect(self.on_selection_changed)
+        self.leftPanel.searchChanged.connect(self._on_search_changed)
+        self.leftPanel.filterChanged.connect(self._apply_filter)
         self.rightPanel.saveRequested.connect(self.on_save_clicked)
         self.rightPanel.resetRequested.connect(self.on_reset_clicked)
         self.rightPanel.completeRequested.connect(self.on_complete_clicked)
@@ -48,9 +122,19 @@ class ProjectsWidget(QWidget):
         # 초기
         self.rightPanel.showChildren()
 
-        # wrapper 콤보 초기화
+        # wrapper 콤보/담당자 필터 초기화
         self._refresh_wrapper_combo()
+        self._refresh_owner_filter()
+
+        # 로드 데이터 검증 (결과는 검증 패널/트리에 비동기로 표시)
+        self.validate_data()
     
+    def _on_storage_migration_failed(self, error):
+        self._storage_backend = "journal"
+        QMessageBox.warning(self, "SQLite 저장소 사용 불가",
+                            f"기존 데이터 파일을 SQLite 로 가져오지 못했습니다.\n\n{error}\n\n"
+                            f"이번 실행은 JSON 저널 저장소로 엽니다. 위반 항목은 검증 패널에서 확인할 수 있습니다.")
+
     def setup_context_menu(self):
         """트리뷰 컨텍스트 메뉴 설정"""
         tree_view = self.leftPanel.view()
@@ -63,8 +147,12 @@ class ProjectsWidget(QWidget):
         index = tree_view.indexAt(position)
         
         menu = QMenu(self)
+        selected = self.leftPanel.selectedNodes()
         
-        if index.isValid():
+        if index.isValid() and len(selected) > 1 and (index.data(ROLE_TYPE), index.data(ROLE_ID)) in selected:
+            # 다중 선택: 일괄 작업
+            self._add_batch_actions(menu, selected)
+        elif index.isValid():
             node_type = index.data(ROLE_TYPE)
             node_id = index.data(ROLE_ID)
             
@@ -82,54 +170,137 @@ class ProjectsWidget(QWidget):
                 menu.addAction("Project 삭제", lambda: self.delete_project(node_id))
         
         if menu.actions():
-            menu.exec_(tree_view.mapToGlobal(position))
+            menu.addSeparator()
+        menu.addAction(self.undoAction)
+        menu.addAction(self.redoAction)
+        menu.addSeparator()
+        menu.addAction("프로젝트 가져오기 (CSV/XLSX)...", self.import_projects).setEnabled(self._import_job is None)
+        menu.exec_(tree_view.mapToGlobal(position))
 
     # ---------- IO ----------
-    def _load_data(self) -> DataModel:
-        obj = json.loads(DATA_PATH.read_text(encoding="utf-8"))
-        return DataModel.from_json(obj)
-
     def _save_data(self):
-        DATA_PATH.write_text(
-            json.dumps(self.data_model.to_json(), ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        # 저장 대기열에 넘기고 즉시 반환 (디스크 기록은 SaveQueue 작업 스레드)
+        self.save_queue.enqueue(self.engine.take_pending())
+
+    def _on_save_failed(self, message: str):
+        QMessageBox.critical(self, "저장 실패", f"Projects 데이터를 저장하지 못했습니다.\n\n{message}")
+
+    # ---------- 외부 변경 ----------
+    def _on_external_merged(self, count: int):
+        # 트리/콤보는 _on_repo_changed 에서 반영됨. 우측 패널만 병합 결과로 다시 표시
+        self._refresh_right_panel()
+
+    def _on_external_conflict(self, keys):
+        names = []
+        for kind, rid in keys[:10]:
+            disk = self.watcher.conflict_record((kind, rid))
+            record = self.repo.get_wrapper(rid) if kind == "wrapper" else self.repo.get_project(rid)
+            name = (disk or {}).get("name") or (record.name if record else rid)
+            names.append(f"- {name} ({'삭제됨' if disk is None else '수정됨'})")
+        if len(keys) > 10:
+            names.append(f"... 외 {len(keys) - 10}건")
+        reply = QMessageBox.question(
+            self, "외부 변경 충돌",
+            "다른 사용자가 이 프로그램에서 편집한 항목을 변경했습니다.\n\n"
+            + "\n".join(names)
+            + "\n\n외부 변경을 적용할까요?\n(예: 로컬 편집 폐기 / 아니요: 로컬 편집으로 다시 저장)",
+            QMessageBox.Yes | QMessageBox.No,
         )
+        if reply == QMessageBox.Yes:
+            self.watcher.accept_external(keys)
+            self._refresh_right_panel()
+        else:
+            self.engine.pending.extend(self.watcher.keep_local(keys))
+            self._save_data()
+
+    # ---------- 검증 ----------
+    def validate_data(self):
+        """전체 데이터 검증 시작 (로드 직후/가져오기 후 호출)"""
+        self.issuesPanel.setRunning()
+        self.validator.validate_all()
+
+    def _on_validation_finished(self, violations):
+        self.issuesPanel.setViolations(violations)
+        issues = {}
+        for key in self.validator.flagged():
+            issues[key] = "\n".join(v.message for v in self.validator.issues_for(*key))
+        self.model.set_issues(issues)
+
+    def _on_validation_failed(self, message: str):
+        self.issuesPanel.setViolations([])
+        self.issuesPanel.ui.labelSummary.setText(f"⚠ 데이터 검증 실패: {message}")
+
+    def _reveal_record(self, kind: str, record_id: str):
+        """검증 패널 항목/타임라인 막대 → 트리에서 해당 레코드 선택"""
+        idx = self.model.reveal(kind, record_id)
+        if idx is None:
+            QMessageBox.information(self, "알림", "트리에 표시되지 않는 레코드입니다.")
+            return
+        self.leftPanel.selectIndex(idx)
+
+    # ---------- 검색/필터 ----------
+    def _on_search_changed(self, text: str):
+        self._search_text = text.strip()
+        self._apply_filter()
+
+    def _apply_filter(self):
+        """검색어/조건 필터로 트리 표시 범위 갱신 (모델은 상태 루트만 남기고 다시 지연 로드)
+
+        조건 필터는 repository id 인덱스로 표시할 프로젝트 집합만 계산 → 트리 모델/JSON 재구성 없음
+        """
+        selected = self.leftPanel.selectedIndex()
+        selected_node = (selected.data(ROLE_TYPE), selected.data(ROLE_ID)) if selected is not None else None
+
+        matches = self.searcher.search(self._search_text) if self._search_text else None
+        criteria = self.leftPanel.filterCriteria()
+        scope = None if criteria.is_empty() else match_projects(self.repo, criteria)
+
+        if matches is None and scope is None:
+            tree_filter, info = None, ""
+        else:
+            tree_filter = TreeFilter(self.repo, matches, scope)
+            total = tree_filter.total()
+            label = "검색 결과" if matches is not None else "필터 결과"
+            info = f"{label} {total:,}건" if total else f"{label} 없음"
+
+        self.leftPanel.blockSignals(True)
+        try:
+            self.model.set_filter(tree_filter)
+            self.leftPanel.expandDefault(include_collapsed=tree_filter is not None)
+            if selected_node is not None:
+                self.leftPanel.selectIndex(self.model.reveal(*selected_node))
+        finally:
+            self.leftPanel.blockSignals(False)
+        self.leftPanel.setSearchInfo(info)
 
     # ---------- UI helpers ----------
     def _refresh_wrapper_combo(self):
         d = self.rightPanel.detail
+        current = d.comboWrapper.currentData()
         d.comboWrapper.clear()
         d.comboWrapper.addItem("(없음)", "")
-        for w in self.data_model.wrappers:
+        for w in self.repo.wrappers():
             d.comboWrapper.addItem(w.name, w.id)
+        d.comboWrapper.setCurrentIndex(max(0, d.comboWrapper.findData(current or "")))
+        self.leftPanel.setWrappers([(w.id, w.name) for w in self.repo.wrappers()])
 
-    def _fill_children_table(self, items):
-        t = self.rightPanel.children.tableChildren
-        t.clearContents()
-        t.setRowCount(len(items))
-        t.setColumnCount(3)
-        t.setHorizontalHeaderLabels(["ID", "이름", "상태"])
-        for r, it in enumerate(items):
-            t.setItem(r, 0, self._mk_item(it["id"]))
-            t.setItem(r, 1, self._mk_item(it["name"]))
-            t.setItem(r, 2, self._mk_item(it["status"]))
-        t.resizeColumnsToContents()
+    def _refresh_owner_filter(self):
+        self.leftPanel.setOwners(self.repo.owners())
 
-    @staticmethod
-    def _mk_item(text):
-        from PyQt5.QtWidgets import QTableWidgetItem
-        it = QTableWidgetItem(str(text))
-        it.setFlags(it.flags() ^ QtCore.Qt.ItemIsEditable)
-        return it
+    def _fill_children_table(self, records):
+        self.childrenModel.set_records(records)
+        fit_columns(self.rightPanel.children.tableChildren)
 
     # ---------- selection ----------
     def on_selection_changed(self, idx):
         if idx is None:
             self.rightPanel.showChildren()
             self._fill_children_table([])
+            self.timelinePanel.select(None)
             return
         node_type = idx.data(ROLE_TYPE)
         node_id   = idx.data(ROLE_ID)
+        self.timelinePanel.select(node_type, node_id)
         if node_type == "project":
             self._show_project_detail(node_id)
         elif node_type == "wrapper":
@@ -140,23 +311,17 @@ class ProjectsWidget(QWidget):
             self.rightPanel.showChildren()
 
     def _children_of(self, node_type, node_id):
-        children = []
+        """1레벨 하위 레코드 목록 (repository 인덱스 순서)"""
         if node_type == "status_root":
-            status = node_id
-            # wrappers
-            for w in [w for w in self.data_model.wrappers if w.status == status]:
-                children.append({"id": w.id, "name": w.name, "status": w.status})
-            # loose projects
-            for p in [p for p in self.data_model.projects if p.status == status and not p.wrapper_id]:
-                children.append({"id": p.id, "name": p.name, "status": p.status})
-        elif node_type == "wrapper":
-            for p in [p for p in self.data_model.projects if p.wrapper_id == node_id]:
-                children.append({"id": p.id, "name": p.name, "status": p.status})
-        return children
+            # wrappers + loose projects
+            return self.repo.wrappers_by_status(node_id) + self.repo.loose_projects(node_id)
+        if node_type == "wrapper":
+            return self.repo.children_of(node_id)
+        return []
 
     # ---------- detail ----------
     def _show_project_detail(self, project_id: str):
-        p = next((x for x in self.data_model.projects if x.id == project_id), None)
+        p = self.repo.get_project(project_id)
         if not p:
             QMessageBox.warning(self, "오류", "프로젝트를 찾을 수 없음")
             return
@@ -173,39 +338,43 @@ class ProjectsWidget(QWidget):
         # wrapper
         idx = d.comboWrapper.findData(p.wrapper_id or "")
         d.comboWrapper.setCurrentIndex(max(0, idx))
-        # dates
-        from PyQt5.QtCore import QDate
-        y, m, d0 = map(int, p.start_date.split("-"))
-        d.dateStart.setDate(QDate(y, m, d0))
-        y, m, d0 = map(int, p.end_date.split("-"))
-        d.dateEnd.setDate(QDate(y, m, d0))
+        # dates (형식 오류 날짜는 오늘 날짜로 표시, 위반 내용은 검증 패널에서 확인)
+        d.dateStart.setDate(self._qdate(p.start_ordinal))
+        d.dateEnd.setDate(self._qdate(p.end_ordinal))
 
         d.comboType.setCurrentText(p.type)
         d.editNotes.setPlainText(p.notes or "")
         self.rightPanel.showProjectDetail()
 
+    @staticmethod
+    def _qdate(ordinal):
+        from PyQt5.QtCore import QDate
+        if ordinal is None:
+            return QDate.currentDate()
+        value = date.fromordinal(ordinal)
+        return QDate(value.year, value.month, value.day)
+
     # ---------- save/reset ----------
     def on_save_clicked(self):
         d = self.rightPanel.detail
         pid = d.valId.text()
-        p = next((x for x in self.data_model.projects if x.id == pid), None)
-        if not p:
+        if not self.repo.get_project(pid):
             QMessageBox.warning(self, "오류", "프로젝트를 찾을 수 없음")
             return
-        p.name = d.editName.text()
-        p.owner = d.editOwner.text()
         # 상태는 완료 버튼을 통해서만 변경 가능
         wdata = d.comboWrapper.currentData()
-        p.wrapper_id = wdata if wdata else None
-        p.start_date = d.dateStart.date().toString("yyyy-MM-dd")
-        p.end_date = d.dateEnd.date().toString("yyyy-MM-dd")
-        p.type = d.comboType.currentText()  # type: ignore
-        p.notes = d.editNotes.toPlainText()
+        self.repo.update_project(
+            pid,
+            name=d.editName.text(),
+            owner=d.editOwner.text(),
+            wrapper_id=wdata if wdata else None,
+            start_date=d.dateStart.date().toString("yyyy-MM-dd"),
+            end_date=d.dateEnd.date().toString("yyyy-MM-dd"),
+            type=d.comboType.currentText(),
+            notes=d.editNotes.toPlainText(),
+        )
 
         self._save_data()
-        # 트리 재구성(상태/랩퍼 변경 반영)
-        self.model = build_tree_model(self.data_model)
-        self.leftPanel.setModel(self.model)
         QMessageBox.information(self, "저장", "프로젝트 정보 저장 완료")
 
     def on_reset_clicked(self):
@@ -220,14 +389,9 @@ class ProjectsWidget(QWidget):
         name, ok = QInputDialog.getText(self, title, label)
         return name.strip() if ok and name.strip() else ""
     
-    def generate_unique_id(self, prefix: str) -> str:
-        """고유 ID 생성 (timestamp 기반)"""
-        timestamp = str(int(time.time() * 1000))[-8:]  # 뒤 8자리 사용
-        return f"{prefix}{timestamp}"
-    
     def get_wrapper_status(self, wrapper_id: str) -> str:
         """Wrapper의 상태 조회"""
-        wrapper = next((w for w in self.data_model.wrappers if w.id == wrapper_id), None)
+        wrapper = self.repo.get_wrapper(wrapper_id)
         return wrapper.status if wrapper else "in_progress"
     
     def add_wrapper(self, status: str):
@@ -236,16 +400,13 @@ class ProjectsWidget(QWidget):
         if not name:
             return
         
-        new_id = self.generate_unique_id("w")
+        new_id = self.repo.new_id("wrapper")
         wrapper = Wrapper(id=new_id, name=name, type="wrapper", status=status)
-        self.data_model.wrappers.append(wrapper)
+        self.repo.add_wrapper(wrapper)
         
         # 즉시 저장
         self._save_data()
         
-        # 트리 재구성 및 wrapper combo 업데이트
-        self._rebuild_tree_and_refresh()
-        
         QMessageBox.information(self, "추가 완료", f"Wrapper '{name}'이 추가되었습니다.")
     
     def add_project(self, status: str, wrapper_id: str = None):
@@ -254,7 +415,7 @@ class ProjectsWidget(QWidget):
         if not name:
             return
         
-        new_id = self.generate_unique_id("p")
+        new_id = self.repo.new_id("project")
         project = Project(
             id=new_id,
             name=name,
@@ -266,10 +427,7 @@ class ProjectsWidget(QWidget):
             end_date="2025-12-31",
             notes=""
         )
-        self.data_model.projects.append(project)
-        
-        # 트리 재구성
-        self._rebuild_tree_and_refresh()
+        self.repo.add_project(project)
         
         # 자동으로 detail view로 전환하여 편집 유도
         self._show_project_detail(new_id)
@@ -280,14 +438,14 @@ class ProjectsWidget(QWidget):
     def delete_wrapper(self, wrapper_id: str):
         """Wrapper 삭제 (하위 프로젝트 있으면 삭제 불가)"""
         # 하위 프로젝트 확인
-        child_projects = [p for p in self.data_model.projects if p.wrapper_id == wrapper_id]
+        child_projects = self.repo.children_of(wrapper_id)
         if child_projects:
             project_names = ", ".join([p.name for p in child_projects])
             QMessageBox.warning(self, "삭제 불가", 
                                f"Wrapper에 하위 프로젝트가 있어 삭제할 수 없습니다.\n\n하위 프로젝트: {project_names}")
             return
         
-        wrapper = next((w for w in self.data_model.wrappers if w.id == wrapper_id), None)
+        wrapper = self.repo.get_wrapper(wrapper_id)
         if not wrapper:
             return
         
@@ -297,9 +455,8 @@ class ProjectsWidget(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            self.data_model.wrappers = [w for w in self.data_model.wrappers if w.id != wrapper_id]
+            self.repo.delete_wrapper(wrapper_id)
             self._save_data()
-            self._rebuild_tree_and_refresh()
             
             # 우측 패널을 children view로 전환
             self.rightPanel.showChildren()
@@ -309,7 +466,7 @@ class ProjectsWidget(QWidget):
     
     def delete_project(self, project_id: str):
         """Project 삭제"""
-        project = next((p for p in self.data_model.projects if p.id == project_id), None)
+        project = self.repo.get_project(project_id)
         if not project:
             return
         
@@ -319,9 +476,8 @@ class ProjectsWidget(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            self.data_model.projects = [p for p in self.data_model.projects if p.id != project_id]
+            self.repo.delete_project(project_id)
             self._save_data()
-            self._rebuild_tree_and_refresh()
             
             # 우측 패널을 children view로 전환
             self.rightPanel.showChildren()
@@ -329,18 +485,248 @@ class ProjectsWidget(QWidget):
             
             QMessageBox.information(self, "삭제 완료", f"Project '{project.name}'이 삭제되었습니다.")
     
-    def _rebuild_tree_and_refresh(self):
-        """트리 재구성 및 UI 새로고침"""
-        self.model = build_tree_model(self.data_model)
-        self.leftPanel.setModel(self.model)
-        self._refresh_wrapper_combo()
+    # ---------- 일괄 작업 ----------
+    # 각 작업은 undo_stack.command() (repo.batch()) 한 번으로 적용
+    # → 변경 통지(트리 증분 갱신)와 저장이 각각 1회, 실행 취소도 1단계
+    def _add_batch_actions(self, menu, nodes):
+        project_ids = [nid for node_type, nid in nodes if node_type == "project"]
+        records = [(node_type, nid) for node_type, nid in nodes if node_type in ("wrapper", "project")]
+        if project_ids:
+            n = len(project_ids)
+            menu.addAction(f"프로젝트 {n}개 완료 처리", lambda: self.batch_complete(project_ids))
+            menu.addAction(f"프로젝트 {n}개 Wrapper 이동...", lambda: self.batch_move(project_ids))
+            menu.addAction(f"프로젝트 {n}개 담당자 변경...", lambda: self.batch_set_owner(project_ids))
+        if records:
+            menu.addAction(f"선택 항목 {len(records)}개 삭제", lambda: self.batch_delete(records))
+
+    def batch_complete(self, project_ids):
+        """선택 프로젝트 일괄 완료 (모든 하위 프로젝트가 완료되는 wrapper 도 함께 완료 처리 가능)"""
+        targets = [p for p in self.engine.projects_of(project_ids) if p.status != "completed"]
+        if not targets:
+            QMessageBox.information(self, "알림", "선택한 프로젝트가 모두 이미 완료 상태입니다.")
+            return
+        reply = QMessageBox.question(self, "프로젝트 완료",
+                                     f"선택한 프로젝트 {len(targets)}개를 완료 처리하시겠습니까?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+
+        # 이번 완료로 하위 프로젝트가 모두 완료되는 wrapper
+        wrappers = self.engine.wrappers_completed_by(targets)
+        if wrappers:
+            names = ", ".join(w.name for w in wrappers)
+            reply = QMessageBox.question(self, "Wrapper 완료",
+                                         f"다음 Wrapper의 모든 하위 프로젝트가 완료됩니다.\n\n{names}\n\n"
+                                         f"Wrapper도 완료 처리하시겠습니까?",
+                                         QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                wrappers = []
+
+        with self.undo_stack.command(f"프로젝트 {len(targets)}개 완료"):
+            self.engine.complete_projects([p.id for p in targets], [w.id for w in wrappers])
+        self._save_data()
+        self._refresh_right_panel()
+
+        message = f"프로젝트 {len(targets)}개가 완료 처리되었습니다."
+        if wrappers:
+            message += f"\nWrapper {len(wrappers)}개도 완료 처리되었습니다."
+        QMessageBox.information(self, "완료", message)
+
+    def batch_move(self, project_ids):
+        """선택 프로젝트를 다른 wrapper 로 이동 (또는 wrapper 해제)"""
+        projects = self.engine.projects_of(project_ids)
+        wrappers = self.repo.wrappers()
+        labels = ["(없음)"] + [f"{w.name} ({w.id})" for w in wrappers]
+        label, ok = QInputDialog.getItem(self, "Wrapper 이동",
+                                         f"프로젝트 {len(projects)}개를 이동할 Wrapper:", labels, 0, False)
+        if not ok:
+            return
+        index = labels.index(label)
+        wrapper_id = wrappers[index - 1].id if index > 0 else None
+        targets = [p for p in projects if p.wrapper_id != wrapper_id]
+        if not targets:
+            return
+
+        with self.undo_stack.command(f"프로젝트 {len(targets)}개 이동"):
+            self.engine.move_projects([p.id for p in targets], wrapper_id)
+        self._save_data()
+        self._refresh_right_panel()
+        QMessageBox.information(self, "이동 완료", f"프로젝트 {len(targets)}개를 이동했습니다.")
+
+    def batch_set_owner(self, project_ids):
+        """선택 프로젝트 담당자 일괄 변경"""
+        projects = self.engine.projects_of(project_ids)
+        owners = {p.owner for p in projects}
+        current = owners.pop() if len(owners) == 1 else ""
+        owner, ok = QInputDialog.getText(self, "담당자 변경",
+                                         f"프로젝트 {len(projects)}개의 새 담당자:", text=current)
+        if not ok:
+            return
+        owner = owner.strip()
+        targets = [p for p in projects if p.owner != owner]
+        if not targets:
+            return
+
+        with self.undo_stack.command(f"프로젝트 {len(targets)}개 담당자 변경"):
+            self.engine.set_owner([p.id for p in targets], owner)
+        self._save_data()
+        self._refresh_right_panel()
+        QMessageBox.information(self, "변경 완료", f"프로젝트 {len(targets)}개의 담당자를 변경했습니다.")
+
+    def batch_delete(self, nodes):
+        """선택 wrapper/프로젝트 일괄 삭제 (선택되지 않은 하위 프로젝트가 남는 wrapper 는 제외)"""
+        project_ids = {nid for node_type, nid in nodes if node_type == "project"}
+        wrappers = self.engine.wrappers_of(nid for node_type, nid in nodes if node_type == "wrapper")
+        blocked = self.engine.blocked_wrappers((w.id for w in wrappers), project_ids)
+        if blocked:
+            names = ", ".join(w.name for w in blocked)
+            QMessageBox.warning(self, "삭제 불가",
+                                f"선택되지 않은 하위 프로젝트가 있어 다음 Wrapper는 삭제하지 않습니다.\n\n{names}")
+            wrappers = [w for w in wrappers if w not in blocked]
+        projects = self.engine.projects_of(project_ids)
+        if not projects and not wrappers:
+            return
+
+        reply = QMessageBox.question(self, "일괄 삭제",
+                                     f"Wrapper {len(wrappers)}개, Project {len(projects)}개를 삭제하시겠습니까?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+
+        with self.undo_stack.command(f"{len(wrappers) + len(projects)}개 항목 삭제"):
+            self.engine.delete_records([w.id for w in wrappers], [p.id for p in projects])
+        self._save_data()
+        self.rightPanel.showChildren()
+        self._fill_children_table([])
+        QMessageBox.information(self, "삭제 완료",
+                                f"Wrapper {len(wrappers)}개, Project {len(projects)}개가 삭제되었습니다.")
+
+    # ---------- 가져오기 ----------
+    def import_projects(self):
+        """ALM/Excel 내보내기(CSV/XLSX)에서 프로젝트 일괄 가져오기
+
+        파일 읽기는 작업 스레드, 적용은 IMPORT_CHUNK_ROWS 행씩 (트리 갱신/저장도 묶음 단위).
+        가져오기 전체가 실행 취소 1단계.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "프로젝트 가져오기", "",
+                                              "ALM/Excel 내보내기 (*.csv *.xlsx);;CSV (*.csv);;Excel (*.xlsx)")
+        if not path:
+            return
+        reply = QMessageBox.question(self, "프로젝트 가져오기",
+                                     "이미 있는 ID 의 프로젝트는 파일 내용으로 수정할까요?\n"
+                                     "(아니요: 기존 프로젝트는 건너뜀)",
+                                     QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel)
+        if reply == QMessageBox.Cancel:
+            return
+
+        self._importer = ProjectImporter(self.repo, update_existing=(reply == QMessageBox.Yes))
+        self._import_progress = QProgressDialog("가져오는 중...", "취소", 0, 1000, self)
+        self._import_progress.setWindowTitle("프로젝트 가져오기")
+        self._import_progress.setWindowModality(Qt.WindowModal)
+        self._import_progress.setMinimumDuration(300)
+        self._import_progress.setAutoReset(False)
+        self._import_progress.setValue(0)
+
+        self.undo_stack.beginMacro(f"가져오기: {os.path.basename(path)}")
+        self._import_job = ImportJob(path, self)
+        self._import_job.chunkReady.connect(self._on_import_chunk)
+        self._import_job.failed.connect(self._on_import_failed)
+        self._import_job.finished.connect(self._on_import_finished)
+        self._import_progress.canceled.connect(self._import_job.cancel)
+        self._import_job.start()
+
+    def _on_import_chunk(self, rows, fraction):
+        result = self._importer.apply(rows)
+        self._save_data()
+        self._import_job.chunkDone()
+        self._import_progress.setLabelText(f"가져오는 중... {result.summary()}")
+        self._import_progress.setValue(int(fraction * 1000))
+
+    def _on_import_failed(self, message: str):
+        QMessageBox.warning(self, "가져오기 실패", f"파일을 읽지 못했습니다.\n\n{message}")
+
+    def _on_import_finished(self, completed: bool):
+        self.undo_stack.endMacro()
+        self._import_progress.close()
+        self._import_job.deleteLater()
+        self._import_job = None
+        result = self._importer.result
+        self._refresh_right_panel()
+        # 중복 ID/잘못된 날짜 등은 검증 패널에 표시
+        self.validate_data()
+        if result.added or result.updated or completed:
+            message = result.summary()
+            if not completed:
+                message = "가져오기가 중단되었습니다. 이미 적용된 행은 유지됩니다.\n\n" + message
+            if result.skipped_ids:
+                message += f"\n\n건너뛴 ID: {', '.join(result.skipped_ids)}"
+            QMessageBox.information(self, "가져오기", message)
+
+    def _on_undo_replayed(self):
+        """실행 취소/다시 실행 결과 저장 + 우측 패널 갱신"""
+        self._save_data()
+        self._refresh_right_panel()
+
+    def _refresh_right_panel(self):
+        """일괄 작업 후 우측 패널을 현재 선택 항목 기준으로 다시 표시"""
+        self.on_selection_changed(self.leftPanel.selectedIndex())
+
+    def _on_repo_changed(self, changes):
+        """데이터 변경 통지 → 트리 증분 갱신 (선택/펼침 상태 유지)"""
+        if self.model.tree_filter() is not None:
+            # 검색 중: 변경된 레코드의 일치 여부가 바뀔 수 있으므로 다시 검색
+            self._apply_filter()
+            if any(c.kind == "wrapper" for c in changes):
+                self._refresh_wrapper_combo()
+            if self._owners_changed(changes):
+                self._refresh_owner_filter()
+            return
+
+        view = self.leftPanel.view()
+        selected = self.leftPanel.selectedIndex()
+        selected_node = (selected.data(ROLE_TYPE), selected.data(ROLE_ID)) if selected is not None else None
+
+        # 상태가 바뀌어 이동하는 wrapper 는 펼침 상태를 기억했다가 복원
+        expanded = set()
+        for c in changes:
+            if c.kind == "wrapper":
+                idx = self.model.index_for("wrapper", c.record_id)
+                if idx is not None and view.isExpanded(idx):
+                    expanded.add(c.record_id)
+
+        # 행 이동 중 발생하는 일시적인 선택 해제가 우측 패널을 바꾸지 않도록 차단
+        self.leftPanel.blockSignals(True)
+        try:
+            self.model.apply(changes)
+            for c in changes:
+                if c.kind == "wrapper" and c.op == "add":
+                    # 새 wrapper 는 expandAll 때와 같이 펼친 상태로 표시
+                    expanded.add(c.record_id)
+            for wrapper_id in expanded:
+                idx = self.model.index_for("wrapper", wrapper_id)
+                if idx is not None:
+                    view.setExpanded(idx, True)
+            if selected_node is not None:
+                self.leftPanel.selectIndex(self.model.index_for(*selected_node))
+        finally:
+            self.leftPanel.blockSignals(False)
+
+        if any(c.kind == "wrapper" for c in changes):
+            self._refresh_wrapper_combo()
+        if self._owners_changed(changes):
+            self._refresh_owner_filter()
+
+    @staticmethod
+    def _owners_changed(changes) -> bool:
+        return any(c.kind == "project" and (c.op != "update" or "owner" in (c.after or {}))
+                   for c in changes)
     
     # ---------- 완료 처리 로직 ----------
     def on_complete_clicked(self):
         """프로젝트 완료 처리"""
         d = self.rightPanel.detail
         pid = d.valId.text()
-        project = next((p for p in self.data_model.projects if p.id == pid), None)
+        project = self.repo.get_project(pid)
         
         if not project:
             QMessageBox.warning(self, "오류", "프로젝트를 찾을 수 없음")
@@ -357,7 +743,7 @@ class ProjectsWidget(QWidget):
         
         if reply == QMessageBox.Yes:
             # 프로젝트 상태 변경
-            project.status = "completed"
+            self.repo.update_project(pid, status="completed")
             
             # 데이터 저장
             self._save_data()
@@ -365,9 +751,6 @@ class ProjectsWidget(QWidget):
             # UI 업데이트
             self._show_project_detail(pid)  # 상태 표시 및 버튼 상태 업데이트
             
-            # 트리 재구성
-            self._rebuild_tree_and_refresh()
-            
             QMessageBox.information(self, "완료", f"'{project.name}' 프로젝트가 완료 처리되었습니다.")
             
             # Wrapper 자동 완료 체크
@@ -376,20 +759,12 @@ class ProjectsWidget(QWidget):
     
     def _check_wrapper_completion(self, wrapper_id: str):
         """Wrapper의 모든 하위 프로젝트가 완료되었는지 체크하고 자동 완료 처리"""
-        wrapper = next((w for w in self.data_model.wrappers if w.id == wrapper_id), None)
+        wrapper = self.repo.get_wrapper(wrapper_id)
         if not wrapper or wrapper.status == "completed":
             return
         
-        # 해당 wrapper의 모든 프로젝트 조회
-        wrapper_projects = [p for p in self.data_model.projects if p.wrapper_id == wrapper_id]
-        
-        if not wrapper_projects:
-            return
-        
-        # 모든 프로젝트가 완료 상태인지 확인
-        all_completed = all(p.status == "completed" for p in wrapper_projects)
-        
-        if all_completed:
+        # 하위 프로젝트가 모두 완료 상태인지 확인 (repository 집계, 재조회 없음)
+        if self.engine.wrapper_completion_error(wrapper_id) is None:
             # 사용자에게 Wrapper 완료 처리 여부 확인
             reply = QMessageBox.question(self, "Wrapper 완료", 
                                        f"'{wrapper.name}' Wrapper의 모든 하위 프로젝트가 완료되었습니다.\\n\\n"
@@ -397,16 +772,15 @@ class ProjectsWidget(QWidget):
                                        QMessageBox.Yes | QMessageBox.No)
             
             if reply == QMessageBox.Yes:
-                wrapper.status = "completed"
+                self.engine.complete_wrapper(wrapper_id)
                 self._save_data()
-                self._rebuild_tree_and_refresh()
                 
                 QMessageBox.information(self, "완료", f"'{wrapper.name}' Wrapper가 완료 처리되었습니다.")
     
     # ---------- Wrapper 상세뷰 로직 ----------
     def _show_wrapper_detail(self, wrapper_id: str):
         """Wrapper 상세뷰 표시"""
-        wrapper = next((w for w in self.data_model.wrappers if w.id == wrapper_id), None)
+        wrapper = self.repo.get_wrapper(wrapper_id)
         if not wrapper:
             QMessageBox.warning(self, "오류", "Wrapper를 찾을 수 없음")
             return
@@ -420,12 +794,12 @@ class ProjectsWidget(QWidget):
         w.valStatus.setText(status_text)
         w.valType.setText(wrapper.type)
         
-        # 하위 프로젝트 정보 계산
-        wrapper_projects = [p for p in self.data_model.projects if p.wrapper_id == wrapper_id]
-        total_count = len(wrapper_projects)
-        completed_count = sum(1 for p in wrapper_projects if p.status == "completed")
-        in_progress_count = total_count - completed_count
-        progress_percent = int((completed_count / total_count * 100)) if total_count > 0 else 0
+        # 하위 프로젝트 정보 (repository 집계)
+        stats = self.repo.wrapper_stats(wrapper_id)
+        total_count = stats.total
+        completed_count = stats.completed
+        in_progress_count = stats.in_progress
+        progress_percent = stats.progress
         
         # 현황 정보 업데이트
         w.valTotal.setText(f"{total_count}개")
@@ -433,6 +807,17 @@ class ProjectsWidget(QWidget):
         w.valCompleted.setText(f"{completed_count}개")
         w.valProgress.setText(f"{progress_percent}%")
         w.progressBar.setValue(progress_percent)
+        if stats.start_min is not None and stats.end_max is not None:
+            w.valPeriod.setText(f"{date.fromordinal(stats.start_min).isoformat()} ~ "
+                                f"{date.fromordinal(stats.end_max).isoformat()}")
+        else:
+            w.valPeriod.setText("-")
+        # 담당자는 프로젝트 수가 많은 순으로 최대 10명
+        owners = sorted(stats.owners.items(), key=lambda kv: (-kv[1], kv[0]))
+        owners_text = ", ".join(f"{o or '(미지정)'}({n})" for o, n in owners[:10])
+        if len(owners) > 10:
+            owners_text += f" 외 {len(owners) - 10}명"
+        w.valOwners.setText(owners_text or "-")
         
         # 완료 버튼 상태 설정 (모든 하위 프로젝트가 완료되고 wrapper가 진행 중일 때만 활성화)
         can_complete = (wrapper.status == "in_progress" and 
@@ -441,52 +826,31 @@ class ProjectsWidget(QWidget):
         w.btnComplete.setEnabled(can_complete)
         
         # 하위 프로젝트 목록 테이블 업데이트
-        self._fill_wrapper_projects_table(wrapper_projects)
+        self._fill_wrapper_projects_table(self.repo.children_of(wrapper_id))
         
         # Wrapper 상세뷰 표시
         self.rightPanel.showWrapperDetail()
     
     def _fill_wrapper_projects_table(self, projects):
         """Wrapper 상세뷰의 하위 프로젝트 테이블 채우기"""
-        table = self.rightPanel.wrapper.tableProjects
-        table.clearContents()
-        table.setRowCount(len(projects))
-        
-        for row, project in enumerate(projects):
-            # 프로젝트명 (상태 아이콘 포함)
-            status_icon = "✅" if project.status == "completed" else "🔄"
-            name_text = f"{status_icon} {project.name}"
-            table.setItem(row, 0, self._mk_item(name_text))
-            
-            # 담당자
-            table.setItem(row, 1, self._mk_item(project.owner))
-            
-            # 상태
-            status_text = "완료" if project.status == "completed" else "진행 중"
-            table.setItem(row, 2, self._mk_item(status_text))
-            
-            # 시작일/종료일
-            table.setItem(row, 3, self._mk_item(project.start_date))
-            table.setItem(row, 4, self._mk_item(project.end_date))
-        
-        table.resizeColumnsToContents()
+        self.wrapperProjectsModel.set_records(projects)
+        fit_columns(self.rightPanel.wrapper.tableProjects)
     
     # ---------- Wrapper 버튼 핸들러 ----------
     def on_wrapper_save_clicked(self):
         """Wrapper 정보 저장"""
         w = self.rightPanel.wrapper
         wrapper_id = w.valId.text()
-        wrapper = next((x for x in self.data_model.wrappers if x.id == wrapper_id), None)
+        wrapper = self.repo.get_wrapper(wrapper_id)
         
         if not wrapper:
             QMessageBox.warning(self, "오류", "Wrapper를 찾을 수 없음")
             return
         
         # 이름만 수정 가능
-        wrapper.name = w.editName.text()
+        self.repo.update_wrapper(wrapper_id, name=w.editName.text())
         
         self._save_data()
-        self._rebuild_tree_and_refresh()
         QMessageBox.information(self, "저장", "Wrapper 정보가 저장되었습니다.")
     
     def on_wrapper_reset_clicked(self):
@@ -500,30 +864,18 @@ class ProjectsWidget(QWidget):
         """Wrapper 완료 처리"""
         w = self.rightPanel.wrapper
         wrapper_id = w.valId.text()
-        wrapper = next((x for x in self.data_model.wrappers if x.id == wrapper_id), None)
+        wrapper = self.repo.get_wrapper(wrapper_id)
         
         if not wrapper:
             QMessageBox.warning(self, "오류", "Wrapper를 찾을 수 없음")
             return
         
-        if wrapper.status == "completed":
-            QMessageBox.information(self, "알림", "이미 완료된 Wrapper입니다.")
-            return
-        
-        # 하위 프로젝트 상태 재확인
-        wrapper_projects = [p for p in self.data_model.projects if p.wrapper_id == wrapper_id]
-        if not wrapper_projects:
-            QMessageBox.warning(self, "오류", "하위 프로젝트가 없는 Wrapper는 완료 처리할 수 없습니다.")
-            return
-        
-        completed_count = sum(1 for p in wrapper_projects if p.status == "completed")
-        total_count = len(wrapper_projects)
-        
-        if completed_count < total_count:
-            QMessageBox.warning(self, "완료 불가", 
-                               f"모든 하위 프로젝트가 완료되지 않았습니다.\\n"
-                               f"완료: {completed_count}개 / 전체: {total_count}개")
+        # 완료 조건(하위 프로젝트 존재 + 모두 완료)은 엔진에서 확인
+        error = self.engine.wrapper_completion_error(wrapper_id)
+        if error:
+            QMessageBox.warning(self, "완료 불가", error)
             return
+        total_count = self.repo.wrapper_stats(wrapper_id).total
         
         # 최종 확인
         reply = QMessageBox.question(self, "Wrapper 완료", 
@@ -532,11 +884,10 @@ class ProjectsWidget(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            wrapper.status = "completed"
+            self.engine.complete_wrapper(wrapper_id)
             self._save_data()
             
             # UI 업데이트
             self._show_wrapper_detail(wrapper_id)  # 상태 및 버튼 업데이트
-            self._rebuild_tree_and_refresh()
             
             QMessageBox.information(self, "완료", f"'{wrapper.name}' Wrapper가 완료 처리되었습니다.")
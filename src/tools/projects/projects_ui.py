@@ -38,6 +38,10 @@ class Ui_Projects(object):
         self.rightPane.setObjectName("rightPane")
         self.rightLayout = QtWidgets.QVBoxLayout(self.rightPane)
         self.rightLayout.setObjectName("rightLayout")
+        self.timelinePane = QtWidgets.QFrame(self.splitter)
+        self.timelinePane.setObjectName("timelinePane")
+        self.timelineLayout = QtWidgets.QVBoxLayout(self.timelinePane)
+        self.timelineLayout.setObjectName("timelineLayout")
         self.main_layout.addWidget(self.splitter)
 
         self.retranslateUi(Projects)
@@ -0,0 +1,26 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("UKSDT_RESOURCE_PATH", str(ROOT / "resources"))
+
+
+@pytest.fixture
+def projects_json(tmp_path) -> Path:
+    """resources/data/projects.sample.json 복사본"""
+    path = tmp_path / "projects.json"
+    shutil.copy(ROOT / "resources" / "data" / "projects.sample.json", path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """GUI 작업/QUndoStack 용 QApplication (PyQt5 가 없으면 건너뜀)"""
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,59 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from tools.control_dr_reviewer.components.workbook_cache import INDEX_NAME, WorkbookCache
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "bom.xlsx"
+    pd.DataFrame({"품번": ["A", "B"], "수량": [1, 2]}).to_excel(path, index=False)
+    return path
+
+
+def _used(cache_dir):
+    entries = json.loads((cache_dir / INDEX_NAME).read_text(encoding="utf-8"))["entries"]
+    return [e["used"] for e in entries.values()]
+
+
+def test_hit_returns_frame_without_rewriting_index(tmp_path, workbook):
+    cache = WorkbookCache(tmp_path / "cache")
+    df = pd.read_excel(workbook)
+    cache.put(workbook, 0, df)
+    index = tmp_path / "cache" / INDEX_NAME
+    before = (index.stat().st_mtime_ns, _used(tmp_path / "cache"))
+
+    for _ in range(3):
+        pd.testing.assert_frame_equal(cache.get(workbook, 0), df)
+    assert (index.stat().st_mtime_ns, _used(tmp_path / "cache")) == before
+
+    cache.flush()
+    assert _used(tmp_path / "cache")[0] > before[1][0]
+
+
+def test_changed_file_is_a_miss(tmp_path, workbook):
+    cache = WorkbookCache(tmp_path / "cache")
+    cache.put(workbook, 0, pd.read_excel(workbook))
+    pd.DataFrame({"품번": ["C"]}).to_excel(workbook, index=False)
+    os.utime(workbook, ns=(0, workbook.stat().st_mtime_ns + 1_000_000))
+    assert cache.get(workbook, 0) is None
+    assert cache.total_bytes() == 0
+
+
+def test_lru_eviction_uses_in_memory_hits(tmp_path):
+    cache = WorkbookCache(tmp_path / "cache")
+    paths = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.xlsx"
+        pd.DataFrame({"x": range(100)}).to_excel(path, index=False)
+        cache.put(path, 0, pd.read_excel(path))
+        paths.append(path)
+    cache.get(paths[0], 0)   # a 를 최근 사용으로
+    cache.max_bytes = cache.total_bytes() * 5 // 4   # 하나 더 넣으면 가장 오래된 하나만 삭제
+    path = tmp_path / "c.xlsx"
+    pd.DataFrame({"x": range(100)}).to_excel(path, index=False)
+    cache.put(path, 0, pd.read_excel(path))
+    assert cache.get(paths[0], 0) is not None and cache.get(paths[1], 0) is None
@@ -0,0 +1,63 @@
+import pandas as pd
+
+from tools.control_dr_reviewer.components.consistency import (
+    ISSUE_BLANK_BOM, ISSUE_COLUMNS, ISSUE_DUPLICATE_SW, ISSUE_EXTRA, ISSUE_MISSING, ISSUE_VERSION,
+    check_consistency, find_column, normalize_part, normalize_version,
+)
+
+
+def test_normalizers():
+    parts = normalize_part(pd.Series([" ab－12 ", 12345.0, "", None], dtype=object))
+    assert parts[:2].tolist() == ["AB-12", "12345"] and parts[2:].isna().all()
+    versions = pd.Series(["V01.20", "Ver 1.02", "SW 1.2", "1.0", "1", "v2.00", "0.5", None])
+    assert normalize_version(versions).tolist() == ["1.20", "1.02", "1.2", "1", "1", "2", "0.5", ""]
+
+
+def test_minor_version_width_is_compared():
+    bom = pd.DataFrame({"품번": ["A", "B", "C"], "SW 버전": ["1.02", "V01.20", "1.0"]})
+    sw = pd.DataFrame({"품번": ["A", "B", "C"], "SW 버전": ["1.2", "1.2", "1"]})
+    result = check_consistency(bom, sw)
+    assert sorted(result["issues"].loc[result["issues"]["구분"] == ISSUE_VERSION, "품번"]) == ["A", "B"]
+    assert result["matched_items"] == 1
+
+
+def test_find_column_ignores_case_spaces_and_symbols():
+    df = pd.DataFrame(columns=["No", "Part No.", "S/W Version"])
+    assert find_column(df, ("품번", "partno")) == "Part No."
+    assert find_column(df, ("swversion",)) == "S/W Version"
+    assert find_column(df, ("material",)) is None
+
+
+def test_check_consistency_reports_each_issue_with_excel_rows():
+    bom = pd.DataFrame({"품번": ["A-1", "B-2", "C-3", None, "E-5"],
+                        "SW 버전": ["V1.0", "1.2", "2.0", "9.9", "1"],
+                        "비고": [None, None, None, "값 있음", None]})
+    sw = pd.DataFrame({"Part Number": ["a-1", "B-2", "D-4", "E-5", "E-5"],
+                       "SW Version": ["1", "1.3", "1.0", "1.0", "1.0"]})
+    result = check_consistency(bom, sw)
+
+    issues = result["issues"]
+    assert list(issues.columns) == ISSUE_COLUMNS
+    by_kind = {kind: group for kind, group in issues.groupby("구분")}
+    assert by_kind[ISSUE_MISSING]["품번"].tolist() == ["C-3"]
+    assert by_kind[ISSUE_EXTRA]["품번"].tolist() == ["D-4"]
+    assert by_kind[ISSUE_VERSION]["품번"].tolist() == ["B-2"]
+    assert by_kind[ISSUE_DUPLICATE_SW]["SW인정시험 행"].tolist() == ["5, 6"]
+    assert by_kind[ISSUE_BLANK_BOM]["BOM 행"].tolist() == ["5"]
+    assert (result["bom_sw_match"], result["data_integrity"]) == ("불일치", "확인 필요")
+    assert (result["matched_items"], result["missing_items"], result["extra_items"]) == (2, 1, 1)
+
+
+def test_check_consistency_without_version_column_compares_parts_only():
+    bom = pd.DataFrame({"품번": ["A", "B"], "SW 버전": ["1", "2"]})
+    sw = pd.DataFrame({"품번": ["A", "B"]})
+    result = check_consistency(bom, sw)
+    assert not result["version_checked"]
+    assert result["bom_sw_match"] == "양호" and result["issues"].empty
+
+
+def test_missing_part_column_gives_unavailable_result():
+    result = check_consistency(pd.DataFrame({"이름": ["A"]}), pd.DataFrame({"품번": ["A"]}))
+    assert result["bom_sw_match"] == "확인 불가" and "BOM List" in result["error"]
+    assert list(result["issues"].columns) == ISSUE_COLUMNS and result["issues"].empty
+    assert result["key_columns"]["bom"]["part"] is None
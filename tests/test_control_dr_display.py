@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from tools.control_dr_reviewer.components.consistency import check_consistency
+from tools.control_dr_reviewer.components.rules import evaluate_rules, load_rules
+
+
+@pytest.fixture
+def widget(qapp):
+    from tools.control_dr_reviewer import ControlDRReviewerWidget
+    return ControlDRReviewerWidget()
+
+
+def _reordered(df: pd.DataFrame) -> pd.DataFrame:
+    """열 순서를 뒤집고 새 열을 앞에 추가 (표시가 열 위치에 의존하지 않아야 함)"""
+    df = df[df.columns[::-1]].copy()
+    df.insert(0, "추가 열", "x")
+    return df
+
+
+def test_results_are_read_by_column_name(widget):
+    bom = pd.DataFrame({"품번": ["A", "B"], "SW 버전": ["1.0", "2"]})
+    sw = pd.DataFrame({"품번": ["A", "C"], "SW 버전": ["1.1", "1"]})
+    consistency = check_consistency(bom, sw)
+    rule_check = evaluate_rules(load_rules(), {"bom": bom, "sw_test": sw})
+    consistency["issues"] = _reordered(consistency["issues"])
+    rule_check["rules"] = _reordered(rule_check["rules"])
+    widget.verification_results = {"consistency_check": consistency, "rule_check": rule_check, "summary": {}}
+    widget.display_verification_results()
+
+    text = widget.ui.execution_result.toPlainText()
+    assert "[누락] B / BOM 3행 (버전 2)" in text
+    assert "[버전 불일치] A / BOM 2행 (버전 1) / SW인정시험 2행 (버전 1.1)" in text
+    assert "✅ BOM 품번/SW 버전 열: PASS" in text
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import QEventLoop, QTimer
+
+from tools.control_dr_reviewer.components import verification
+from tools.control_dr_reviewer.components.verification_job import VerificationJob
+from tools.control_dr_reviewer.components.workbook_cache import WorkbookCache
+
+
+def _wait(job):
+    """job 의 종료 신호 이름과 그 시점의 스레드 실행 여부"""
+    outcome = []
+    loop = QEventLoop()
+    for name in ("finished", "cancelled", "failed"):
+        getattr(job, name).connect(lambda *_, name=name: (outcome.append((name, job.isRunning())), loop.quit()))
+    QTimer.singleShot(60_000, loop.quit)
+    job.start()
+    loop.exec_()
+    return outcome
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(verification, "default_cache", lambda: WorkbookCache(tmp_path / "cache"))
+    paths = []
+    for name in ("bom.xlsx", "sw.xlsx"):
+        pd.DataFrame({"품번": ["A"], "SW 버전": ["1"]}).to_excel(tmp_path / name, index=False)
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+def test_finished_is_emitted_after_thread_stops(qapp, paths):
+    job = VerificationJob(*paths)
+    assert _wait(job) == [("finished", False)]
+
+
+def test_cancelled_is_emitted_after_thread_stops(qapp, paths):
+    job = VerificationJob(*paths)
+    job.cancel()
+    assert _wait(job) == [("cancelled", False)]
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from tools.control_dr_reviewer.components import workbook_loader
+from tools.control_dr_reviewer.components.workbook_loader import SheetTask, load_sheets
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_worker_imports_do_not_load_qt():
+    # spawn 작업 프로세스: main.py 를 __mp_main__ 으로 다시 import 한 뒤 _parse_sheet 를 unpickle
+    code = (
+        "import runpy, sys\n"
+        f"sys.path.insert(0, {str(SRC)!r})\n"
+        f"runpy.run_path({str(SRC / 'main.py')!r}, run_name='__mp_main__')\n"
+        "import tools.control_dr_reviewer.components.workbook_loader\n"
+        "print(sorted(m for m in sys.modules if m.startswith('PyQt5')))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_load_sheets_in_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(workbook_loader, "_workers", lambda: 2)
+    monkeypatch.setattr(workbook_loader, "PARALLEL_MIN_BYTES", 0)
+    tasks = []
+    for key, rows in (("bom", 30), ("sw_test", 20)):
+        pd.DataFrame({"품번": [f"P{i}" for i in range(rows)], "수량": range(rows)}).to_excel(tmp_path / f"{key}.xlsx", index=False)
+        tasks.append(SheetTask(key, str(tmp_path / f"{key}.xlsx")))
+    try:
+        frames = load_sheets(tasks)
+    finally:
+        workbook_loader.shutdown_pool()
+    assert {k: len(df) for k, df in frames.items()} == {"bom": 30, "sw_test": 20}
+    assert frames["bom"]["품번"].tolist()[:2] == ["P0", "P1"]
@@ -0,0 +1,82 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from tools.control_dr_reviewer.components.rules import (
+    DEFAULT_CHECKLIST, RULE_COLUMNS, RULES_PATH, RuleError, compile_rules, evaluate_rules, load_checklist, load_rules,
+)
+
+
+def _status(result):
+    return dict(zip(result["rules"]["규칙"], result["rules"]["결과"]))
+
+
+def _rule(**fields):
+    return {"id": "r", "sheet": "bom", **fields}
+
+
+@pytest.mark.parametrize("rule", [
+    _rule(type="unknown"),
+    _rule(type="pattern", column="$part", pattern="("),
+    _rule(type="range", column="Qty", min="x"),
+    _rule(type="columns", columns=["$part"], severity="fatal"),
+    _rule(type="columns", columns=["$part"], sheet="other"),
+    _rule(type="not_blank"),
+])
+def test_compile_rejects_bad_rules(rule):
+    with pytest.raises(RuleError):
+        compile_rules({"rules": [rule]})
+
+
+def test_compile_rejects_duplicate_ids_and_skips_disabled():
+    rule = _rule(type="columns", columns=["$part"])
+    with pytest.raises(RuleError):
+        compile_rules({"rules": [rule, rule]})
+    assert compile_rules({"rules": [{**rule, "enabled": False}]}).rules == []
+
+
+def test_evaluate_each_rule_type():
+    rule_set = compile_rules({"rules": [
+        _rule(id="cols", type="columns", columns=["$part", "$version"]),
+        _rule(id="blank", type="not_blank", column="$version"),
+        _rule(id="range", type="range", column=["Qty", "수량"], min=0, max=10, severity="warning"),
+        {"id": "pattern", "sheet": "sw_test", "type": "pattern", "column": "$version", "pattern": r"\d+(\.\d+)*"},
+        {"id": "values", "sheet": "sw_test", "type": "values", "column": "Result", "values": ["Pass", "Fail"]},
+        {"id": "ref", "sheet": "sw_test", "type": "reference", "column": "$part", "ref_sheet": "bom", "normalize": "part"},
+        _rule(id="missing", type="not_blank", column="Owner"),
+        _rule(id="optional", type="not_blank", column="Owner", optional=True),
+    ]})
+    bom = pd.DataFrame({"품번": ["A-1", "B-2", "C-3"], "SW Ver": ["1.0", None, "2"], "수량": [1, 20, "x"]})
+    sw = pd.DataFrame({"Part No": ["a-1", "Z-9"], "Version": ["1.0", "v2"], "Result": ["pass", "Maybe"]})
+    result = evaluate_rules(rule_set, {"bom": bom, "sw_test": sw})
+
+    assert list(result["rules"].columns) == RULE_COLUMNS
+    assert _status(result) == {"cols": "PASS", "blank": "FAIL", "range": "FAIL", "pattern": "FAIL",
+                               "values": "FAIL", "ref": "FAIL", "missing": "ERROR", "optional": "SKIP"}
+    refs = dict(zip(result["rules"]["규칙"], result["rules"]["위반 행"]))
+    assert (refs["blank"], refs["range"], refs["ref"]) == ("3", "3, 4", "3")
+    assert result["violations"] == 1 + 2 + 1 + 1 + 1
+    assert result["failed_errors"] == 5   # warning 인 range 제외
+    assert result["issues"] == result["violations"] + 1   # ERROR 규칙은 1건
+
+
+def test_shipped_rule_file_compiles():
+    assert RULES_PATH == Path(os.environ["UKSDT_RESOURCE_PATH"], "data", "control_dr_rules.json")
+    rule_set = load_rules()
+    assert rule_set.checklist and {r.id for r in rule_set.rules} >= {"bom_columns", "sw_columns"}
+
+
+def test_load_rules_reloads_changed_file_and_checklist_falls_back(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"checklist": ["A"]}), encoding="utf-8")
+    assert load_rules(path).checklist == ["A"]
+    path.write_text(json.dumps({"checklist": ["B"], "rules": []}), encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert load_rules(path).checklist == ["B"]
+
+    path.write_text("{", encoding="utf-8")
+    assert load_checklist(path) == DEFAULT_CHECKLIST
+    assert load_checklist(tmp_path / "없음.json") == DEFAULT_CHECKLIST
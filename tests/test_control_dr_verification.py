@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from tools.control_dr_reviewer.components import verification
+from tools.control_dr_reviewer.components.workbook_cache import WorkbookCache
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    monkeypatch.setattr(verification, "default_cache", lambda: WorkbookCache(tmp_path / "cache"))
+
+    def run(bom: pd.DataFrame, sw: pd.DataFrame):
+        paths = []
+        for name, df in (("bom.xlsx", bom), ("sw.xlsx", sw)):
+            df.to_excel(tmp_path / name, index=False)
+            paths.append(str(tmp_path / name))
+        stages = []
+        results = verification.run_verification(*paths, progress=lambda i, _msg: stages.append(i))
+        return results, stages
+    return run
+
+
+def test_rules_run_before_consistency(run):
+    results, stages = run(pd.DataFrame({"품번": ["A", "B"], "SW 버전": ["1", "2"]}),
+                          pd.DataFrame({"품번": ["A", "B"], "SW 버전": ["1.0", "V2"]}))
+    names = [verification.STAGES[i][0] for i in stages]
+    assert names.index("rules") < names.index("consistency")
+    assert results["summary"]["overall_status"] == "PASS"
+
+
+def test_missing_part_column_still_reports_rule_results(run):
+    results, _ = run(pd.DataFrame({"이름": ["A"], "SW 버전": ["1"]}),
+                     pd.DataFrame({"품번": ["A"], "SW 버전": ["1"]}))
+    summary = results["summary"]
+    assert summary["overall_status"] == "FAIL" and "error" not in summary
+    assert results["consistency_check"]["bom_sw_match"] == "확인 불가"
+    status = dict(zip(results["rule_check"]["rules"]["규칙"], results["rule_check"]["rules"]["결과"]))
+    assert (status["bom_columns"], status["sw_columns"]) == ("ERROR", "PASS")
@@ -0,0 +1,40 @@
+from tools.projects.components.prj_ids import SEQ_CHARS, TIME_CHARS, IdAllocator
+
+
+class _Clock:
+    def __init__(self, t: float):
+        self.t = t
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_ids_have_fixed_width_and_sort_in_creation_order():
+    clock = _Clock(1_700_000_000.0)
+    alloc = IdAllocator(lambda _id: False, clock)
+    ids = []
+    for step in range(50):
+        ids.append(alloc.new_id("p"))
+        if step % 10 == 0:
+            clock.t += 0.001
+    assert all(len(i) == 1 + TIME_CHARS + SEQ_CHARS for i in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_clock_going_backwards_does_not_reorder_ids():
+    clock = _Clock(1_700_000_000.0)
+    alloc = IdAllocator(lambda _id: False, clock)
+    first = alloc.new_id("p")
+    clock.t -= 60
+    assert alloc.new_id("p") > first
+
+
+def test_taken_ids_are_skipped():
+    taken = set()
+    alloc = IdAllocator(taken.__contains__, _Clock(1_700_000_000.0))
+    for _ in range(100):
+        taken.add(alloc.new_id("w"))
+    block = alloc.block("w", 500)
+    assert len(set(block)) == 500
+    assert taken.isdisjoint(block)
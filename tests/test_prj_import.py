@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from tools.projects.components.prj_import import ImportFormatError, ProjectImporter, map_columns, read_chunks
+from tools.projects.components.prj_models import DataModel
+from tools.projects.components.prj_repository import ProjectRepository
+
+
+@pytest.fixture
+def repo(projects_json):
+    return ProjectRepository(DataModel.from_json(json.loads(projects_json.read_text(encoding="utf-8"))))
+
+
+def _write_csv(path, text, encoding="utf-8-sig"):
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+def test_map_columns_uses_aliases_and_first_match():
+    columns = map_columns(["Key", "Title", "상태", "Assignee", "Planned Start", "Due Date", "Title"])
+    assert columns == {"id": 0, "name": 1, "status": 2, "owner": 3, "start_date": 4, "end_date": 5}
+    with pytest.raises(ImportFormatError):
+        map_columns(["ID", "Owner"])
+
+
+def test_read_chunks_normalizes_rows_and_skips_blank_names(tmp_path):
+    path = _write_csv(tmp_path / "alm.csv",
+                      "Title;State;Start;Due\n"
+                      "A;Done;2025/3/4;2025.04.05\n"
+                      ";Open;;\n"
+                      "B;Open;;\n"
+                      "C;완료;;\n")
+    chunks = list(read_chunks(path, chunk_rows=2))
+    rows = [r for chunk, _ in chunks for r in chunk]
+    assert [r["name"] for r in rows] == ["A", "B", "C"]
+    assert rows[0] == {"name": "A", "status": "completed", "start_date": "2025-03-04", "end_date": "2025-04-05"}
+    assert [r["status"] for r in rows[1:]] == ["in_progress", "completed"]
+    assert chunks[-1][1] == 1.0
+
+
+def test_read_chunks_falls_back_to_cp949(tmp_path):
+    path = _write_csv(tmp_path / "cp949.csv", "프로젝트명,담당자\n냉장고,홍길동\n", encoding="cp949")
+    (rows, _), = read_chunks(path)
+    assert rows == [{"name": "냉장고", "owner": "홍길동"}]
+
+
+def test_importer_adds_updates_and_creates_wrappers(repo):
+    importer = ProjectImporter(repo)
+    notified = []
+    repo.subscribe(notified.append)
+    result = importer.apply([
+        {"id": "p1", "name": "수정됨"},
+        {"id": "", "name": "새 프로젝트", "wrapper": "새 묶음", "owner": "홍길동"},
+        {"id": "w1", "name": "wrapper 와 같은 ID"},
+    ])
+    assert (result.added, result.updated, result.skipped, result.wrappers_added) == (1, 1, 1, 1)
+    assert result.skipped_ids == ["w1"]
+    assert repo.get_project("p1").name == "수정됨"
+    new = [p for p in repo.projects() if p.name == "새 프로젝트"][0]
+    assert repo.get_wrapper(new.wrapper_id).name == "새 묶음"
+    assert len(notified) == 1   # 묶음 1개 = 변경 통지 1회
+
+
+def test_importer_skip_existing(repo):
+    result = ProjectImporter(repo, update_existing=False).apply([{"id": "p1", "name": "X"}])
+    assert (result.updated, result.skipped) == (0, 1)
+    assert repo.get_project("p1").name != "X"
@@ -0,0 +1,154 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from tools.projects.components.prj_repository import Change
+from tools.projects.components.prj_storage import (JournalStorage, JsonFileStorage, SchemaValidationError,
+                                                   SqliteStorage, open_storage)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _names(storage):
+    return {p.id: p.name for p in storage.load().projects}
+
+
+def _update(rid, name):
+    return Change("update", "project", rid, before={}, after={"name": name})
+
+
+def test_journal_replays_on_load(projects_json):
+    s = JournalStorage(projects_json)
+    s.load()
+    s.commit([_update("p1", "EDIT1")])
+    s.close()
+    assert _names(JournalStorage(projects_json))["p1"] == "EDIT1"
+
+
+def test_torn_last_line_is_dropped_before_next_append(projects_json):
+    s = JournalStorage(projects_json)
+    s.load()
+    s.commit([_update("p1", "EDIT1")])
+    s.close()
+    with open(s.journal_path, "ab") as f:
+        f.write(b'{"op":"update","kind":"proj')   # 기록 중 비정상 종료
+
+    s2 = JournalStorage(projects_json)
+    assert _names(s2)["p1"] == "EDIT1"
+    s2.commit([_update("p2", "EDIT2")])
+    s2.close()
+
+    names = _names(JournalStorage(projects_json))
+    assert names["p1"] == "EDIT1"
+    assert names["p2"] == "EDIT2"
+    lines = s.journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["data"]["name"] for line in lines] == ["EDIT1", "EDIT2"]
+
+
+def test_complete_last_line_without_newline_is_kept(projects_json):
+    s = JournalStorage(projects_json)
+    s.load()
+    with open(s.journal_path, "wb") as f:
+        f.write(b'{"op":"update","kind":"project","id":"p1","data":{"name":"EDIT1"}}')
+
+    s2 = JournalStorage(projects_json)
+    s2.load()
+    s2.commit([_update("p2", "EDIT2")])
+    s2.close()
+
+    names = _names(JournalStorage(projects_json))
+    assert (names["p1"], names["p2"]) == ("EDIT1", "EDIT2")
+
+
+def test_compaction_writes_snapshot_and_empties_journal(projects_json):
+    s = JournalStorage(projects_json, compact_every=2)
+    s.load()
+    s.commit([_update("p1", "EDIT1")])
+    assert s.journal_path.exists()
+    # 압축 스냅샷은 호출자 모델이 아니라 디스크의 스냅샷 + 저널로 만듦
+    s.commit([Change("delete", "project", "p2", before={}, after=None)])
+    s.close()
+
+    assert not s.journal_path.exists()
+    assert not s.compacting_path.exists()
+    snapshot = json.loads(projects_json.read_text(encoding="utf-8"))
+    by_id = {p["id"]: p for p in snapshot["projects"]}
+    assert by_id["p1"]["name"] == "EDIT1" and "p2" not in by_id
+    names = _names(JournalStorage(projects_json))
+    assert names["p1"] == "EDIT1" and "p2" not in names
+
+
+def test_json_file_storage_applies_changes_to_file(projects_json):
+    s = JsonFileStorage(projects_json)
+    before = _names(s)
+    s.commit([_update("p1", "EDIT1"), Change("delete", "project", "p2", before={}, after=None)])
+    names = _names(JsonFileStorage(projects_json))
+    assert names["p1"] == "EDIT1" and "p2" not in names
+    assert len(names) == len(before) - 1
+
+
+def test_interrupted_compaction_segment_is_replayed(projects_json):
+    s = JournalStorage(projects_json)
+    s.load()
+    s.commit([_update("p1", "EDIT1")])
+    s.close()
+    s.journal_path.replace(s.compacting_path)   # 스냅샷 기록 전에 종료된 압축
+    s2 = JournalStorage(projects_json)
+    s2.load()
+    s2.commit([_update("p2", "EDIT2")])
+    s2.close()
+
+    names = _names(JournalStorage(projects_json))
+    assert (names["p1"], names["p2"]) == ("EDIT1", "EDIT2")
+
+
+@pytest.fixture
+def invalid_projects_json(projects_json):
+    """스키마 위반(status) 이 있는 JSON + 같은 폴더의 projects.schema.json"""
+    shutil.copy(ROOT / "resources" / "data" / "projects.schema.json", projects_json.parent)
+    data = json.loads(projects_json.read_text(encoding="utf-8"))
+    data["projects"][0]["status"] = "bogus"
+    projects_json.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return projects_json
+
+
+def test_sqlite_migration_of_invalid_file_raises_without_creating_db(invalid_projects_json):
+    storage = SqliteStorage(invalid_projects_json)
+    with pytest.raises(SchemaValidationError):
+        storage.load()
+    assert not storage.db_path.exists()
+
+
+def test_open_storage_falls_back_to_journal_when_migration_fails(invalid_projects_json):
+    errors = []
+    storage = open_storage(invalid_projects_json, "sqlite", on_migration_error=errors.append)
+    assert isinstance(storage, JournalStorage)
+    assert len(errors) == 1 and isinstance(errors[0], SchemaValidationError)
+    assert storage.load().projects[0].status == "bogus"
+
+
+def test_open_storage_migrates_valid_file(projects_json):
+    shutil.copy(ROOT / "resources" / "data" / "projects.schema.json", projects_json.parent)
+    errors = []
+    storage = open_storage(projects_json, "sqlite", on_migration_error=errors.append)
+    assert isinstance(storage, SqliteStorage) and storage.db_path.exists() and not errors
+    assert _names(storage) == _names(JournalStorage(projects_json))
+    storage.close()
+
+
+def test_compaction_keeps_interrupted_segment(projects_json):
+    s = JournalStorage(projects_json, compact_every=2)
+    s.load()
+    s.commit([_update("p1", "EDIT1")])
+    s.close()
+    s.journal_path.replace(s.compacting_path)   # 스냅샷 기록 전에 종료된 압축
+    s2 = JournalStorage(projects_json, compact_every=2)
+    s2.load()
+    s2.commit([_update("p2", "EDIT2")])        # 세그먼트 1건 + 저널 1건 → 압축
+    s2.close()
+
+    assert not s.journal_path.exists() and not s.compacting_path.exists()
+    names = _names(JournalStorage(projects_json))
+    assert (names["p1"], names["p2"]) == ("EDIT1", "EDIT2")
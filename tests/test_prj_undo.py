@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from tools.projects.components.prj_models import DataModel, Project
+from tools.projects.components.prj_repository import ProjectRepository
+from tools.projects.components.prj_undo import ProjectsUndoStack
+
+
+def _records(repo):
+    """id → 필드 (실행 취소로 되살린 레코드는 목록 끝에 붙으므로 순서 무시)"""
+    data = repo.data_model.to_json()
+    return {r["id"]: r for kind in ("wrappers", "projects") for r in data[kind]}
+
+
+@pytest.fixture
+def repo(projects_json, qapp):
+    return ProjectRepository(DataModel.from_json(json.loads(projects_json.read_text(encoding="utf-8"))))
+
+
+def test_update_records_only_changed_fields(repo):
+    stack = ProjectsUndoStack(repo)
+    changes = []
+    repo.subscribe(changes.append)
+    before = repo.get_project("p1").name
+    repo.update_project("p1", name="수정됨", status=repo.get_project("p1").status)
+
+    (change,) = changes[-1]
+    assert (change.before, change.after) == ({"name": before}, {"name": "수정됨"})
+    stack.undo()
+    assert repo.get_project("p1").name == before
+    stack.redo()
+    assert repo.get_project("p1").name == "수정됨"
+
+
+def test_command_block_is_undone_as_one_step(repo):
+    stack = ProjectsUndoStack(repo)
+    snapshot = _records(repo)
+    with stack.command("일괄 작업"):
+        repo.add_project(Project(repo.new_id("project"), "새 프로젝트", "project", "in_progress", None, "", "", ""))
+        repo.update_project("p1", owner="홍길동")
+        repo.delete_project("p2")
+    assert stack.count() == 1 and stack.undoText() == "일괄 작업"
+
+    stack.undo()
+    assert _records(repo) == snapshot
+    stack.redo()
+    assert repo.get_project("p2") is None and repo.get_project("p1").owner == "홍길동"
+
+
+def test_external_change_clears_commands_on_same_record(repo):
+    stack = ProjectsUndoStack(repo)
+    repo.update_project("p1", name="local")
+    with repo.merging():
+        repo.update_project("p1", name="external")
+    assert stack.count() == 0